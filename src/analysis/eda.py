@@ -18,6 +18,7 @@ import seaborn as sns
 from typing import List, Optional, Dict
 import logging
 from src import config
+from src.pipeline.storage import read_dataset
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -56,7 +57,7 @@ def load_data_for_eda() -> pd.DataFrame | None:
     """
     filepath = config.ANALYTICAL_DATA_FINAL_FILE
     try:
-        df = pd.read_csv(filepath)
+        df = read_dataset(filepath)
         logging.info(f"Successfully loaded data from {filepath}")
         return df
     except FileNotFoundError:
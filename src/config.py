@@ -58,6 +58,46 @@ ANALYTICAL_DATA_VALIDATION_ERRORS_FILE = PROCESSED_DATA_DIR / "analytical_data_v
 FAO_LA_MAPPING_SEMANTIC_MATCHES_FILE = PROCESSED_DATA_DIR / "fao_la_mapping_semantic_matches.csv"
 LA_CONTENT_FIREINABOTTLE_PROCESSED_FILE = PROCESSED_DATA_DIR / "la_content_fireinabottle_processed.csv"
 ABS_POPULATION_PROCESSED_FILE = PROCESSED_DATA_DIR / "abs_population_australia_processed.csv"
+NCD_DIABETES_PROCESSED_FILE = PROCESSED_DATA_DIR / "ncdrisc_diabetes_australia_processed.csv"
+NCD_CHOLESTEROL_PROCESSED_FILE = PROCESSED_DATA_DIR / "ncdrisc_cholesterol_australia_processed.csv"
+NCD_BMI_PROCESSED_FILE = PROCESSED_DATA_DIR / "ncdrisc_bmi_australia_processed.csv"
+ABS_COD_PROCESSED_FILE = PROCESSED_DATA_DIR / "abs_cod_metrics.csv"
+GBD_DEMENTIA_PROCESSED_FILE = PROCESSED_DATA_DIR / "gbd_dementia_metrics.csv"
+GBD_CVD_PROCESSED_FILE = PROCESSED_DATA_DIR / "gbd_cvd_metrics.csv"
+GBD_LONG_PROCESSED_FILE = PROCESSED_DATA_DIR / "gbd_metrics_long.csv"
+
+# Storage format for processed datasets: "parquet", "arrow" (Arrow IPC) or "csv".
+# Paths above name each dataset; the storage layer swaps the .csv suffix for the
+# chosen format. Falls back to CSV when pyarrow is not installed.
+PROCESSED_DATA_FORMAT = "parquet"
+# Also write a CSV copy of every processed dataset (for spreadsheets and notebooks)
+PROCESSED_CSV_EXPORT = True
+
+# Machine-readable timing, memory and row-count report written after each ETL run
+ETL_RUN_REPORT_FILE = PROCESSED_DATA_DIR / "reports" / "etl_run_report.json"
+
+# Fingerprints of each ETL stage, used to skip unchanged stages on re-runs
+BUILD_MANIFEST_FILE = PROCESSED_DATA_DIR / "build_manifest.json"
+
+# Detected AIHW sheet layouts, keyed by sheet fingerprint; unchanged sheets skip layout detection
+AIHW_LAYOUT_CACHE_DIR = PROCESSED_DATA_DIR / "cache" / "aihw_layouts"
+
+# Parsed ABS workbook columns, keyed by workbook hash so unchanged workbooks are not re-parsed
+EXCEL_CACHE_DIR = PROCESSED_DATA_DIR / "cache" / "excel"
+
+# === IHME GBD ===
+# Locations kept in the long-format GBD table; add comparison countries here.
+# The dementia and CVD metrics files are always for Australia.
+GBD_LOCATIONS = ["Australia"]
+
+# === Downloads ===
+# Files fetched at the same time; total download time approaches that of the largest file
+DOWNLOAD_MAX_WORKERS = 4
+# Seconds to wait for a server to respond (connect or read) before retrying
+DOWNLOAD_TIMEOUT_SECONDS = 60
+DOWNLOAD_MAX_RETRIES = 3
+# ETag/Last-Modified validators, sizes and checksums of downloaded files, kept beside them
+DOWNLOAD_MANIFEST_FILENAME = "download_manifest.json"
 
 # === Model Names ===
 SENTENCE_TRANSFORMER_MODEL = "all-MiniLM-L6-v2"
@@ -1,7 +1,10 @@
+import os
 import pandas as pd
 import numpy as np
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from src import config
+from src.pipeline.storage import read_dataset, write_dataset
 
 # Set up logging
 logging.basicConfig(
@@ -9,13 +12,19 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
-def load_data():
-    """Load and prepare the required datasets."""
+def load_data(fao_df=None, la_mapping=None, fao_file=None):
+    """Load and prepare the required datasets.
+
+    Frames already in memory (passed from an upstream ETL stage) are used as
+    they are; only the missing ones are read from disk.
+    """
     # Load FAOSTAT data
-    fao_df = pd.read_csv(config.FAOSTAT_PROCESSED_FILE)
+    if fao_df is None:
+        fao_df = read_dataset(fao_file or config.FAOSTAT_PROCESSED_FILE)
     
     # Load LA content mapping
-    la_mapping = pd.read_csv(config.FAOSTAT_LA_MAPPING_FILE)
+    if la_mapping is None:
+        la_mapping = read_dataset(config.FAOSTAT_LA_MAPPING_FILE)
     
     # Log data shapes
     logging.info(f"Loaded FAOSTAT data: {fao_df.shape} rows")
@@ -373,10 +382,22 @@ def handle_methodology_change(df):
     # Combine pre and post periods
     return pd.concat([pre_2010, post_2010]).sort_values('year'), adjustment_factors
 
-def calculate_dietary_metrics():
-    """Main function to calculate all dietary metrics."""
+def calculate_dietary_metrics(fao_df=None, la_mapping=None, fao_file=None, output_file=None, metadata_file=None):
+    """Main function to calculate all dietary metrics.
+
+    Args:
+        fao_df: Processed FAOSTAT data, if already in memory.
+        la_mapping: Validated FAO to LA content mapping, if already in memory.
+        fao_file: Processed FAOSTAT dataset to read when ``fao_df`` is not given
+            (defaults to the Australian file).
+        output_file: Where to save the metrics (defaults to config.DIETARY_METRICS_FILE).
+        metadata_file: Where to save the metadata (defaults to config.DIETARY_METRICS_METADATA_FILE).
+    """
+    output_file = output_file or config.DIETARY_METRICS_FILE
+    metadata_file = metadata_file or config.DIETARY_METRICS_METADATA_FILE
+
     # Load data
-    fao_df, la_mapping = load_data()
+    fao_df, la_mapping = load_data(fao_df, la_mapping, fao_file)
     
     # Define broad categories to exclude
     broad_categories = [
@@ -474,11 +495,11 @@ def calculate_dietary_metrics():
     dietary_metrics, adjustment_factors = handle_methodology_change(dietary_metrics)
     
     # Save the results
-    dietary_metrics.to_csv(config.DIETARY_METRICS_FILE, index=False)
-    logging.info(f"Dietary metrics have been calculated and saved to '{config.DIETARY_METRICS_FILE}'")
+    write_dataset(dietary_metrics, output_file)
+    logging.info(f"Dietary metrics have been calculated and saved to '{output_file}'")
     
     # Save a metadata file with assumptions and limitations
-    with open(config.DIETARY_METRICS_METADATA_FILE, 'w') as f:
+    with open(metadata_file, 'w') as f:
         f.write("# Dietary Metrics Calculation Metadata\n\n")
         f.write("## Data Processing Assumptions and Limitations\n\n")
         f.write("### FAOSTAT Data Processing\n\n")
@@ -501,9 +522,41 @@ def calculate_dietary_metrics():
         f.write("* **Plant-based Sources**: Explicitly defined list including vegetable oils, olive oil, seed oils\n")
         f.write("* **Ratio Calculation**: Calculated as (Plant Fat Supply / Total Fat Supply) per year\n\n")
     
-    logging.info("Dietary metrics metadata has been saved to 'data/processed/dietary_metrics_metadata.md'")
+    logging.info(f"Dietary metrics metadata has been saved to '{metadata_file}'")
     
     return dietary_metrics
 
+def calculate_dietary_metrics_for_areas(area_files, la_mapping=None, fao_frames=None, jobs=None):
+    """Calculate dietary metrics for several areas, one worker process per area.
+
+    Args:
+        area_files: For each area, a dict with the 'fao_file' to read (when no
+            frame is in memory) and the 'output_file' and 'metadata_file' to write.
+        la_mapping: Validated FAO to LA content mapping, if already in memory.
+        fao_frames: Processed FAOSTAT data per area, if already in memory.
+        jobs: Worker processes; defaults to the CPU count.
+
+    Returns:
+        Dict of area to its dietary metrics. Areas whose calculation failed are
+        logged and left out.
+    """
+    # Read the mapping once here rather than once per worker
+    if la_mapping is None:
+        la_mapping = read_dataset(config.FAOSTAT_LA_MAPPING_FILE)
+    fao_frames = fao_frames or {}
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(area_files)))
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            area: pool.submit(calculate_dietary_metrics, fao_frames.get(area), la_mapping, **files)
+            for area, files in area_files.items()
+        }
+        for area, future in futures.items():
+            try:
+                results[area] = future.result()
+            except Exception as e:
+                logging.error(f"Dietary metrics failed for {area}: {e}")
+    return results
+
 if __name__ == "__main__":
     calculate_dietary_metrics()
\ No newline at end of file
@@ -0,0 +1,200 @@
+"""
+Streaming reader for Excel workbooks.
+
+``pd.read_excel(path, sheet_name=...)`` opens and parses the whole xlsx archive
+on every call, so reading a workbook sheet by sheet costs one full parse per
+sheet. StreamingWorkbook opens the file once in openpyxl's read-only mode and
+builds each sheet's grid lazily, row by row, only when it is asked for. A
+caller that knows where its table ends can pass a ``stop`` predicate to stop
+reading the rest of the sheet.
+
+Grids are converted exactly as ``pd.read_excel(..., header=None)`` would
+convert them (same cell conversion and type inference), so code written
+against ``read_excel`` frames sees identical data.
+
+``read_columns`` projects a sheet onto a few column positions and filters
+rows while iterating, so only the cells that are kept are converted.
+``cached_sheet_frame`` stores such a parsed result keyed by the workbook's
+content hash, so later runs over an unchanged workbook skip Excel parsing.
+All code and comments use Australian English.
+"""
+
+import logging
+import re
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import openpyxl
+import pandas as pd
+from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+from pandas.io.parsers import TextParser
+
+from src.pipeline.manifest import hash_file
+from src.pipeline.storage import dataset_exists, read_dataset, write_dataset
+
+logger = logging.getLogger(__name__)
+
+# Called with each converted row and its 0-based index; True stops reading after that row
+RowPredicate = Callable[[List, int], bool]
+# Hex digits of the workbook hash kept in cache file names
+CACHE_HASH_LENGTH = 16
+
+
+def _convert_cell(cell):
+    """Convert a cell the way pandas' openpyxl reader does."""
+    if cell.value is None:
+        return ""
+    if cell.data_type == TYPE_ERROR:
+        return np.nan
+    if cell.data_type == TYPE_NUMERIC:
+        as_int = int(cell.value)
+        return as_int if as_int == cell.value else float(cell.value)
+    return cell.value
+
+
+def rows_to_frame(rows: List[List]) -> pd.DataFrame:
+    """Build a headerless DataFrame from converted rows, as ``pd.read_excel(header=None)`` does."""
+    # Trim trailing empty rows and pad the rest to a common width
+    last_with_data = max((i for i, row in enumerate(rows) if row), default=-1)
+    rows = rows[:last_with_data + 1]
+    if not rows:
+        return pd.DataFrame()
+    width = max(len(row) for row in rows)
+    rows = [row + [""] * (width - len(row)) for row in rows]
+    return TextParser(rows, header=None, skip_blank_lines=False).read()
+
+
+class StreamingWorkbook:
+    """An xlsx workbook opened once, with sheets read lazily as DataFrames."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._book = openpyxl.load_workbook(self.path, read_only=True, data_only=True, keep_links=False)
+
+    @property
+    def sheet_names(self) -> List[str]:
+        return list(self._book.sheetnames)
+
+    def iter_rows(self, sheet_name: str) -> Iterator[List]:
+        """Yield a sheet's rows as converted values, with trailing empty cells trimmed."""
+        sheet = self._book[sheet_name]
+        # Read-only sheets trust the stored dimensions, which some writers get wrong
+        sheet.reset_dimensions()
+        for row in sheet.rows:
+            values = [_convert_cell(cell) for cell in row]
+            while values and values[-1] == "":
+                values.pop()
+            yield values
+
+    def read_sheet(self, sheet_name: str, stop: Optional[RowPredicate] = None) -> pd.DataFrame:
+        """
+        Read a sheet without a header row, as ``pd.read_excel(header=None)`` would.
+
+        Args:
+            sheet_name: Sheet to read.
+            stop: Optional predicate; reading stops after the first row for which it returns True.
+        """
+        rows = []
+        for index, values in enumerate(self.iter_rows(sheet_name)):
+            rows.append(values)
+            if stop is not None and stop(values, index):
+                logger.debug(f"Stopped reading sheet '{sheet_name}' after row {index}")
+                break
+        return rows_to_frame(rows)
+
+    def read_columns(self, sheet_name: str, columns: Sequence[int], skiprows: int = 0,
+                     keep: Optional[RowPredicate] = None) -> pd.DataFrame:
+        """
+        Read only some columns of a sheet, optionally keeping only some rows.
+
+        Equivalent to ``pd.read_excel(header=None, skiprows=skiprows)[columns]``
+        followed by a row filter, but cells outside ``columns`` and rows that
+        are not kept are never converted or held.
+
+        Args:
+            sheet_name: Sheet to read.
+            columns: 0-based column positions, which also name the frame's columns.
+            skiprows: Leading rows to skip.
+            keep: Optional predicate on the projected values and row index (after
+                skipped rows); rows for which it returns False are dropped.
+
+        Raises:
+            ValueError: If the sheet has no cells in the last requested column.
+        """
+        columns = list(columns)
+        last = max(columns)
+        sheet = self._book[sheet_name]
+        sheet.reset_dimensions()
+        reached_last = False
+        rows = []
+        for index, row in enumerate(sheet.iter_rows(min_row=skiprows + 1, max_col=last + 1)):
+            values = [_convert_cell(row[col]) if col < len(row) else "" for col in columns]
+            reached_last = reached_last or (len(row) > last and row[last].value is not None)
+            if keep is None or keep(values, index):
+                rows.append(values if any(value != "" for value in values) else [])
+        if not reached_last:
+            raise ValueError(f"Sheet '{sheet_name}' has no data in column {last} after skipping {skiprows} rows")
+        frame = rows_to_frame(rows)
+        if frame.empty:
+            return pd.DataFrame(columns=columns)
+        frame.columns = columns
+        return frame
+
+    def iter_sheets(self, sheet_names: Optional[Iterable[str]] = None,
+                    stop_for: Optional[Callable[[str], Optional[RowPredicate]]] = None
+                    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Yield ``(sheet name, frame)`` pairs, reading each sheet only when it is reached.
+
+        Args:
+            sheet_names: Sheets to read, in order; defaults to every sheet.
+            stop_for: Optional factory giving a fresh ``stop`` predicate for a sheet (or None).
+        """
+        for sheet_name in (self.sheet_names if sheet_names is None else sheet_names):
+            stop = stop_for(sheet_name) if stop_for is not None else None
+            yield sheet_name, self.read_sheet(sheet_name, stop)
+
+    def close(self) -> None:
+        self._book.close()
+
+    def __enter__(self) -> "StreamingWorkbook":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def cached_sheet_frame(path: Union[str, Path], key: str, parse: Callable[[], pd.DataFrame],
+                       cache_dir: Optional[Path]) -> pd.DataFrame:
+    """
+    Return ``parse()``'s result for a workbook, reusing the copy cached for the same contents.
+
+    Cached frames are named by the workbook's name, ``key`` and its SHA-256, and
+    stored through the storage layer (Parquet or Arrow when pyarrow is
+    available). When the workbook changes, the new frame replaces the stale one.
+    Column names should be strings, as columnar formats store them as text.
+
+    Args:
+        path: Workbook the frame is parsed from.
+        key: Names what ``parse`` extracts (e.g. the sheet and columns), so one
+            workbook can have several cached frames.
+        parse: Builds the frame from the workbook.
+        cache_dir: Cache directory; None parses every time.
+    """
+    if cache_dir is None:
+        return parse()
+    path = Path(path)
+    prefix = f"{path.stem}-{key}"
+    cached = Path(cache_dir) / f"{prefix}-{hash_file(path)[:CACHE_HASH_LENGTH]}.csv"
+    if dataset_exists(cached):
+        logger.info(f"Using cached parse of {path.name} ({key})")
+        return read_dataset(cached)
+
+    frame = parse()
+    stale = re.compile(re.escape(prefix) + rf"-[0-9a-f]{{{CACHE_HASH_LENGTH}}}\.\w+")
+    for old_file in Path(cache_dir).glob(f"{prefix}-*"):
+        if stale.fullmatch(old_file.name):
+            old_file.unlink()
+    write_dataset(frame, cached, csv_export=False)
+    return frame
@@ -1,6 +1,9 @@
 """
 Extract standardized health outcome metrics from various processed data sources.
 Merges NCD-RisC, AIHW, and IHME metrics into a single yearly dataset.
+
+When run as an ETL stage, frames produced earlier in the same run arrive via a
+PipelineContext and are used in place of re-reading the processed CSVs.
 """
 
 import pandas as pd
@@ -8,6 +11,8 @@ from pathlib import Path
 from src import config
 import logging
 from typing import Dict, List, Optional
+from src.pipeline.context import PipelineContext
+from src.pipeline.storage import dataset_columns, dataset_exists, read_dataset, write_dataset
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -15,13 +20,25 @@ logger = logging.getLogger(__name__)
 
 # Use centralised processed data directory from config
 
-def load_and_validate_csv(file_path: Path, required_cols: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
-    """Loads a CSV file and performs basic validation."""
-    if not file_path.exists():
+def load_and_validate_csv(file_path: Path, required_cols: Optional[List[str]] = None,
+                          df: Optional[pd.DataFrame] = None) -> Optional[pd.DataFrame]:
+    """Loads a processed dataset (unless ``df`` is already in memory) and performs basic validation.
+
+    Only the required columns are read from disk when they are given.
+    """
+    if df is None and not dataset_exists(file_path):
         logger.warning(f"File not found: {file_path}")
         return None
     try:
-        df = pd.read_csv(file_path)
+        if df is None:
+            if required_cols:
+                # Check the stored schema first so only the needed columns are read
+                available = set(dataset_columns(file_path))
+                missing_cols = [col for col in required_cols if col not in available]
+                if missing_cols:
+                    logger.error(f"Missing required columns in {file_path}: {missing_cols}")
+                    return None
+            df = read_dataset(file_path, columns=required_cols)
         if df.empty:
             logger.warning(f"File is empty: {file_path}")
             return None
@@ -36,12 +53,16 @@ def load_and_validate_csv(file_path: Path, required_cols: Optional[List[str]] =
         logger.error(f"Error loading {file_path}: {e}")
         return None
 
-def extract_ncd_risc_metrics() -> Optional[pd.DataFrame]:
+def _in_memory(context: Optional[PipelineContext], path: Path) -> Optional[pd.DataFrame]:
+    """Return the frame for ``path`` if an upstream stage produced it this run."""
+    return context.get(path) if context is not None else None
+
+def extract_ncd_risc_metrics(context: Optional[PipelineContext] = None) -> Optional[pd.DataFrame]:
     """Extracts and standardizes metrics from NCD-RisC files."""
     logger.info("Processing NCD-RisC data...")
-    diabetes_df = load_and_validate_csv(config.PROCESSED_DATA_DIR / 'ncdrisc_diabetes_australia_processed.csv', ['year', 'sex', 'age-standardised_prevalence_of_diabetes_18+_years_', 'age-standardised_proportion_of_people_with_diabetes_who_were_treated_30+_years_'])
-    bmi_df = load_and_validate_csv(config.PROCESSED_DATA_DIR / 'ncdrisc_bmi_australia_processed.csv', ['year', 'sex', 'prevalence_of_bmi>=30_kg_m²_obesity_'])
-    cholesterol_df = load_and_validate_csv(config.PROCESSED_DATA_DIR / 'ncdrisc_cholesterol_australia_processed.csv', ['year', 'sex', 'mean_total_cholesterol_mmol_l_', 'mean_non-hdl_cholesterol_mmol_l_'])
+    diabetes_df = load_and_validate_csv(config.NCD_DIABETES_PROCESSED_FILE, ['year', 'sex', 'age-standardised_prevalence_of_diabetes_18+_years_', 'age-standardised_proportion_of_people_with_diabetes_who_were_treated_30+_years_'], df=_in_memory(context, config.NCD_DIABETES_PROCESSED_FILE))
+    bmi_df = load_and_validate_csv(config.NCD_BMI_PROCESSED_FILE, ['year', 'sex', 'prevalence_of_bmi>=30_kg_m²_obesity_'], df=_in_memory(context, config.NCD_BMI_PROCESSED_FILE))
+    cholesterol_df = load_and_validate_csv(config.NCD_CHOLESTEROL_PROCESSED_FILE, ['year', 'sex', 'mean_total_cholesterol_mmol_l_', 'mean_non-hdl_cholesterol_mmol_l_'], df=_in_memory(context, config.NCD_CHOLESTEROL_PROCESSED_FILE))
 
     metrics_list = []
 
@@ -152,13 +173,13 @@ def extract_ncd_risc_metrics() -> Optional[pd.DataFrame]:
     logger.info(f"Processed NCD-RisC metrics. Shape: {ncd_merged_df.shape}")
     return ncd_merged_df
 
-def extract_aihw_metrics() -> Optional[pd.DataFrame]:
+def extract_aihw_metrics(context: Optional[PipelineContext] = None) -> Optional[pd.DataFrame]:
     """Extracts and standardizes metrics from processed AIHW files."""
     logger.info("Processing AIHW data...")
     all_aihw_metrics = []
 
     # Dementia Prevalence (Number) - From S2.4
-    prev_df = load_and_validate_csv(config.AIHW_PREVALENCE_PROCESSED_FILE, ['year', 'value', 'source_sheet', 'sex'])
+    prev_df = load_and_validate_csv(config.AIHW_PREVALENCE_PROCESSED_FILE, ['year', 'value', 'source_sheet', 'sex'], df=_in_memory(context, config.AIHW_PREVALENCE_PROCESSED_FILE))
     if prev_df is not None:
         # Log unique sex values before filtering Dementia Prevalence
         logger.debug(f"Dementia Prevalence - unique 'sex' values before filtering: {prev_df['sex'].unique().tolist()}")
@@ -179,7 +200,7 @@ def extract_aihw_metrics() -> Optional[pd.DataFrame]:
             logger.warning("No 'persons' data found in aihw_dementia_prevalence_australia_processed.csv from sheet S2.4.")
 
     # Dementia Mortality (Age-Standardised Rate) - From S3.5
-    mort_df = load_and_validate_csv(config.AIHW_MORTALITY_PROCESSED_FILE, ['year', 'value', 'source_sheet', 'metric_type', 'sex'])
+    mort_df = load_and_validate_csv(config.AIHW_MORTALITY_PROCESSED_FILE, ['year', 'value', 'source_sheet', 'metric_type', 'sex'], df=_in_memory(context, config.AIHW_MORTALITY_PROCESSED_FILE))
     if mort_df is not None:
         # Log unique sex values before filtering Dementia Mortality
         logger.debug(f"Dementia Mortality - unique 'sex' values before filtering: {mort_df['sex'].unique().tolist()}")
@@ -201,7 +222,7 @@ def extract_aihw_metrics() -> Optional[pd.DataFrame]:
 
 
     # CVD Mortality (Age-Standardised Rate) - From Table 11 in aihw_cvd_all_facts.csv
-    cvd_df = load_and_validate_csv(config.AIHW_CVD_PROCESSED_FILE, ['year', 'value', 'source_sheet', 'metric_type', 'sex'])
+    cvd_df = load_and_validate_csv(config.AIHW_CVD_PROCESSED_FILE, ['year', 'value', 'source_sheet', 'metric_type', 'sex'], df=_in_memory(context, config.AIHW_CVD_PROCESSED_FILE))
     if cvd_df is not None:
         # Log unique sex values before filtering CVD Mortality
         logger.debug(f"CVD Mortality - unique 'sex' values before filtering: {cvd_df['sex'].unique().tolist()}")
@@ -234,14 +255,15 @@ def extract_aihw_metrics() -> Optional[pd.DataFrame]:
     logger.info(f"Processed AIHW metrics. Shape: {aihw_merged_df.shape}")
     return aihw_merged_df
 
-def extract_ihme_metrics() -> Optional[pd.DataFrame]:
+def extract_ihme_metrics(context: Optional[PipelineContext] = None) -> Optional[pd.DataFrame]:
     """Extracts and standardizes metrics from processed IHME GBD files."""
     logger.info("Processing IHME GBD data...")
     all_ihme_metrics = []
 
     # Load Dementia metrics from GBD
-    dementia_df = load_and_validate_csv(config.PROCESSED_DATA_DIR / 'gbd_dementia_metrics.csv', 
-                                      ['year', 'metric_type', 'value'])
+    dementia_df = load_and_validate_csv(config.GBD_DEMENTIA_PROCESSED_FILE,
+                                      ['year', 'metric_type', 'value'],
+                                      df=_in_memory(context, config.GBD_DEMENTIA_PROCESSED_FILE))
     if dementia_df is not None:
         # Process prevalence rate
         dementia_prev = dementia_df[dementia_df['metric_type'] == 'age_standardized_prevalence_rate'].copy()
@@ -262,8 +284,9 @@ def extract_ihme_metrics() -> Optional[pd.DataFrame]:
             logger.info(f"Extracted Dementia Mortality Rate (GBD): {dementia_mort.shape[0]} rows")
 
     # Load CVD metrics from GBD
-    cvd_df = load_and_validate_csv(config.PROCESSED_DATA_DIR / 'gbd_cvd_metrics.csv', 
-                                 ['year', 'metric_type', 'value'])
+    cvd_df = load_and_validate_csv(config.GBD_CVD_PROCESSED_FILE,
+                                 ['year', 'metric_type', 'value'],
+                                 df=_in_memory(context, config.GBD_CVD_PROCESSED_FILE))
     if cvd_df is not None:
         # Process prevalence rate
         cvd_prev = cvd_df[cvd_df['metric_type'] == 'age_standardized_prevalence_rate'].copy()
@@ -295,15 +318,21 @@ def extract_ihme_metrics() -> Optional[pd.DataFrame]:
     logger.info(f"Processed IHME metrics. Shape: {ihme_merged_df.shape}")
     return ihme_merged_df
 
-def main():
+def main(context: Optional[PipelineContext] = None) -> Optional[pd.DataFrame]:
     """
     Main function to extract and merge all health metrics.
+
+    Args:
+        context: Frames produced earlier in the same ETL run, if any.
+
+    Returns:
+        The combined yearly health metrics, or None if nothing could be processed.
     """
     logger.info("Starting health metrics consolidation...")
 
-    ncd_metrics = extract_ncd_risc_metrics()
-    aihw_metrics = extract_aihw_metrics()
-    ihme_metrics = extract_ihme_metrics()
+    ncd_metrics = extract_ncd_risc_metrics(context)
+    aihw_metrics = extract_aihw_metrics(context)
+    ihme_metrics = extract_ihme_metrics(context)
 
     # Merge all metrics
     merged_health_df = None
@@ -328,14 +357,14 @@ def main():
 
     if merged_health_df is None:
         logger.error("No health metrics could be processed.")
-        return
+        return None
 
     # Sort by year and handle any missing values
     merged_health_df = merged_health_df.sort_values('Year')
     
     # Save the merged dataset
-    output_file = config.PROCESSED_DATA_DIR / 'health_metrics_australia_combined.csv'
-    merged_health_df.to_csv(output_file, index=False)
+    output_file = config.HEALTH_METRICS_FILE
+    write_dataset(merged_health_df, output_file)
     logger.info(f"Saved combined health metrics to {output_file}")
     logger.info(f"Final dataset shape: {merged_health_df.shape}")
     
@@ -346,5 +375,7 @@ def main():
             non_null = merged_health_df[col].notna().sum()
             logger.info(f"  {col}: {non_null} non-null values")
 
+    return merged_health_df
+
 if __name__ == '__main__':
     main() 
\ No newline at end of file
@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field, field_validator
 import logging
 from typing import List, Dict, Optional
 from .health_outcome_metrics import main as generate_health_metrics
+from src.pipeline.storage import dataset_exists, read_dataset, write_dataset
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -173,18 +174,29 @@ def standardize_dietary_metrics(dietary_df: pd.DataFrame) -> pd.DataFrame:
 
     return df
 
-def main():
+def main(dietary_df: Optional[pd.DataFrame] = None, health_df: Optional[pd.DataFrame] = None,
+         population_df: Optional[pd.DataFrame] = None) -> Optional[pd.DataFrame]:
+    """
+    Build the final analytical dataset.
+
+    Each input frame is read from its processed file unless it is passed in
+    (for example, handed over in memory by an upstream ETL stage).
+
+    Returns:
+        The validated analytical dataset, or None if it could not be built.
+    """
     # Set up paths
     # Use centralised processed data directory from config
     processed_dir = config.PROCESSED_DATA_DIR
 
     # Load dietary metrics
     dietary_metrics_path = config.DIETARY_METRICS_FILE
-    if not dietary_metrics_path.exists():
-        logger.error(f"Dietary metrics file not found: {dietary_metrics_path}")
-        return
-    logger.info(f"Loading dietary metrics from {dietary_metrics_path}...")
-    dietary_df = pd.read_csv(dietary_metrics_path)
+    if dietary_df is None:
+        if not dataset_exists(dietary_metrics_path):
+            logger.error(f"Dietary metrics file not found: {dietary_metrics_path}")
+            return None
+        logger.info(f"Loading dietary metrics from {dietary_metrics_path}...")
+        dietary_df = read_dataset(dietary_metrics_path)
     dietary_df = standardize_dietary_metrics(dietary_df)
 
     # Create lagged predictors
@@ -194,44 +206,48 @@ def main():
         dietary_df = create_lagged_predictors(dietary_df, lag_years)
     except ValueError as e:
         logger.error(f"Error creating lagged predictors: {e}")
-        return
+        return None
     
     # Load health outcome metrics from the consolidated file
     logger.info("Loading health outcome metrics...")
     health_metrics_path = config.HEALTH_METRICS_FILE
     
     # Check if health_metrics_australia_combined.csv exists, if not, generate it
-    if not health_metrics_path.exists():
+    if health_df is None and not dataset_exists(health_metrics_path):
         logger.info("Health outcome metrics file not found. Generating now...")
         try:
-            generate_health_metrics()
+            health_df = generate_health_metrics()
         except Exception as e:
             logger.error(f"Failed to generate health metrics: {e}")
-            return
+            return None
     
     # Now load the health metrics file
-    if not health_metrics_path.exists():
+    if health_df is None and not dataset_exists(health_metrics_path):
         logger.error("Failed to create health metrics file.")
-        return
+        return None
     
-    try:
-        health_df = pd.read_csv(health_metrics_path)
-        logger.info(f"Loaded health metrics: {health_df.shape[0]} rows, {health_df.shape[1]} columns")
-    except Exception as e:
-        logger.error(f"Error loading health metrics file: {e}")
-        # Create an empty DataFrame with just Year if loading fails
-        health_df = pd.DataFrame({'Year': dietary_df['Year'].unique()})
+    if health_df is None:
+        try:
+            health_df = read_dataset(health_metrics_path)
+            logger.info(f"Loaded health metrics: {health_df.shape[0]} rows, {health_df.shape[1]} columns")
+        except Exception as e:
+            logger.error(f"Error loading health metrics file: {e}")
+            # Create an empty DataFrame with just Year if loading fails
+            health_df = pd.DataFrame({'Year': dietary_df['Year'].unique()})
 
     # --- Load Population Data ---
     logger.info("Loading processed population data...")
     population_data_path = config.ABS_POPULATION_PROCESSED_FILE
-    if not population_data_path.exists():
+    if population_df is not None:
+        population_df = population_df[['Year', 'Population']].copy()
+        logger.info(f"Using in-memory population data: {population_df.shape[0]} rows")
+    elif not dataset_exists(population_data_path):
         logger.warning(f"Processed population data file not found: {population_data_path}. Population column will be empty.")
         # Create an empty DataFrame with 'Year' to avoid merge errors later
         population_df = pd.DataFrame({'Year': [], 'Population': []})
     else:
         try:
-            population_df = pd.read_csv(population_data_path)
+            population_df = read_dataset(population_data_path)
             # Ensure columns are correct ('Year', 'Population')
             if 'Year' not in population_df.columns or 'Population' not in population_df.columns:
                  raise ValueError("Population data CSV missing required 'Year' or 'Population' columns.")
@@ -252,7 +268,7 @@ def main():
         logger.error(f"Could not convert Year columns to integer for merging: {e}")
         logger.info(f"Dietary Year Dtype: {dietary_df['Year'].dtype}")
         logger.info(f"Health Year Dtype: {health_df['Year'].dtype}")
-        return
+        return None
 
     merged_df = pd.merge(dietary_df, health_df, on='Year', how='left')
     logger.info(f"Merged data shape after health data: {merged_df.shape}")
@@ -324,12 +340,13 @@ def main():
 
         # Save the final validated DataFrame
         final_output_path = config.ANALYTICAL_DATA_FINAL_FILE
-        final_df.to_csv(final_output_path, index=False)
+        write_dataset(final_df, final_output_path)
         logger.info(f"Final analytical dataset saved successfully to {final_output_path}")
         logger.info(f"Final dataset covers years {final_df['Year'].min()} to {final_df['Year'].max()}")
         logger.info(f"Total validated records: {len(final_df)}")
 
     else:
+        final_df = None
         logger.warning("No valid records found after validation. Final dataset not saved.")
 
     # Save validation errors if any occurred
@@ -339,5 +356,7 @@ def main():
         error_df.to_csv(error_path, index=False)
         logger.warning(f"Detailed validation errors saved to {error_path}")
 
+    return final_df
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 This module extracts, cleans, and standardises health outcome metrics from:
 - ABS Causes of Death (Excel, manually downloaded)
-- IHME GBD (CSV, extracted automatically from a manually downloaded zip)
+- IHME GBD (CSVs streamed in chunks straight from a manually downloaded zip)
 
 All code and comments use Australian English spelling.
 Follows project modularity, PEP8, and pydantic validation.
@@ -11,29 +11,37 @@ Outputs:
 - data/processed/abs_cod_metrics.csv
 - data/processed/gbd_dementia_metrics.csv
 - data/processed/gbd_cvd_metrics.csv
+- data/processed/gbd_metrics_long.csv (every kept location, condition, measure, metric, age, sex and source export)
 
 """
 
 import pandas as pd
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator, Sequence
 from pydantic import BaseModel, ValidationError, Field
 import logging
+import re
 import zipfile
-import shutil
 import numpy as np
+from src import config
+from src.data_processing.excel_streaming import StreamingWorkbook, cached_sheet_frame
+from src.pipeline.storage import write_dataset
 
-RAW_DIR = Path("data/raw")
-PROCESSED_DIR = Path("data/processed")
-STAGING_DIR = Path("data/staging")
+RAW_DIR = config.RAW_DATA_DIR
+PROCESSED_DIR = config.PROCESSED_DATA_DIR
+STAGING_DIR = config.STAGING_DATA_DIR
 IHME_ZIP = RAW_DIR / "IHME-GBD_2021_DATA-31d73d81-1.zip"
-IHME_EXTRACTED_DIR = STAGING_DIR / "ihme_gbd_extracted"
 
 ABS_FILE = RAW_DIR / "ABS_Causes_of_Death_Australia.xlsx"
 
-ABS_OUT = PROCESSED_DIR / "abs_cod_metrics.csv"
-IHME_DEMENTIA_OUT = PROCESSED_DIR / "gbd_dementia_metrics.csv"
-IHME_CVD_OUT = PROCESSED_DIR / "gbd_cvd_metrics.csv"
+ABS_OUT = config.ABS_COD_PROCESSED_FILE
+IHME_DEMENTIA_OUT = config.GBD_DEMENTIA_PROCESSED_FILE
+IHME_CVD_OUT = config.GBD_CVD_PROCESSED_FILE
+IHME_LONG_OUT = config.GBD_LONG_PROCESSED_FILE
+# Parsed ABS rate columns, keyed by workbook hash
+EXCEL_CACHE_DIR = config.EXCEL_CACHE_DIR
+ABS_SHEET = "Mortality Rates"
+ABS_COLUMNS = ["year", "cause_of_death", "age_standardised_rate"]
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -49,184 +57,397 @@ class HealthMetricRecord(BaseModel):
     Measure: Optional[str] = None
     Location: str = "Australia"
 
+HEALTH_METRIC_COLUMNS = list(HealthMetricRecord.model_fields)
+# Cause-of-death terms (matched case-insensitively) for each ABS condition, in output order
+ABS_CONDITION_TERMS = {
+    "dementia": ["Dementia", "Alzheimer", "Senile dementia"],
+    "ihd": ["Ischaemic heart disease", "Coronary heart disease"],
+    "stroke": ["Cerebrovascular disease", "Stroke"]
+}
+# One named group per condition, so a single scan finds every condition a cause mentions
+ABS_CONDITION_PATTERN = re.compile(
+    "|".join(f"(?P<{condition}>{'|'.join(re.escape(term) for term in terms)})"
+             for condition, terms in ABS_CONDITION_TERMS.items()),
+    re.IGNORECASE,
+)
+
+
+def validate_health_metrics(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Vectorised HealthMetricRecord validation for a metrics frame.
+
+    Rows the model would reject (no whole year in 1980-2025, a missing or
+    negative value, or no metric or source) are dropped with a warning.
+    Missing optional columns are added with the model's defaults.
+    """
+    frame = frame.assign(**{column: None for column in HEALTH_METRIC_COLUMNS if column not in frame})
+    frame = frame[HEALTH_METRIC_COLUMNS]
+    year = pd.to_numeric(frame["Year"], errors="coerce")
+    value = pd.to_numeric(frame["Value"], errors="coerce")
+    invalid = (year.isna() | (year % 1 != 0) | (year < 1980) | (year > 2025)
+               | value.isna() | (value < 0) | frame["Metric"].isna() | frame["Source"].isna())
+    if invalid.any():
+        logger.warning(f"Dropped {int(invalid.sum())} records that fail HealthMetricRecord validation")
+    valid = ~invalid
+    return frame[valid].assign(
+        Year=year[valid].astype("int64"),
+        Value=value[valid].astype(float),
+        Location=frame.loc[valid, "Location"].fillna(HealthMetricRecord.model_fields["Location"].default),
+    ).reset_index(drop=True)
+
+
+def classify_causes(causes: pd.Series) -> pd.DataFrame:
+    """
+    Map each distinct cause-of-death label to the ABS conditions it mentions.
+
+    Each label is scanned once with ABS_CONDITION_PATTERN. A label that
+    mentions several conditions gets one row per condition.
+
+    Returns:
+        Columns ``cause_of_death`` and ``condition`` (categorical, in ABS_CONDITION_TERMS order).
+    """
+    labels = pd.Series(causes.dropna().unique(), dtype=object)
+    matches = labels.astype(str).str.extractall(ABS_CONDITION_PATTERN)
+    if matches.empty:
+        return pd.DataFrame({"cause_of_death": pd.Series(dtype=object),
+                             "condition": pd.Categorical([], categories=list(ABS_CONDITION_TERMS))})
+    found = matches.notna().groupby(level=0).any()
+    pairs = found.stack()
+    pairs = pairs[pairs].index.to_frame(index=False, name=["label", "condition"])
+    return pd.DataFrame({
+        "cause_of_death": labels.to_numpy()[pairs["label"].to_numpy()],
+        "condition": pd.Categorical(pairs["condition"], categories=list(ABS_CONDITION_TERMS)),
+    })
+
+
+# Rows per chunk streamed from each GBD export
+IHME_CHUNK_SIZE = 50000
+# Long-format GBD table columns; the others in an export are skipped while parsing
+GBD_LONG_COLUMNS = ["location", "year", "condition", "measure", "metric", "age", "sex", "val", "lower", "upper",
+                    "source_file"]
+# Columns added per member rather than read from the export
+GBD_TAG_COLUMNS = ("condition", "source_file")
+IHME_READ_COLUMNS = tuple(col for col in GBD_LONG_COLUMNS if col not in GBD_TAG_COLUMNS)
+DEFAULT_IHME_LOCATION = "Australia"
+# Zip member name patterns (matched case-insensitively) for each GBD condition, in output order
+GBD_CONDITION_PATTERNS = {
+    "Dementia": re.compile(r"dementia", re.IGNORECASE),
+    "CVD": re.compile(r"cvd|ihd|stroke", re.IGNORECASE),
+}
+# GBD exports hold Number, Percent and Rate rows for each measure; only one is averaged
+DEFAULT_IHME_METRIC = "Rate"
+# GBD measures kept (matched case-insensitively) and their metric name suffixes, in output order
+IHME_MEASURES = {
+    "prevalence": "Prevalence_Rate",
+    "incidence": "Incidence_Rate",
+    "deaths": "Death_Rate"
+}
+IHME_MEASURE_PATTERN = re.compile("|".join(f"(?P<{measure}>{measure})" for measure in IHME_MEASURES), re.IGNORECASE)
+
+
 def clean_column_name(col: str) -> str:
     """Standardise column names to snake_case."""
     return col.lower().replace(" ", "_").replace("-", "_").replace("/", "_").replace("(", "").replace(")", "")
 
-def process_abs_cod(abs_file: Path = ABS_FILE, output_file: Path = ABS_OUT) -> None:
+def read_abs_rates(abs_file: Path) -> pd.DataFrame:
+    """
+    Stream the year, cause and age-standardised rate columns of the ABS sheet.
+
+    Only those three columns are read, and only rows whose cause mentions an
+    ABS condition are kept. Years and rates are made numeric so the frame
+    can be cached in a columnar format.
+
+    Raises:
+        ValueError: If the sheet lacks one of ABS_COLUMNS.
+    """
+    with StreamingWorkbook(abs_file) as workbook:
+        header = [clean_column_name(str(name)) for name in next(workbook.iter_rows(ABS_SHEET), [])]
+        missing = [column for column in ABS_COLUMNS if column not in header]
+        if missing:
+            raise ValueError(f"Sheet '{ABS_SHEET}' of {abs_file.name} has no {', '.join(missing)} column")
+        positions = [header.index(column) for column in ABS_COLUMNS]
+        df = workbook.read_columns(
+            ABS_SHEET, positions, skiprows=1,
+            keep=lambda values, index: ABS_CONDITION_PATTERN.search(str(values[1])) is not None)
+    df.columns = ABS_COLUMNS
+    df["year"] = pd.to_numeric(df["year"], errors="coerce")
+    df["cause_of_death"] = df["cause_of_death"].astype(str)
+    df["age_standardised_rate"] = pd.to_numeric(df["age_standardised_rate"], errors="coerce")
+    return df
+
+
+def process_abs_cod(abs_file: Path = ABS_FILE, output_file: Path = ABS_OUT,
+                    cache_dir: Optional[Path] = EXCEL_CACHE_DIR) -> Optional[pd.DataFrame]:
     """Extract and clean ABS Causes of Death data for Dementia, IHD, Stroke.
     
     Processes the ABS Excel file to extract age-standardised mortality rates
-    for key conditions. Handles ICD code changes across years.
+    for key conditions. Handles ICD code changes across years. Causes are
+    classified in one pass and averaged with a single groupby over
+    (year, condition). The projected rate columns are cached by workbook
+    hash in ``cache_dir`` (None disables the cache).
+    Returns the saved metrics, or None if the source file is missing.
     """
     if not abs_file.exists():
         logger.warning(f"ABS file not found: {abs_file}. Please download and place it in data/raw/.")
-        return
+        return None
 
     try:
-        # Read the Excel file - adjust sheet name based on actual file
-        df = pd.read_excel(abs_file, sheet_name="Mortality Rates")
-        
-        # Clean column names
-        df.columns = [clean_column_name(col) for col in df.columns]
-        
-        # Filter for relevant conditions and standardise
-        condition_mapping = {
-            "dementia": ["Dementia", "Alzheimer", "Senile dementia"],
-            "ihd": ["Ischaemic heart disease", "Coronary heart disease"],
-            "stroke": ["Cerebrovascular disease", "Stroke"]
-        }
-        
-        records = []
-        for year in df["year"].unique():
-            year_data = df[df["year"] == year]
-            
-            # Process each condition group
-            for condition, terms in condition_mapping.items():
-                # Filter rows containing any of the terms
-                condition_data = year_data[
-                    year_data["cause_of_death"].str.contains("|".join(terms), case=False, na=False)
-                ]
-                
-                if not condition_data.empty:
-                    # Get age-standardised rate
-                    rate = condition_data["age_standardised_rate"].mean()
-                    
-                    # Create standardised metric name
-                    metric_name = f"{condition.upper()}_Mortality_Rate_ABS"
-                    
-                    # Create record
-                    record = HealthMetricRecord(
-                        Year=year,
-                        Metric=metric_name,
-                        Value=rate,
-                        Source="ABS_COD",
-                        Measure="Mortality_Rate"
-                    )
-                    records.append(record)
-        
-        # Convert to DataFrame and save
-        out_df = pd.DataFrame([r.dict() for r in records])
+        df = cached_sheet_frame(abs_file, "mortality-rates", lambda: read_abs_rates(abs_file), cache_dir)
+
+        # Classify each cause label once, then average the age-standardised rate per year and condition
+        conditions = classify_causes(df["cause_of_death"])
+        matched = df[["year", "cause_of_death", "age_standardised_rate"]].merge(conditions, on="cause_of_death")
+        # Years keep the order they appear in the sheet
+        matched["year"] = pd.Categorical(matched["year"], categories=df["year"].dropna().unique())
+        rates = (matched.groupby(["year", "condition"], observed=True)["age_standardised_rate"]
+                 .mean().reset_index())
+
+        out_df = validate_health_metrics(pd.DataFrame({
+            "Year": rates["year"].astype(object),
+            "Metric": rates["condition"].astype(str).str.upper() + "_Mortality_Rate_ABS",
+            "Value": rates["age_standardised_rate"],
+            "Source": "ABS_COD",
+            "Measure": "Mortality_Rate",
+        }))
+
+        # Save
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        out_df.to_csv(output_file, index=False)
+        write_dataset(out_df, output_file)
         logger.info(f"ABS metrics saved to {output_file}")
+        return out_df
         
     except Exception as e:
         logger.error(f"Error processing ABS CoD file: {e}")
         raise
 
-def extract_ihme_zip(zip_path: Path = IHME_ZIP, extract_dir: Path = IHME_EXTRACTED_DIR) -> Optional[Path]:
-    """Extract the IHME GBD zip file to the staging directory. Returns the extraction path or None if not found."""
-    if not zip_path.exists():
-        logger.warning(f"IHME GBD zip file not found: {zip_path}. Please download and place it in data/raw/.")
-        return None
-    # Clean up any previous extraction
-    if extract_dir.exists():
-        shutil.rmtree(extract_dir)
-    extract_dir.mkdir(parents=True, exist_ok=True)
-    with zipfile.ZipFile(zip_path, "r") as zip_ref:
-        zip_ref.extractall(extract_dir)
-    logger.info(f"Extracted IHME GBD zip to {extract_dir}")
-    return extract_dir
-
-def find_ihme_csvs(extract_dir: Path) -> dict:
-    """Find relevant IHME CSVs (Dementia, CVD) in the extracted directory."""
-    dementia_csv = None
-    cvd_csv = None
-    for csv_file in extract_dir.glob("*.csv"):
-        name = csv_file.name.lower()
-        if "dementia" in name:
-            dementia_csv = csv_file
-        elif "cvd" in name or "ihd" in name or "stroke" in name:
-            cvd_csv = csv_file
-    return {"dementia": dementia_csv, "cvd": cvd_csv}
-
-def process_ihme_csv(csv_path: Path, condition: str) -> List[HealthMetricRecord]:
-    """Process a single IHME CSV file for a specific condition."""
-    df = pd.read_csv(csv_path)
-    
-    # Clean column names
-    df.columns = [clean_column_name(col) for col in df.columns]
-    
-    # Filter for Australia
-    df = df[df["location"].str.contains("Australia", case=False, na=False)]
-    
-    # Define metrics to extract
-    metrics = {
-        "prevalence": "Prevalence_Rate",
-        "incidence": "Incidence_Rate",
-        "deaths": "Death_Rate"
-    }
-    
-    records = []
-    for year in df["year"].unique():
-        year_data = df[df["year"] == year]
-        
-        for measure, metric_suffix in metrics.items():
-            # Filter for the measure
-            measure_data = year_data[year_data["measure"].str.contains(measure, case=False, na=False)]
-            
-            if not measure_data.empty:
-                # Get age-standardised rate
-                rate = measure_data["val"].mean()
-                
-                # Create standardised metric name
-                metric_name = f"{condition}_{metric_suffix}_GBD"
-                
-                # Create record
-                record = HealthMetricRecord(
-                    Year=year,
-                    Metric=metric_name,
-                    Value=rate,
-                    Source="IHME_GBD",
-                    Measure=measure.capitalize()
-                )
-                records.append(record)
-    
-    return records
+def classify_ihme_members(zip_path: Path) -> Dict[str, List[str]]:
+    """
+    Group the CSV members of the GBD zip by condition, from the archive listing alone.
+
+    Each member goes to the first condition in GBD_CONDITION_PATTERNS whose
+    pattern matches its file name; members matching none are left out.
+    """
+    members: Dict[str, List[str]] = {condition: [] for condition in GBD_CONDITION_PATTERNS}
+    with zipfile.ZipFile(zip_path) as zip_ref:
+        for member in zip_ref.namelist():
+            name = Path(member).name
+            if not name.lower().endswith(".csv"):
+                continue
+            condition = next((condition for condition, pattern in GBD_CONDITION_PATTERNS.items()
+                              if pattern.search(name)), None)
+            if condition is not None:
+                members[condition].append(member)
+    return members
+
+
+def _first_match(values: pd.Series, pattern: re.Pattern) -> pd.Series:
+    """Name of the first group of ``pattern`` found in each value (NaN where none matches).
+
+    The pattern runs once per distinct value rather than once per row.
+    """
+    labels = pd.Series(values.dropna().unique(), dtype=object)
+    found = labels.astype(str).str.extract(pattern).notna()
+    names = found.idxmax(axis=1).where(found.any(axis=1))
+    return values.map(dict(zip(labels, names)))
+
+
+def _location_pattern(locations: Sequence[str]) -> re.Pattern:
+    return re.compile("|".join(re.escape(location) for location in locations), re.IGNORECASE)
+
+
+def iter_ihme_chunks(source: Path, member: Optional[str] = None, chunksize: int = IHME_CHUNK_SIZE,
+                     locations: Optional[Sequence[str]] = (DEFAULT_IHME_LOCATION,),
+                     metric: Optional[str] = DEFAULT_IHME_METRIC) -> Iterator[pd.DataFrame]:
+    """
+    Stream a GBD export in chunks, keeping only the rows and columns used.
+
+    Args:
+        source: A GBD CSV, or the GBD zip when ``member`` is given.
+        member: CSV member of the zip to read; it is decompressed as it is parsed, never extracted.
+        chunksize: Rows parsed per chunk.
+        locations: Keep rows whose location contains any of these (case-insensitive); None keeps all.
+        metric: Keep rows with this metric (e.g. "Rate"); None keeps every metric.
+
+    Yields:
+        Chunks with cleaned column names, holding only rows of the IHME_MEASURES measures.
+    """
+    location_pattern = _location_pattern(locations) if locations else None
+
+    def read(handle) -> Iterator[pd.DataFrame]:
+        reader = pd.read_csv(handle, chunksize=chunksize,
+                             usecols=lambda col: clean_column_name(col) in IHME_READ_COLUMNS)
+        filter_metric = metric is not None
+        for chunk in reader:
+            chunk.columns = [clean_column_name(col) for col in chunk.columns]
+            if filter_metric and "metric" not in chunk.columns:
+                logger.warning(f"No metric column in {member or source}; keeping every metric")
+                filter_metric = False
+            keep = _first_match(chunk["measure"], IHME_MEASURE_PATTERN).notna()
+            if location_pattern is not None:
+                keep &= chunk["location"].str.contains(location_pattern, na=False)
+            if filter_metric:
+                keep &= chunk["metric"].astype(str).str.lower() == metric.lower()
+            yield chunk[keep]
+
+    if member is None:
+        yield from read(source)
+        return
+    with zipfile.ZipFile(source) as zip_ref, zip_ref.open(member) as member_file:
+        yield from read(member_file)
+
+
+def extract_gbd_long(zip_path: Path, members: Optional[Dict[str, List[str]]] = None,
+                     locations: Optional[Sequence[str]] = (DEFAULT_IHME_LOCATION,),
+                     metric: Optional[str] = None,
+                     chunksize: int = IHME_CHUNK_SIZE) -> pd.DataFrame:
+    """
+    Read every classified GBD member in one scan into a long-format table.
+
+    Each member is streamed once (see iter_ihme_chunks), whatever the number
+    of conditions or locations kept, and its rows are tagged with the
+    member's condition and name (``source_file``).
+
+    Args:
+        zip_path: The GBD zip.
+        members: Members per condition; defaults to classify_ihme_members(zip_path).
+        locations: Locations to keep; None keeps every location in the exports.
+        metric: Metric to keep; None (the default) keeps Number, Percent and Rate rows.
+        chunksize: Rows parsed per chunk.
+
+    Returns:
+        One row per kept GBD value, with the GBD_LONG_COLUMNS columns.
+    """
+    if members is None:
+        members = classify_ihme_members(zip_path)
+    chunks = []
+    for condition, condition_members in members.items():
+        for member in condition_members:
+            logger.info(f"Streaming {condition} values from {member}")
+            chunks.extend(chunk.assign(condition=condition, source_file=member)
+                          for chunk in iter_ihme_chunks(zip_path, member, chunksize, locations, metric)
+                          if not chunk.empty)
+    if not chunks:
+        return pd.DataFrame(columns=GBD_LONG_COLUMNS)
+    return pd.concat(chunks, ignore_index=True).reindex(columns=GBD_LONG_COLUMNS)
+
+
+def summarise_gbd(long_df: pd.DataFrame, condition: str,
+                  location: str = DEFAULT_IHME_LOCATION, source_file: Optional[str] = None,
+                  metric: Optional[str] = DEFAULT_IHME_METRIC) -> pd.DataFrame:
+    """
+    Average one GBD export's values per year and measure, for one condition and location.
+
+    Exports of different causes (e.g. IHD and stroke, both CVD) are never
+    pooled: only the rows of ``source_file`` are summarised. It defaults to
+    the condition's last export in the table, the one the summary has always
+    been built from. Only rows of ``metric`` are averaged (None averages
+    every metric); an export without a metric column is averaged whole.
+
+    Returns:
+        Validated HealthMetricRecord rows, ordered by year and then in
+        IHME_MEASURES order.
+    """
+    rows = long_df[long_df["condition"] == condition]
+    if source_file is None and not rows.empty:
+        source_file = rows["source_file"].iloc[-1]
+    rows = rows[(rows["source_file"] == source_file)
+                & rows["location"].str.contains(_location_pattern([location]), na=False)]
+    if metric is not None and rows["metric"].notna().any():
+        rows = rows[rows["metric"].astype(str).str.lower() == metric.lower()]
+    return _gbd_metrics([_measure_totals(rows)], condition)
+
+
+def _measure_totals(rows: pd.DataFrame) -> pd.DataFrame:
+    """Sum and count of the GBD values per (year, measure) in ``rows``."""
+    measure_key = pd.Categorical(_first_match(rows["measure"], IHME_MEASURE_PATTERN), categories=list(IHME_MEASURES))
+    return (rows.assign(measure_key=measure_key)
+            .groupby(["year", "measure_key"], observed=True)["val"].agg(["sum", "count"]).reset_index())
+
+
+def _gbd_metrics(totals: List[pd.DataFrame], condition: str) -> pd.DataFrame:
+    """
+    Combine per-chunk totals (see _measure_totals) into mean values per year and measure.
+
+    Returns:
+        Validated HealthMetricRecord rows, ordered by year and then in
+        IHME_MEASURES order.
+    """
+    combined = (pd.concat(totals, ignore_index=True)
+                .groupby(["year", "measure_key"], observed=True)[["sum", "count"]].sum())
+    means = (combined["sum"] / combined["count"].where(combined["count"] > 0)).dropna().rename("val").reset_index()
+    measure = means["measure_key"].astype(str)
+
+    return validate_health_metrics(pd.DataFrame({
+        "Year": means["year"],
+        "Metric": condition + "_" + measure.map(IHME_MEASURES) + "_GBD",
+        "Value": means["val"],
+        "Source": "IHME_GBD",
+        "Measure": measure.str.capitalize(),
+    }))
+
+
+def process_ihme_csv(source: Path, condition: str, member: Optional[str] = None,
+                     chunksize: int = IHME_CHUNK_SIZE, location: str = DEFAULT_IHME_LOCATION,
+                     metric: Optional[str] = DEFAULT_IHME_METRIC) -> pd.DataFrame:
+    """
+    Average a single GBD export's values per year and measure for one condition (see summarise_gbd).
+
+    Each chunk is reduced to per-(year, measure) sums and counts as it is
+    streamed, so the export's rows are never held together in memory.
+    """
+    totals = [_measure_totals(chunk) for chunk in iter_ihme_chunks(source, member, chunksize, [location], metric)]
+    if not totals:
+        totals = [_measure_totals(pd.DataFrame(columns=GBD_LONG_COLUMNS))]
+    return _gbd_metrics(totals, condition)
+
 
 def process_ihme_gbd(
     zip_path: Path = IHME_ZIP,
-    extract_dir: Path = IHME_EXTRACTED_DIR,
     dementia_out: Path = IHME_DEMENTIA_OUT,
     cvd_out: Path = IHME_CVD_OUT,
-) -> None:
-    """Extract and clean IHME GBD CSVs for Dementia and CVD."""
-    extracted = extract_ihme_zip(zip_path, extract_dir)
-    if extracted is None:
-        return
+    long_out: Path = IHME_LONG_OUT,
+    locations: Optional[Sequence[str]] = None,
+    chunksize: int = IHME_CHUNK_SIZE,
+) -> Dict[Path, pd.DataFrame]:
+    """Stream every IHME GBD CSV out of the zip in one scan and build the GBD outputs.
+
+    The long-format table holds every metric and kept location
+    (``config.GBD_LOCATIONS`` by default; Australia is always included). The
+    Dementia and CVD metrics are summarised from its Rate rows for Australia,
+    each from the condition's last export in the zip.
+    Returns the saved tables keyed by output path (empty if nothing was processed).
+    """
+    outputs: Dict[Path, pd.DataFrame] = {}
+    if not zip_path.exists():
+        logger.warning(f"IHME GBD zip file not found: {zip_path}. Please download and place it in data/raw/.")
+        return outputs
 
     try:
-        csvs = find_ihme_csvs(extract_dir)
-        
-        # Process Dementia data
-        if csvs["dementia"] and csvs["dementia"].exists():
-            dementia_records = process_ihme_csv(csvs["dementia"], "Dementia")
-            dementia_df = pd.DataFrame([r.dict() for r in dementia_records])
-            dementia_out.parent.mkdir(parents=True, exist_ok=True)
-            dementia_df.to_csv(dementia_out, index=False)
-            logger.info(f"IHME Dementia metrics saved to {dementia_out}")
-        else:
-            logger.warning("IHME Dementia CSV not found in extracted zip.")
-        
-        # Process CVD data
-        if csvs["cvd"] and csvs["cvd"].exists():
-            cvd_records = process_ihme_csv(csvs["cvd"], "CVD")
-            cvd_df = pd.DataFrame([r.dict() for r in cvd_records])
-            cvd_out.parent.mkdir(parents=True, exist_ok=True)
-            cvd_df.to_csv(cvd_out, index=False)
-            logger.info(f"IHME CVD metrics saved to {cvd_out}")
-        else:
-            logger.warning("IHME CVD CSV not found in extracted zip.")
-            
+        locations = list(dict.fromkeys([DEFAULT_IHME_LOCATION, *(locations or config.GBD_LOCATIONS)]))
+        members = classify_ihme_members(zip_path)
+        long_df = extract_gbd_long(zip_path, members, locations=locations, chunksize=chunksize)
+        long_out.parent.mkdir(parents=True, exist_ok=True)
+        write_dataset(long_df, long_out)
+        outputs[long_out] = long_df
+        logger.info(f"IHME GBD long-format table ({len(long_df)} rows, {len(locations)} locations) saved to {long_out}")
+
+        for condition, out_path in [("Dementia", dementia_out), ("CVD", cvd_out)]:
+            if not members[condition]:
+                logger.warning(f"IHME {condition} CSV not found in {zip_path.name}.")
+                continue
+            if len(members[condition]) > 1:
+                logger.warning(f"Several IHME {condition} CSVs in {zip_path.name}; summarising "
+                               f"{members[condition][-1]} only (all are kept in the long-format table)")
+            metrics_df = summarise_gbd(long_df, condition, source_file=members[condition][-1])
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            write_dataset(metrics_df, out_path)
+            outputs[out_path] = metrics_df
+            logger.info(f"IHME {condition} metrics saved to {out_path}")
+        return outputs
+
     except Exception as e:
         logger.error(f"Error processing IHME GBD data: {e}")
         raise
-    finally:
-        # Clean up extracted files
-        if extract_dir.exists():
-            shutil.rmtree(extract_dir)
-            logger.info("Cleaned up extracted IHME files")
 
 if __name__ == "__main__":
     process_abs_cod()
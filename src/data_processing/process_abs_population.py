@@ -4,12 +4,21 @@ Processes the raw ABS National, State and Territory Population data.
 Reads the downloaded Excel file, selects the relevant sheet and columns
 (Year and Australian Population), standardises column names, and saves
 the result to the staging directory.
+
+Only the date and population columns are read, streamed in openpyxl's
+read-only mode, and only December quarter rows are kept while reading. The
+annual series is cached by workbook hash, so re-runs over an unchanged
+workbook skip Excel parsing altogether.
 """
 
+import datetime
 import pandas as pd
 from pathlib import Path
 import logging
+from typing import List, Optional
 from src import config
+from src.data_processing.excel_streaming import StreamingWorkbook, cached_sheet_frame
+from src.pipeline.storage import write_dataset
 
 # --- Configuration ---
 RAW_POPULATION_FILE = config.RAW_DATA_DIR / config.ABS_POPULATION_FILENAME
@@ -30,82 +39,88 @@ OUTPUT_DATE_COLUMN = 'Date' # Temporary name before extracting year
 OUTPUT_YEAR_COLUMN = 'Year'
 OUTPUT_POPULATION_COLUMN = 'Population'
 
+# Parsed annual series, keyed by workbook hash
+CACHE_DIR = config.EXCEL_CACHE_DIR
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-def process_abs_population_data():
-    """Loads, cleans, and saves the ABS population data."""
-    logging.info(f"Starting processing of ABS population data: {RAW_POPULATION_FILE}")
+def _is_december_row(values: List, index: int) -> bool:
+    """Keep rows whose date cell is in December (rows with unparseable dates are dropped)."""
+    value = values[0]
+    if isinstance(value, str):
+        try:
+            value = pd.Timestamp(value)
+        except (ValueError, OverflowError):
+            return False
+    return isinstance(value, datetime.date) and value.month == 12
+
 
+def read_december_population(workbook_path: Path) -> pd.DataFrame:
+    """Read the December quarter date and population columns of the population sheet."""
+    with StreamingWorkbook(workbook_path) as workbook:
+        df = workbook.read_columns(EXPECTED_SHEET_NAME, [DATE_COLUMN_INDEX, POPULATION_COLUMN_INDEX],
+                                   skiprows=9, keep=_is_december_row)
+    df.columns = [OUTPUT_DATE_COLUMN, OUTPUT_POPULATION_COLUMN]
+    return df
+
+
+def annual_population(df: pd.DataFrame) -> pd.DataFrame:
+    """Turn December quarter Date/Population rows into the Year/Population series."""
+    df_processed = df.copy()
+    # Convert time column to Year (handle potential datetime objects)
     try:
-        # Attempt to read the specific sheet
-        # Skip the first 9 metadata rows, use default integer headers
-        df = pd.read_excel(RAW_POPULATION_FILE, sheet_name=EXPECTED_SHEET_NAME, skiprows=9, header=None)
-        logging.info(f"Successfully read sheet '{EXPECTED_SHEET_NAME}' from {RAW_POPULATION_FILE.name} (skipped first 9 rows, using integer headers)")
-        # logging.info(f"Original columns after skipping rows: {df.columns.tolist()}") # Less useful with int headers
-
-        # --- Data Selection and Cleaning ---
-        # Select columns by index
-        if df.shape[1] <= max(DATE_COLUMN_INDEX, POPULATION_COLUMN_INDEX):
-            logging.error(f"Error: Expected at least {max(DATE_COLUMN_INDEX, POPULATION_COLUMN_INDEX) + 1} columns after skipping rows, but found only {df.shape[1]}. Cannot select by index.")
-            raise ValueError("Incorrect number of columns found.")
-
-        df_processed = df[[DATE_COLUMN_INDEX, POPULATION_COLUMN_INDEX]].copy()
-        # Assign standard names
-        df_processed.columns = [OUTPUT_DATE_COLUMN, OUTPUT_POPULATION_COLUMN]
-
-        # Convert time column to Year (handle potential datetime objects)
-        try:
-             # Convert to datetime, coercing errors to NaT
-             original_date_col = df_processed[OUTPUT_DATE_COLUMN]
-             df_processed[OUTPUT_DATE_COLUMN] = pd.to_datetime(original_date_col, errors='coerce')
-             
-             # Log how many rows had parsing errors
-             nat_count = df_processed[OUTPUT_DATE_COLUMN].isna().sum()
-             if nat_count > 0:
-                  logging.warning(f"Coerced {nat_count} non-date values to NaT in the date column. Original problematic values head:\n{original_date_col[df_processed[OUTPUT_DATE_COLUMN].isna()].head()}")
-             
-             # Drop rows where date conversion failed
-             df_processed.dropna(subset=[OUTPUT_DATE_COLUMN], inplace=True)
-             
-             # Filter for December quarter data to get annual figures
-             df_processed = df_processed[df_processed[OUTPUT_DATE_COLUMN].dt.month == 12].copy()
-             logging.info(f"Filtered data to keep only December quarter rows. Shape after filtering: {df_processed.shape}")
-
-             # Extract year
-             df_processed[OUTPUT_YEAR_COLUMN] = df_processed[OUTPUT_DATE_COLUMN].dt.year
-             logging.info(f"Extracted year from '{OUTPUT_DATE_COLUMN}' column after coercing errors.")
-             
-        except Exception as e:
-             logging.error(f"Failed to extract year from '{OUTPUT_DATE_COLUMN}' (index {DATE_COLUMN_INDEX}) even after coercing. Error: {e}")
-             raise ValueError(f"Could not process date column.")
-
-        # Rename population column - already done above
-        # df_processed = df_processed.rename(columns={POPULATION_COLUMN_HEADER: OUTPUT_POPULATION_COLUMN})
-
-        # Keep only Year and Population
-        df_processed = df_processed[[OUTPUT_YEAR_COLUMN, OUTPUT_POPULATION_COLUMN]]
-
-        # Ensure Population is numeric, coercing errors
-        df_processed[OUTPUT_POPULATION_COLUMN] = pd.to_numeric(df_processed[OUTPUT_POPULATION_COLUMN], errors='coerce')
-        
-        # Drop rows where population is NaN after coercion (optional, depends on data quality)
-        df_processed.dropna(subset=[OUTPUT_POPULATION_COLUMN], inplace=True)
-        
-        # Convert Population to integer
-        df_processed[OUTPUT_POPULATION_COLUMN] = df_processed[OUTPUT_POPULATION_COLUMN].astype(int)
+         df_processed[OUTPUT_DATE_COLUMN] = pd.to_datetime(df_processed[OUTPUT_DATE_COLUMN], errors='coerce')
+         df_processed.dropna(subset=[OUTPUT_DATE_COLUMN], inplace=True)
+         df_processed[OUTPUT_YEAR_COLUMN] = df_processed[OUTPUT_DATE_COLUMN].dt.year
+         logging.info(f"Extracted year from '{OUTPUT_DATE_COLUMN}' column for {len(df_processed)} December quarter rows.")
+    except Exception as e:
+         logging.error(f"Failed to extract year from '{OUTPUT_DATE_COLUMN}' (index {DATE_COLUMN_INDEX}) even after coercing. Error: {e}")
+         raise ValueError(f"Could not process date column.")
+
+    # Keep only Year and Population
+    df_processed = df_processed[[OUTPUT_YEAR_COLUMN, OUTPUT_POPULATION_COLUMN]]
 
+    # Ensure Population is numeric, coercing errors
+    df_processed[OUTPUT_POPULATION_COLUMN] = pd.to_numeric(df_processed[OUTPUT_POPULATION_COLUMN], errors='coerce')
+
+    # Drop rows where population is NaN after coercion (optional, depends on data quality)
+    df_processed.dropna(subset=[OUTPUT_POPULATION_COLUMN], inplace=True)
+
+    # Convert Population to integer
+    df_processed[OUTPUT_POPULATION_COLUMN] = df_processed[OUTPUT_POPULATION_COLUMN].astype(int)
+    return df_processed.reset_index(drop=True)
+
+
+def process_abs_population_data(cache_dir: Optional[Path] = CACHE_DIR) -> Optional[pd.DataFrame]:
+    """Loads, cleans, and saves the ABS population data.
+
+    Args:
+        cache_dir: Cache for the parsed series; None always parses the workbook.
+
+    Returns:
+        The processed Year/Population frame, or None if processing failed.
+    """
+    logging.info(f"Starting processing of ABS population data: {RAW_POPULATION_FILE}")
+
+    try:
+        # Stream only the date and population columns, keeping December quarter rows as they are read
+        df_processed = cached_sheet_frame(
+            RAW_POPULATION_FILE, f"{EXPECTED_SHEET_NAME}-annual",
+            lambda: annual_population(read_december_population(RAW_POPULATION_FILE)), cache_dir)
+        logging.info(f"Read annual population from sheet '{EXPECTED_SHEET_NAME}' of {RAW_POPULATION_FILE.name} (skipped first 9 rows)")
 
         # --- Save Processed Data ---
         # Ensure the processed directory exists
         PROCESSED_POPULATION_FILE.parent.mkdir(parents=True, exist_ok=True)
         # config.STAGING_DATA_DIR.mkdir(parents=True, exist_ok=True)
         # df_processed.to_csv(STAGING_POPULATION_FILE, index=False)
-        df_processed.to_csv(PROCESSED_POPULATION_FILE, index=False)
+        write_dataset(df_processed, PROCESSED_POPULATION_FILE)
         # logging.info(f"Successfully processed and saved data to {STAGING_POPULATION_FILE}")
         logging.info(f"Successfully processed and saved data to {PROCESSED_POPULATION_FILE}")
         logging.info(f"Processed data shape: {df_processed.shape}")
         logging.info(f"Processed data head:\n{df_processed.head()}")
+        return df_processed
 
 
     except FileNotFoundError:
@@ -12,11 +12,15 @@ ensuring proper header detection and data transformation before concatenation.
 
 import pandas as pd
 import os
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 import sys
 from pathlib import Path
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
 import numpy as np
 import re
+import hashlib
+import json
 import argparse
 from datetime import datetime
 from enum import Enum
@@ -27,7 +31,11 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 # Import models using absolute import
+from pydantic import BaseModel, Field
+
 from src.models.aihw_models import AIHWRecord, AIHWDataset, MetricType
+from src.data_processing.excel_streaming import RowPredicate, StreamingWorkbook
+from src.pipeline.storage import write_dataset
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
@@ -54,10 +62,12 @@ def transform_sheet_data(df: pd.DataFrame, sheet_name: str) -> pd.DataFrame:
 def extract_table_name(df: pd.DataFrame, sheet_name: str) -> Optional[str]:
     """Extract the table name from the first few rows or use sheet name as fallback."""
     # First try to find a table title in the first few rows
-    for i in range(min(10, len(df))):
-        cell = str(df.iloc[i, 0])
-        match = TABLE_PATTERN.search(cell)
-        if match:
+    if df.shape[1] > 0:
+        cells = df.iloc[:10, 0].astype(str)
+        titled = np.flatnonzero(cells.map(lambda cell: TABLE_PATTERN.search(cell) is not None).to_numpy())
+        if len(titled):
+            cell = cells.iloc[titled[0]]
+            match = TABLE_PATTERN.search(cell)
             title = match.group(1) if match.group(1) else cell
             # Remove date ranges and clean up
             title = re.sub(r'between \d{4} and \d{4}', '', title).strip()
@@ -101,53 +111,47 @@ def extract_year(text: str) -> Optional[int]:
         return None
     return None
 
+HEADER_INDICATORS = {
+    'sex', 'age', 'year', 'number', 'rate', 'total', 'male', 'female', 'persons',
+    'deaths', 'mortality', 'prevalence', 'men', 'women'
+}
+# Rows searched for a header row, plus the subheader rows that may follow it
+HEADER_SCAN_ROWS = 15
+SUBHEADER_ROWS = 3
+
+
+def _cell_text(df: pd.DataFrame) -> pd.DataFrame:
+    """Stripped string form of every cell, '' where the cell is empty."""
+    return df.astype(str).apply(lambda col: col.str.strip()).where(df.notna(), '')
+
+
 def find_header_row(df: pd.DataFrame) -> Tuple[int, Dict[str, str]]:
     """Find the header row and column mappings in a DataFrame."""
-    header_indicators = {
-        'sex', 'age', 'year', 'number', 'rate', 'total', 'male', 'female', 'persons',
-        'deaths', 'mortality', 'prevalence', 'men', 'women'
-    }
-    
-    # Look for header row in first 15 rows
-    for i in range(min(15, len(df))):
-        row_values = set(str(x).lower().strip() for x in df.iloc[i] if pd.notna(x))
-        
-        # Check if this row contains header indicators
-        if any(x in row_values for x in header_indicators):
-            # Initialize column names
-            col_names = {}
-            
-            # Check next few rows for potential subheaders
-            max_subheader_rows = min(i + 3, len(df))
-            subheaders = []
-            
-            for j in range(i, max_subheader_rows):
-                row = df.iloc[j]
-                if not row.isna().all():  # Skip empty rows
-                    subheaders.append(row)
-            
-            # Combine headers if multiple header rows found
-            if len(subheaders) > 1:
-                for col_idx in range(len(df.columns)):
-                    col_parts = []
-                    for subheader in subheaders:
-                        val = str(subheader.iloc[col_idx]).strip()
-                        if pd.notna(val) and val.lower() not in ('nan', ''):
-                            col_parts.append(val)
-                    col_names[df.columns[col_idx]] = ' '.join(col_parts)
-            else:
-                # Single header row
-                for j, col in enumerate(df.columns):
-                    name = str(df.iloc[i, j]).strip()
-                    col_names[col] = name if name.lower() not in ('nan', '') else f'column_{j}'
-            
-            # Clean up column names
-            col_names = {k: v.replace('\n', ' ').strip() for k, v in col_names.items()}
-            
-            return i, col_names
-    
-    # If no header row found, use default column names
-    return 0, {col: f'column_{i}' for i, col in enumerate(df.columns)}
+    # Look for header row in first 15 rows: any cell that is a header indicator
+    top = df.iloc[:HEADER_SCAN_ROWS]
+    is_indicator = _cell_text(top).apply(lambda col: col.str.lower()).isin(HEADER_INDICATORS) & top.notna()
+    header_rows = np.flatnonzero(is_indicator.any(axis=1).to_numpy())
+    if not len(header_rows):
+        # If no header row found, use default column names
+        return 0, {col: f'column_{i}' for i, col in enumerate(df.columns)}
+    i = int(header_rows[0])
+
+    # Check next few rows for potential subheaders, skipping empty rows
+    candidates = df.iloc[i:i + SUBHEADER_ROWS]
+    subheaders = candidates[~candidates.isna().all(axis=1).to_numpy()].astype(str)
+    subheaders = subheaders.apply(lambda col: col.str.strip())
+    subheaders = subheaders.where(subheaders.apply(lambda col: col.str.lower()) != 'nan', '')
+
+    if len(subheaders) > 1:
+        # Combine headers if multiple header rows found
+        names = [' '.join(part for part in subheaders.iloc[:, j] if part) for j in range(df.shape[1])]
+    else:
+        # Single header row
+        names = [part if part else f'column_{j}' for j, part in enumerate(subheaders.iloc[0])]
+
+    # Clean up column names
+    return i, {col: name.replace('\n', ' ').strip() for col, name in zip(df.columns, names)}
+
 
 def standardize_column_name(name: str) -> str:
     """Convert column name to standard format."""
@@ -157,346 +161,544 @@ def standardize_column_name(name: str) -> str:
     name = name.strip('_')
     return name or 'unnamed'
 
-def process_sheet(df: pd.DataFrame, sheet_name: str, file_name: str) -> List[AIHWRecord]:
+# Record frame columns, in AIHWRecord field order
+RECORD_COLUMNS = list(AIHWRecord.model_fields)
+SEX_ALIASES = {
+    'm': 'male', 'male': 'male', 'males': 'male', 'men': 'male',
+    'f': 'female', 'female': 'female', 'females': 'female', 'women': 'female',
+    'p': 'persons', 'person': 'persons', 'persons': 'persons', 'people': 'persons', 'all': 'persons',
+}
+def _to_number(values: pd.Series) -> pd.Series:
+    """Bulk ``float(str(v).replace(',', ''))``; cells that do not parse become NaN."""
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype(float)
+    text = values.astype(str).str.replace(',', '', regex=False).str.strip()
+    return pd.to_numeric(text, errors='coerce')
+
+
+def _to_year(values: pd.Series) -> pd.Series:
+    """Bulk ``int(float(v))`` for a year column; cells that do not parse become <NA>."""
+    return np.trunc(_to_number(values)).astype('Int64')
+
+
+def _block_end(first_col: pd.Series, start: int, is_end: pd.Series) -> int:
+    """Position of the first row at or after ``start`` flagged by ``is_end`` (the table end)."""
+    flagged = np.flatnonzero(is_end.to_numpy()[start:])
+    return start + int(flagged[0]) if len(flagged) else len(first_col)
+
+
+def _melt_cells(block: pd.DataFrame, years: pd.Series, columns: List[Tuple[int, Dict]], label: str,
+                row_fields: Optional[Dict[str, pd.Series]] = None, **constants) -> pd.DataFrame:
     """
-    Process a single sheet into AIHW records.
+    Melt a table block's value cells into record columns.
 
-    This function is robust to both raw Excel-like DataFrames (with headers in the first column/row)
-    and already-cleaned DataFrames (with proper column names and no header rows in the data).
-    Special handling is provided for S2.4, S3.5, and Table 11 (CVD Mortality) sheets.
-    All code and comments use Australian English.
+    Cells are laid out row by row (as the table reads). Each column position
+    carries its own fields (e.g. the sex or metric type it holds), each row
+    its year and any ``row_fields``. Empty cells and rows without a year are
+    dropped; cells that are not numbers are dropped with a warning.
+    """
+    columns = [(position, fields) for position, fields in columns if position < block.shape[1]]
+    if block.empty or not columns:
+        return pd.DataFrame(columns=RECORD_COLUMNS)
+    cells = block.iloc[:, [position for position, _ in columns]].to_numpy(dtype=object)
+    frame = pd.DataFrame({
+        'year': np.repeat(years.to_numpy(), len(columns)),
+        'raw': cells.ravel(),
+    })
+    for field in columns[0][1]:
+        frame[field] = np.tile(np.array([fields[field] for _, fields in columns], dtype=object), len(block))
+    for field, values in (row_fields or {}).items():
+        frame[field] = np.repeat(values.to_numpy(dtype=object), len(columns))
+    frame = frame[frame['year'].notna() & frame['raw'].notna()]
+    frame['value'] = _to_number(frame['raw'])
+    unparsed = frame['value'].isna()
+    if unparsed.any():
+        logger.warning(f"{label}: skipped {int(unparsed.sum())} non-numeric values, "
+                       f"e.g. {frame.loc[unparsed, 'raw'].iloc[0]!r}")
+    frame = frame[~unparsed].drop(columns='raw')
+    for field, value in constants.items():
+        frame[field] = value
+    return frame.reindex(columns=RECORD_COLUMNS)
 
-    Args:
-        df: The input DataFrame, either raw (as read from Excel) or already cleaned.
-        sheet_name: The name of the sheet being processed.
-        file_name: The name of the file being processed.
 
-    Returns:
-        List[AIHWRecord]: List of extracted records.
+def _first_digit_row(first_col: pd.Series) -> Optional[int]:
+    """Position of the first row whose first cell is a bare number (a year), or None."""
+    is_digit = first_col.notna() & first_col.astype(str).str.strip().str.isdigit()
+    positions = np.flatnonzero(is_digit.to_numpy())
+    return int(positions[0]) if len(positions) else None
+
+
+class ColumnSpec(BaseModel):
+    """A value column of a fixed-layout table and the record fields its cells carry."""
+    position: int = Field(..., ge=0)
+    sex: Optional[str] = None
+    metric_type: Optional[MetricType] = None
+
+
+class TableSpec(BaseModel):
     """
-    table_name = extract_table_name(df, sheet_name)
-    logger.info(f"Processing Sheet: '{sheet_name}', Table: '{table_name}'")
-    
-    # Add debug logging for CVD data
-    if "AIHW-CVD-92" in file_name:
-        logger.debug(f"Processing CVD data from sheet {sheet_name}")
-        logger.debug(f"DataFrame head:\n{df.head()}")
-        logger.debug(f"DataFrame columns: {df.columns.tolist()}")
-    
-    records = []
+    Declarative description of a fixed-layout AIHW table.
 
-    # --- Special Handling for Table 11 (CVD Mortality) ---
-    if sheet_name == "All CVD" and "AIHW-CVD-92" in file_name:
-        logger.info("Applying special handling for CVD Table 11")
-        
-        # Find Table 11
-        table_start_idx = None
-        for i in range(len(df)):
-            if pd.notna(df.iloc[i, 0]) and "Table 11" in str(df.iloc[i, 0]):
-                table_start_idx = i
-                break
-        
-        if table_start_idx is not None:
-            # Data starts 3 rows after table title (year, number headers, sex headers)
-            data_start_idx = table_start_idx + 3
-            
-            # Process each row
-            for idx in range(data_start_idx, len(df)):
-                row = df.iloc[idx]
-                
-                # Stop if we hit empty row or notes
-                if pd.isna(row[0]) or str(row[0]).lower().startswith('note'):
-                    break
-                
-                try:
-                    # Extract year
-                    year = int(float(row[0]))
-                    
-                    # Process deaths (columns 1-3)
-                    for col_idx, sex in [(1, "men"), (2, "women"), (3, "persons")]:
-                        if pd.notna(row[col_idx]):
-                            try:
-                                value = float(str(row[col_idx]).replace(',', ''))
-                                records.append(AIHWRecord(
-                                    year=year,
-                                    value=value,
-                                    metric_type=MetricType.NUMBER,
-                                    source_sheet="Table 11",
-                                    sex=sex,
-                                    age_group="all_ages",
-                                    table_name="Cardiovascular disease deaths",
-                                    condition="Cardiovascular Disease"
-                                ))
-                            except (ValueError, TypeError) as e:
-                                logger.warning(f"Error converting deaths value in row {idx}, col {col_idx}: {e}")
-                    
-                    # Process age-standardised rates (columns 7-9)
-                    for col_idx, sex in [(7, "men"), (8, "women"), (9, "persons")]:
-                        if pd.notna(row[col_idx]):
-                            try:
-                                value = float(str(row[col_idx]).replace(',', ''))
-                                records.append(AIHWRecord(
-                                    year=year,
-                                    value=value,
-                                    metric_type=MetricType.STANDARDISED_RATE,
-                                    source_sheet="Table 11",
-                                    sex=sex,
-                                    age_group="all_ages",
-                                    table_name="Cardiovascular disease deaths",
-                                    condition="Cardiovascular Disease"
-                                ))
-                            except (ValueError, TypeError) as e:
-                                logger.warning(f"Error converting rate value in row {idx}, col {col_idx}: {e}")
-                
-                except Exception as e:
-                    logger.warning(f"Error processing CVD row {idx}: {e}")
-                    continue
-            
-            logger.info(f"Extracted {len(records)} CVD records from Table 11")
-            return records
+    The table is found by its anchor text in the first column (or, without an
+    anchor, by its first year row) and runs until an empty first cell or one
+    starting with an end prefix. Each row holds a year in the first column and
+    values in the spec's columns.
+    """
+    name: str = Field(..., description="Layout kind recorded for sheets holding this table")
+    label: str = Field(..., description="Name used in log messages")
+    sheet: str
+    file_marker: str = Field(..., description="Text that identifies the workbook in its file name")
+    anchor: Optional[str] = Field(None, description="First-column text of the title row; None starts at the first year row")
+    data_offset: int = Field(0, ge=0, description="Rows from the anchor row to the first data row")
+    end_prefixes: Tuple[str, ...] = Field((), description="Lower-case first-column prefixes that also end the table")
+    columns: List[ColumnSpec]
+    condition_from_header: bool = Field(False, description="Take each column's condition from the row above the data")
+    fields: Dict[str, object] = Field(default_factory=dict, description="Record fields shared by every value")
 
-    # --- Special Handling for S2.4 (Dementia Prevalence) ---
-    elif sheet_name == "S2.4" and "AIHW-DEM-02-S2-Prevalence" in file_name:
-        logger.info("Applying special handling for Sheet S2.4")
-        
-        # Find data start (after headers)
-        data_start = None
-        for i in range(len(df)):
-            if pd.notna(df.iloc[i, 0]) and str(df.iloc[i, 0]).strip().isdigit():
-                data_start = i
-                break
-        
-        if data_start is not None:
-            # Process each row
-            for idx in range(data_start, len(df)):
-                row = df.iloc[idx]
-                
-                # Stop if we hit empty row
-                if pd.isna(row[0]):
-                    break
-                
-                try:
-                    year = int(float(row[0]))
-                    # Process men, women, persons (columns 1-3)
-                    for col_idx, sex in [(1, "men"), (2, "women"), (3, "persons")]:
-                        if pd.notna(row[col_idx]):
-                            try:
-                                value = float(str(row[col_idx]).replace(',', ''))
-                                records.append(AIHWRecord(
-                                    year=year,
-                                    value=value,
-                                    metric_type=MetricType.NUMBER,
-                                    source_sheet="S2.4",
-                                    sex=sex,
-                                    age_group="all_ages",
-                                    table_name="Australians living with dementia",
-                                    condition="Dementia"
-                                ))
-                            except (ValueError, TypeError) as e:
-                                logger.warning(f"Error converting value in row {idx}, col {col_idx}: {e}")
-                
-                except Exception as e:
-                    logger.warning(f"Error processing dementia prevalence row {idx}: {e}")
-                    continue
-            
-            logger.info(f"Extracted {len(records)} dementia prevalence records from S2.4")
-            return records
+    def matches(self, sheet_name: str, file_name: str) -> bool:
+        return sheet_name == self.sheet and self.file_marker in file_name
 
-    # --- Special Handling for S3.5 (Dementia Mortality) ---
-    elif sheet_name == "S3.5" and "AIHW-DEM-02-S3-Mortality" in file_name:
-        logger.info("Applying special handling for Sheet S3.5")
-        
-        # Find data start (after headers)
-        data_start = None
-        for i in range(len(df)):
-            if pd.notna(df.iloc[i, 0]) and str(df.iloc[i, 0]).strip().isdigit():
-                data_start = i
-                break
-        
-        if data_start is not None:
-            # Get column headers from row before data
-            headers = df.iloc[data_start-1]
-            
-            # Process each row
-            for idx in range(data_start, len(df)):
-                row = df.iloc[idx]
-                
-                # Stop if we hit empty row
-                if pd.isna(row[0]):
-                    break
-                
-                try:
-                    year = int(float(row[0]))
-                    # Process each type of dementia (columns 4-6)
-                    for col_idx in range(4, 7):
-                        if pd.notna(row[col_idx]) and pd.notna(headers[col_idx]):
-                            try:
-                                value = float(str(row[col_idx]).replace(',', ''))
-                                dementia_type = str(headers[col_idx]).strip()
-                                records.append(AIHWRecord(
-                                    year=year,
-                                    value=value,
-                                    metric_type=MetricType.STANDARDISED_RATE,
-                                    source_sheet="S3.5",
-                                    sex="persons",
-                                    age_group="all_ages",
-                                    table_name="Deaths due to dementia",
-                                    condition=dementia_type
-                                ))
-                            except (ValueError, TypeError) as e:
-                                logger.warning(f"Error converting value in row {idx}, col {col_idx}: {e}")
-                
-                except Exception as e:
-                    logger.warning(f"Error processing dementia mortality row {idx}: {e}")
-                    continue
-            
-            logger.info(f"Extracted {len(records)} dementia mortality records from S3.5")
-            return records
 
-    # --- Standard Processing Logic (Fallback) ---
-    logger.info(f"Applying standard processing for Sheet: '{sheet_name}'")
-    header_row_idx, col_map = find_header_row(df)
+def _sex_columns(first_position: int, metric_type: MetricType) -> List[ColumnSpec]:
+    """Men, women and persons columns from ``first_position`` onwards."""
+    return [ColumnSpec(position=first_position + offset, sex=sex, metric_type=metric_type)
+            for offset, sex in enumerate(["men", "women", "persons"])]
+
+
+# Fixed-layout tables; adding a table is a new entry here
+TABLE_SPECS = [
+    # Crude rates (columns 4-6) are not extracted
+    TableSpec(name="table_11", label="Table 11", sheet="All CVD", file_marker="AIHW-CVD-92",
+              anchor="Table 11", data_offset=3, end_prefixes=("note",),
+              columns=_sex_columns(1, MetricType.NUMBER) + _sex_columns(7, MetricType.STANDARDISED_RATE),
+              fields={'source_sheet': "Table 11", 'age_group': "all_ages",
+                      'table_name': "Cardiovascular disease deaths", 'condition': "Cardiovascular Disease"}),
+    TableSpec(name="s2.4", label="S2.4", sheet="S2.4", file_marker="AIHW-DEM-02-S2-Prevalence",
+              columns=_sex_columns(1, MetricType.NUMBER),
+              fields={'source_sheet': "S2.4", 'age_group': "all_ages",
+                      'table_name': "Australians living with dementia", 'condition': "Dementia"}),
+    # Dementia types are the column headers in the row before the data
+    TableSpec(name="s3.5", label="S3.5", sheet="S3.5", file_marker="AIHW-DEM-02-S3-Mortality",
+              columns=[ColumnSpec(position=position) for position in (4, 5, 6)], condition_from_header=True,
+              fields={'metric_type': MetricType.STANDARDISED_RATE, 'source_sheet': "S3.5", 'sex': "persons",
+                      'age_group': "all_ages", 'table_name': "Deaths due to dementia"}),
+]
+
+
+def table_spec_named(name: str) -> TableSpec:
+    """The spec in TABLE_SPECS called ``name``; raises KeyError if there is none."""
+    spec = next((spec for spec in TABLE_SPECS if spec.name == name), None)
+    if spec is None:
+        raise KeyError(f"No table spec named '{name}'")
+    return spec
+
+
+def find_table_spec(sheet_name: str, file_name: str) -> Optional[TableSpec]:
+    """The spec of the fixed-layout table held by this sheet, or None."""
+    return next((spec for spec in TABLE_SPECS if spec.matches(sheet_name, file_name)), None)
 
-    if header_row_idx is None:
+
+def table_spec_bounds(df: pd.DataFrame, spec: TableSpec) -> Optional[Tuple[int, int]]:
+    """Data rows of a spec's table as (start, end) positions, or None if the table is not found."""
+    first_col = df.iloc[:, 0]
+    text = first_col.astype(str)
+    if spec.anchor is not None:
+        anchors = np.flatnonzero((first_col.notna() & text.str.contains(spec.anchor, regex=False)).to_numpy())
+        if not len(anchors):
+            return None
+        data_start = int(anchors[0]) + spec.data_offset
+    else:
+        data_start = _first_digit_row(first_col)
+        if data_start is None:
+            return None
+    is_end = first_col.isna()
+    if spec.end_prefixes:
+        is_end = is_end | text.str.lower().str.startswith(spec.end_prefixes)
+    return data_start, _block_end(first_col, data_start, is_end)
+
+
+def table_spec_frame(df: pd.DataFrame, spec: TableSpec, layout: "SheetLayout") -> pd.DataFrame:
+    """Melt the rows ``layout`` locates for a spec's table into a record frame."""
+    columns = []
+    headers = df.iloc[layout.data_start - 1] if spec.condition_from_header else None
+    for column in spec.columns:
+        if column.position >= df.shape[1]:
+            continue
+        fields = column.model_dump(exclude={'position'}, exclude_none=True)
+        if headers is not None:
+            if pd.isna(headers.iloc[column.position]):
+                continue
+            fields['condition'] = str(headers.iloc[column.position]).strip()
+        columns.append((column.position, fields))
+
+    block = df.iloc[layout.data_start:layout.data_end]
+    years = _to_year(block.iloc[:, 0])
+    if years.isna().any():
+        logger.warning(f"{spec.label}: skipped {int(years.isna().sum())} rows without a valid year")
+    frame = _melt_cells(block, years, columns, spec.label, **spec.fields)
+    logger.info(f"Extracted {len(frame)} records from {spec.label}")
+    return frame
+
+
+def _standard_frame(df: pd.DataFrame, sheet_name: str, layout: "SheetLayout") -> pd.DataFrame:
+    """Records from a sheet with a detectable header row and ``value_<metric>`` columns."""
+    table_name = layout.table_name
+    if layout.data_start is None:
         logger.warning(
             f"Could not determine header row for sheet '{sheet_name}'. Skipping standard processing."
         )
-        return records
+        return pd.DataFrame(columns=RECORD_COLUMNS)
+
+    data_df = df.iloc[layout.data_start:].copy()
+    if data_df.empty or data_df.shape[1] == 0:
+        return pd.DataFrame(columns=RECORD_COLUMNS)
+    data_df.columns = layout.columns
 
-    data_start_row = header_row_idx + 1
-    data_df = df.iloc[data_start_row:].copy()
-    data_df.columns = [
-        standardize_column_name(col_map.get(i, f"unnamed_{i}"))
-        for i in range(len(data_df.columns))
-    ]
+    # Skip empty rows and notes, sources and totals
+    first_col = data_df.iloc[:, 0].astype(str).str.lower()
+    skipped = data_df.isna().all(axis=1) | (
+        data_df.iloc[:, 0].notna() & first_col.str.startswith(("note", "source", "total"))
+    )
+    data_df = data_df[~skipped]
 
+    metadata = extract_frame_metadata(data_df)
     year_col = next((col for col in data_df.columns if "year" in col), None)
+    years = pd.to_numeric(metadata['year'], errors='coerce')
+    if year_col:
+        years = years.fillna(pd.to_numeric(data_df[year_col], errors='coerce'))
     default_year = extract_year_from_table(data_df, table_name)
+    if default_year:
+        years = years.fillna(default_year)
+    years = np.trunc(years).astype('Int64')
+    if years.isna().any():
+        logger.debug(f"Skipping {int(years.isna().sum())} rows in sheet '{sheet_name}' due to missing year.")
 
-    for idx, row in data_df.iterrows():
-        if row.isna().all() or (
-            pd.notna(row.iloc[0])
-            and str(row.iloc[0]).lower().startswith(("note", "source", "total"))
-        ):
+    columns = []
+    for position, col in enumerate(data_df.columns):
+        if not col.startswith("value_"):
             continue
+        try:
+            columns.append((position, {'metric_type': MetricType(col.split("_", 1)[1].replace("_", "-"))}))
+        except ValueError as e:
+            logger.warning(f"Sheet {sheet_name}, Col {col}: Unknown metric type. Error: {e}")
+    if not columns:
+        return pd.DataFrame(columns=RECORD_COLUMNS)
 
-        metadata = extract_row_metadata(row)
-        row_year = (
-            metadata.get("year")
-            or (int(row[year_col]) if year_col and pd.notna(row[year_col]) else None)
-            or default_year
-        )
+    # Per-row sex and age group: explicit columns win over values found elsewhere in the row
+    row_fields = {
+        'sex': data_df['sex'] if 'sex' in data_df.columns else metadata['sex'],
+        'age_group': data_df['age_group'] if 'age_group' in data_df.columns else metadata['age_group'],
+    }
+    return _melt_cells(data_df, years, columns, f"Sheet {sheet_name}", row_fields=row_fields,
+                       source_sheet=sheet_name, table_name=table_name,
+                       condition=extract_condition_from_table(table_name))
 
-        if not row_year:
-            logger.debug(
-                f"Skipping row {idx+data_start_row} in sheet '{sheet_name}' due to missing year."
-            )
-            continue
 
-        for col in data_df.columns:
-            if col.startswith("value_"):
-                metric_type_str = col.split("_", 1)[1]
-                try:
-                    metric_type = MetricType(metric_type_str.replace("_", "-"))
-                    value = pd.to_numeric(row[col], errors="coerce")
-
-                    if pd.notna(value):
-                        sex = row.get("sex", metadata.get("sex"))
-
-                        records.append(
-                            AIHWRecord(
-                                year=row_year,
-                                value=float(value),
-                                metric_type=metric_type,
-                                source_sheet=sheet_name,
-                                sex=sex,
-                                age_group=row.get(
-                                    "age_group", metadata.get("age_group")
-                                ),
-                                table_name=table_name,
-                                condition=extract_condition_from_table(table_name),
-                            )
-                        )
-                except (ValueError, TypeError) as e:
-                    logger.warning(
-                        f"Sheet {sheet_name}, Row {idx+data_start_row}, Col {col}: Error processing value '{row[col]}'. Error: {e}"
-                    )
-                except KeyError as e:
-                    logger.debug(
-                        f"Sheet {sheet_name}, Row {idx+data_start_row}: Missing expected column {e}"
-                    )
-
-    logger.info(
-        f"Sheet {sheet_name}: Extracted {len(records)} records using standard processing."
-    )
+def _normalise_text(values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """Lower-cased, stripped strings (None where missing or empty) and a mask of non-string cells."""
+    present = values.notna() & (values != "")
+    not_text = present & ~values.map(lambda v: isinstance(v, str))
+    text = values.where(present & ~not_text).astype(object)
+    text = text.where(text.isna(), text.str.lower().str.strip())
+    return text.where(text.notna(), None), not_text
+
+
+def validate_record_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Vectorised AIHWRecord validation for a record frame.
+
+    Applies the model's rules column by column: sex and age group are
+    standardised as its validators do, and rows the model would reject (no
+    whole year or a year after 2025, a missing or negative value, an unknown
+    metric type, no source sheet or non-text labels) are dropped with a warning.
+    """
+    frame = frame.reindex(columns=RECORD_COLUMNS)
+    year = pd.to_numeric(frame['year'], errors='coerce')
+    value = pd.to_numeric(frame['value'], errors='coerce')
+    sex, sex_not_text = _normalise_text(frame['sex'])
+    age_group, age_not_text = _normalise_text(frame['age_group'])
+
+    invalid = (year.isna() | (year % 1 != 0) | (year > 2025)
+               | value.isna() | (value < 0)
+               | ~frame['metric_type'].isin(list(MetricType))
+               | frame['source_sheet'].isna() | sex_not_text | age_not_text)
+    if invalid.any():
+        logger.warning(f"Dropped {int(invalid.sum())} records that fail AIHWRecord validation")
+
+    age_group = age_group.where(age_group != 'total', 'all_ages')
+    age_group = (age_group.str.replace('years', '', regex=False).str.replace('yrs', '', regex=False)
+                 .str.strip().str.replace(' ', '', regex=False).str.replace('–', '-', regex=False))
+    valid = ~invalid
+    return frame[valid].assign(
+        year=year[valid].astype('int64'),
+        value=value[valid].astype(float),
+        sex=sex[valid].map(lambda v: SEX_ALIASES.get(v, v), na_action='ignore'),
+        age_group=age_group[valid],
+    ).reset_index(drop=True)
+
+
+def records_from_frame(frame: pd.DataFrame, validate: bool = False) -> List[AIHWRecord]:
+    """
+    Materialise AIHWRecord objects from a validated record frame.
+
+    Rows are trusted by default (``validate_record_frame`` has checked them);
+    with ``validate`` each record is rebuilt through the model, as a debugging
+    check on the vectorised rules. Rows the model rejects are logged and skipped.
+    """
+    frame = frame.reindex(columns=RECORD_COLUMNS).astype(object)
+    rows = frame.where(frame.notna(), None).to_dict('records')
+    if not validate:
+        return [AIHWRecord.model_construct(**row) for row in rows]
+    records = []
+    for row in rows:
+        try:
+            records.append(AIHWRecord(**row))
+        except ValueError as e:
+            logger.warning(f"Record failed model validation: {row}. Error: {e}")
     return records
 
+
+# Bump when detection changes, so layouts cached by an older version are not reused
+LAYOUT_VERSION = 1
+# Rows that header and title detection look at (header scan plus its subheader rows)
+LAYOUT_HEADER_ROWS = HEADER_SCAN_ROWS + SUBHEADER_ROWS
+
+
+class SheetLayout(BaseModel):
+    """Where a sheet's table sits, as found by layout detection."""
+    table_name: str
+    kind: Optional[str] = Field(None, description="Name of the TableSpec the sheet holds, None for standard sheets")
+    data_start: Optional[int] = Field(None, ge=0, description="Position of the first data row")
+    data_end: Optional[int] = Field(None, ge=0, description="Position after the last data row (TableSpec tables)")
+    columns: List[str] = Field(default_factory=list, description="Standardised column names (standard sheets)")
+
+
+def detect_layout(df: pd.DataFrame, sheet_name: str, file_name: str) -> SheetLayout:
+    """Find a sheet's table name, table boundaries, header row and column names."""
+    table_name = extract_table_name(df, sheet_name)
+    spec = find_table_spec(sheet_name, file_name)
+    if spec is not None and df.shape[1] > 0:
+        bounds = table_spec_bounds(df, spec)
+        if bounds is not None:
+            return SheetLayout(table_name=table_name, kind=spec.name, data_start=bounds[0], data_end=bounds[1])
+        logger.info(f"{spec.label} not found in sheet '{sheet_name}'; using standard processing")
+
+    header_row_idx, col_map = find_header_row(df)
+    return SheetLayout(
+        table_name=table_name,
+        data_start=header_row_idx + 1,
+        columns=[standardize_column_name(col_map.get(i, f"unnamed_{i}")) for i in range(df.shape[1])],
+    )
+
+
+def sheet_fingerprint(df: pd.DataFrame, sheet_name: str, file_name: str) -> str:
+    """
+    Hash of everything layout detection depends on.
+
+    That is the sheet and file names, the grid shape, the header region (the
+    rows searched for titles and headers) and the first column, which marks
+    where the special-case tables start and end. Data cells below the header
+    region do not affect the layout, so refreshed figures keep the same key.
+    """
+    digest = hashlib.sha256(f"{LAYOUT_VERSION}|{file_name}|{sheet_name}|{df.shape}".encode())
+    header_region = df.iloc[:LAYOUT_HEADER_ROWS].astype(str)
+    digest.update(pd.util.hash_pandas_object(header_region, index=False).to_numpy().tobytes())
+    if df.shape[1] > 0:
+        first_col = df.iloc[:, 0].astype(str)
+        digest.update(pd.util.hash_pandas_object(first_col, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class LayoutCache:
+    """
+    Sheet layouts stored as one JSON file per sheet fingerprint.
+
+    Files are written atomically, so worker processes sharing a cache
+    directory never see a partly written layout.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+
+    def _path(self, fingerprint: str) -> Path:
+        return self.directory / f"{fingerprint}.json"
+
+    def get(self, fingerprint: str) -> Optional[SheetLayout]:
+        """Return the cached layout, or None if it is missing or unreadable."""
+        path = self._path(fingerprint)
+        if not path.exists():
+            return None
+        try:
+            return SheetLayout(**json.loads(path.read_text()))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable layout cache entry {path.name}: {e}")
+            return None
+
+    def put(self, fingerprint: str, layout: SheetLayout) -> None:
+        path = self._path(fingerprint)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(layout.model_dump_json())
+        tmp_path.replace(path)
+
+
+def sheet_layout(df: pd.DataFrame, sheet_name: str, file_name: str,
+                 cache: Optional[LayoutCache] = None) -> SheetLayout:
+    """Return the sheet's layout, detecting it only when the cache has no entry for the sheet."""
+    if cache is None:
+        return detect_layout(df, sheet_name, file_name)
+    fingerprint = sheet_fingerprint(df, sheet_name, file_name)
+    layout = cache.get(fingerprint)
+    if layout is not None:
+        logger.debug(f"Reusing cached layout for sheet '{sheet_name}'")
+        return layout
+    layout = detect_layout(df, sheet_name, file_name)
+    cache.put(fingerprint, layout)
+    return layout
+
+
+def extract_sheet_frame(df: pd.DataFrame, sheet_name: str, file_name: str,
+                        layout: Optional[SheetLayout] = None) -> pd.DataFrame:
+    """
+    Extract a sheet's records as a validated record frame (one column per AIHWRecord field).
+
+    Table blocks are sliced, their sex or metric columns melted and the numbers
+    coerced in bulk; no per-cell objects are created. Tables described in
+    TABLE_SPECS (S2.4, S3.5 and Table 11) are extracted by their spec, falling
+    back to header detection for anything else (or when the table is not found).
+    The layout is detected unless a (cached) one is passed in.
+    All code and comments use Australian English.
+    """
+    if layout is None:
+        layout = detect_layout(df, sheet_name, file_name)
+    logger.info(f"Processing Sheet: '{sheet_name}', Table: '{layout.table_name}'")
+
+    # Add debug logging for CVD data
+    if "AIHW-CVD-92" in file_name:
+        logger.debug(f"Processing CVD data from sheet {sheet_name}")
+        logger.debug(f"DataFrame head:\n{df.head()}")
+        logger.debug(f"DataFrame columns: {df.columns.tolist()}")
+
+    if layout.kind is not None:
+        spec = table_spec_named(layout.kind)
+        logger.info(f"Applying table spec for {spec.label}")
+        frame = table_spec_frame(df, spec, layout)
+    else:
+        # --- Standard Processing Logic (Fallback) ---
+        logger.info(f"Applying standard processing for Sheet: '{sheet_name}'")
+        frame = _standard_frame(df, sheet_name, layout)
+        logger.info(f"Sheet {sheet_name}: Extracted {len(frame)} records using standard processing.")
+
+    return validate_record_frame(frame)
+
+
+def process_sheet(df: pd.DataFrame, sheet_name: str, file_name: str) -> List[AIHWRecord]:
+    """
+    Process a single sheet into AIHW records.
+
+    This function is robust to both raw Excel-like DataFrames (with headers in the first column/row)
+    and already-cleaned DataFrames (with proper column names and no header rows in the data).
+    Special handling is provided for S2.4, S3.5, and Table 11 (CVD Mortality) sheets.
+    Extraction is columnar (see extract_sheet_frame); objects are only built here.
+    All code and comments use Australian English.
+
+    Args:
+        df: The input DataFrame, either raw (as read from Excel) or already cleaned.
+        sheet_name: The name of the sheet being processed.
+        file_name: The name of the file being processed.
+
+    Returns:
+        List[AIHWRecord]: List of extracted records.
+    """
+    return records_from_frame(extract_sheet_frame(df, sheet_name, file_name))
+
+TABLE_HEADER_WORDS = ['deaths', 'rates', 'prevalence', 'mortality', 'number of', 'age-specific',
+                      'age-standardised', 'year', 'period', 'over the period', 'time series']
+TIME_SERIES_WORDS = ['year', 'period', 'over the period']
+YEAR_RANGE_PATTERN = r'(?:19|20)\d{2}[-–](?:19|20)\d{2}'
+
+
+def _row_text(df: pd.DataFrame) -> pd.Series:
+    """Each row's non-missing cells, stripped and joined with spaces (columns combined in bulk)."""
+    text = pd.Series('', index=df.index)
+    started = pd.Series(False, index=df.index)
+    for col in df.columns:
+        present = df[col].notna()
+        piece = df[col].astype(str).str.strip()
+        text = text.where(~present, text.where(~started, text + ' ') + piece)
+        started |= present
+    return text
+
+
+def _words_pattern(words: List[str]) -> str:
+    return '|'.join(re.escape(word) for word in words)
+
+
 def find_tables_in_sheet(df: pd.DataFrame) -> List[Dict]:
     """Find tables within a sheet based on headers and content."""
+    if df.empty:
+        return []
+    row_text = _row_text(df).str.strip()
+    lower_text = row_text.str.lower()
+    empty = df.isna().all(axis=1).to_numpy()
+    first_row = np.arange(len(df)) == 0
+    year_range = row_text.str.contains(YEAR_RANGE_PATTERN).to_numpy()
+
+    # Table headers: titles, metric words, year ranges or the first non-empty row
+    is_header = (row_text.str.contains('Table', regex=False).to_numpy()
+                 | lower_text.str.contains(_words_pattern(TABLE_HEADER_WORDS)).to_numpy()
+                 | year_range | (first_row & ~empty))
+    # End of table markers: empty rows, notes or sources, and the last row
+    is_note = df.astype(str).apply(lambda col: col.str.lower().str.startswith(('note', 'source'))) & df.notna()
+    has_note = is_note.any(axis=1).to_numpy()
+    is_end = empty | has_note | (np.arange(len(df)) == len(df) - 1)
+    is_time_series = lower_text.str.contains(_words_pattern(TIME_SERIES_WORDS)).to_numpy() | year_range
+
+    # Walk only the flagged rows to open and close tables
     tables = []
     current_table = None
-    
-    for i, row in df.iterrows():
-        # Convert row values to string, handling non-string types
-        row_text = ' '.join(str(x).strip() for x in row if pd.notna(x))
-        
-        # Check for table headers
-        if ('Table' in row_text or 
-            any(x in row_text.lower() for x in ['deaths', 'rates', 'prevalence', 'mortality', 'number of', 
-                                             'age-specific', 'age-standardised', 'year', 'period', 
-                                             'over the period', 'time series']) or
-            re.search(r'(?:19|20)\d{2}[-–](?:19|20)\d{2}', row_text) or  # Look for year ranges
-            (i == 0 and not row.isna().all())):  # First non-empty row might be a header
-            
+    for i in np.flatnonzero(is_header | is_end):
+        i = int(i)
+        if is_header[i]:
             if current_table:
                 current_table['end_row'] = i
                 tables.append(current_table)
-            
             current_table = {
                 'start_row': i,
-                'title': row_text.strip(),
+                'title': row_text.iloc[i],
                 'end_row': None,
-                'is_time_series': any(x in row_text.lower() for x in ['year', 'period', 'over the period']) or
-                                  re.search(r'(?:19|20)\d{2}[-–](?:19|20)\d{2}', row_text)
+                'is_time_series': bool(is_time_series[i]),
             }
-        
-        # Check for end of table markers
-        elif current_table and (
-            row.isna().all() or 
-            any(str(x).lower().startswith(('note', 'source')) for x in row if pd.notna(x)) or
-            i == len(df) - 1
-        ):
+        elif current_table:
             current_table['end_row'] = i
             tables.append(current_table)
             current_table = None
-    
+
     # Handle last table if it exists
     if current_table:
         current_table['end_row'] = len(df)
         tables.append(current_table)
-    
+
     # Filter out too-small tables and merge adjacent tables if they look related
     filtered_tables = []
     for i, table in enumerate(tables):
         # Skip tables that are too small
         if table['end_row'] - table['start_row'] < 2:
             continue
-            
+
         # Check if this table should be merged with the previous one
         if filtered_tables and i > 0:
             prev_table = filtered_tables[-1]
             if (table['start_row'] - prev_table['end_row'] <= 2 and  # Tables are close
-                not any(str(x).lower().startswith(('note', 'source')) 
-                       for x in df.iloc[prev_table['end_row']:table['start_row']].values.flatten() 
-                       if pd.notna(x))):  # No notes between tables
+                    not has_note[prev_table['end_row']:table['start_row']].any()):  # No notes between tables
                 # Merge tables
                 prev_table['end_row'] = table['end_row']
                 # If either table is a time series, the merged table is a time series
-                prev_table['is_time_series'] = prev_table.get('is_time_series', False) or table.get('is_time_series', False)
+                prev_table['is_time_series'] = prev_table['is_time_series'] or table['is_time_series']
                 continue
-                
+
         filtered_tables.append(table)
-    
+
     return filtered_tables
 
 def parse_age_group(label: str) -> str:
@@ -557,6 +759,63 @@ def parse_age_group(label: str) -> str:
     logger.warning(f"Unrecognised age group label: '{label}'")
     return None
 
+def _cell_metadata(col, val) -> Dict:
+    """Sex, age group and year found in a single cell (see extract_row_metadata)."""
+    metadata = {}
+    try:
+        if pd.isna(val):
+            return metadata
+        val_str = str(val).strip().lower()
+        col_str = str(col).strip().lower()
+
+        # Skip numeric values that aren't actually years
+        if isinstance(val, (int, float)) or val_str.replace('.', '', 1).isdigit():
+            try:
+                numeric_value = float(val)
+                if numeric_value > 3000:
+                    return metadata
+            except Exception:
+                pass
+    except Exception:
+        return metadata
+
+    # Check if column name indicates a year column
+    if 'year' in col_str:
+        try:
+            year_match = re.search(r'(?:19|20)\d{2}', val_str)
+            if year_match:
+                year_value = int(year_match.group())
+                # Allow years from 1960 to 2060 (context-aware, see below)
+                if 1960 <= year_value <= 2060:
+                    metadata['year'] = year_value
+                else:
+                    logger.warning(f"Year {year_value} outside valid range (1960-2060) in column '{col_str}'")
+                return metadata
+        except (ValueError, TypeError):
+            pass
+
+    # Extract sex
+    if val_str in ['m', 'men', 'male', 'males', 'women', 'f', 'female', 'females', 'p', 'person', 'persons', 'people']:
+        metadata['sex'] = val_str
+
+    # Extract age group using robust parser
+    parsed_age_group = parse_age_group(val_str)
+    if parsed_age_group:
+        metadata['age_group'] = parsed_age_group
+
+    # Extract year if present in a value
+    elif re.match(r'(?:19|20)\d{2}(?:[-–]\d{2})?', val_str):
+        try:
+            year_value = int(val_str[:4])
+            if 1960 <= year_value <= 2060:
+                metadata['year'] = year_value
+            else:
+                logger.warning(f"Year {year_value} outside valid range (1960-2060) in value '{val_str}'")
+        except ValueError:
+            pass
+
+    return metadata
+
 def extract_row_metadata(row: pd.Series) -> Dict:
     """
     Extract metadata from a row including sex, age group, and year.
@@ -571,60 +830,30 @@ def extract_row_metadata(row: pd.Series) -> Dict:
         Dict: Metadata dictionary with possible keys: 'sex', 'age_group', 'year'.
     """
     metadata = {}
-
     for col, val in row.items():
-        try:
-            if pd.isna(val):
-                continue
-            val_str = str(val).strip().lower()
-            col_str = str(col).strip().lower()
-
-            # Skip numeric values that aren't actually years
-            if isinstance(val, (int, float)) or val_str.replace('.', '', 1).isdigit():
-                try:
-                    numeric_value = float(val)
-                    if numeric_value > 3000:
-                        continue
-                except Exception:
-                    pass
-        except Exception:
-            continue
-
-        # Check if column name indicates a year column
-        if 'year' in col_str:
-            try:
-                year_match = re.search(r'(?:19|20)\d{2}', val_str)
-                if year_match:
-                    year_value = int(year_match.group())
-                    # Allow years from 1960 to 2060 (context-aware, see below)
-                    if 1960 <= year_value <= 2060:
-                        metadata['year'] = year_value
-                    else:
-                        logger.warning(f"Year {year_value} outside valid range (1960-2060) in column '{col_str}'")
-                    continue
-            except (ValueError, TypeError):
-                pass
-
-        # Extract sex
-        if val_str in ['m', 'men', 'male', 'males', 'women', 'f', 'female', 'females', 'p', 'person', 'persons', 'people']:
-            metadata['sex'] = val_str
+        metadata.update(_cell_metadata(col, val))
+    return metadata
 
-        # Extract age group using robust parser
-        parsed_age_group = parse_age_group(val_str)
-        if parsed_age_group:
-            metadata['age_group'] = parsed_age_group
+def extract_frame_metadata(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    extract_row_metadata for every row of ``df`` at once.
 
-        # Extract year if present in a value
-        elif re.match(r'(?:19|20)\d{2}(?:[-–]\d{2})?', val_str):
-            try:
-                year_value = int(val_str[:4])
-                if 1960 <= year_value <= 2060:
-                    metadata['year'] = year_value
-                else:
-                    logger.warning(f"Year {year_value} outside valid range (1960-2060) in value '{val_str}'")
-            except ValueError:
-                continue
+    Each distinct value in a column is parsed once and mapped onto the rows;
+    as in the row-wise version, a later column overrides an earlier one.
 
+    Returns:
+        pd.DataFrame: 'sex', 'age_group' and 'year' columns aligned with ``df`` (NaN where absent).
+    """
+    metadata = pd.DataFrame(np.nan, index=df.index, columns=['sex', 'age_group', 'year'], dtype=object)
+    for position in range(df.shape[1]):
+        col = df.columns[position]
+        values = df.iloc[:, position]
+        parsed = {val: _cell_metadata(col, val) for val in values.dropna().unique()}
+        for field in metadata.columns:
+            lookup = {val: meta[field] for val, meta in parsed.items() if field in meta}
+            if lookup:
+                found = values.map(lookup)
+                metadata[field] = found.where(found.notna(), metadata[field])
     return metadata
 
 def determine_metric_type(column_name: str, value: float) -> MetricType:
@@ -687,75 +916,130 @@ def extract_condition_from_table(table_name: str) -> str:
     cleaned_name = re.sub(r'\([^)]*\)', '', cleaned_name)
     return cleaned_name.split('in Australia')[0].strip()
 
-def process_aihw_excel(file_path: str, output_path: str) -> AIHWDataset:
+def _is_blank(value) -> bool:
+    """True for an empty or missing cell in a streamed row."""
+    return value is None or value == "" or (isinstance(value, float) and np.isnan(value))
+
+
+def table_end_detector(sheet_name: str, file_name: str) -> Optional[RowPredicate]:
     """
-    Process an AIHW Excel file into a standardised dataset and save to CSV.
-    
+    Row predicate that signals the end of a TableSpec table (see table_spec_bounds).
+
+    The table ends at the first empty (or end-prefixed) first cell after its
+    data starts. Rows beyond that are never used, so the reader can stop
+    there. Returns None for sheets that need reading in full.
+    """
+    spec = find_table_spec(sheet_name, file_name)
+    if spec is None:
+        return None
+    data_start = None
+
+    def table_ended(values: List, index: int) -> bool:
+        nonlocal data_start
+        first = values[0] if values else ""
+        if data_start is None:
+            if spec.anchor is not None:
+                found = not _is_blank(first) and spec.anchor in str(first)
+            else:
+                found = not _is_blank(first) and str(first).strip().isdigit()
+            if found:
+                data_start = index + spec.data_offset
+            return False
+        return index >= data_start and (_is_blank(first) or str(first).lower().startswith(spec.end_prefixes))
+
+    return table_ended
+
+
+def _extract_sheet(df: pd.DataFrame, sheet: str, file_name: str,
+                   layout_cache_dir: Optional[Path] = None) -> pd.DataFrame:
+    """Process one loaded sheet into a record frame. Module-level so it can run in a worker process."""
+    try:
+        # Skip empty sheets
+        if df.empty or df.isna().all().all():
+            logger.info(f"Sheet '{sheet}' is empty. Skipping.")
+            return pd.DataFrame(columns=RECORD_COLUMNS)
+
+        logger.info(f"Processing sheet '{sheet}'. Shape: {df.shape}")
+
+        # Process the sheet
+        cache = LayoutCache(layout_cache_dir) if layout_cache_dir is not None else None
+        frame = extract_sheet_frame(df, sheet, file_name, sheet_layout(df, sheet, file_name, cache))
+        if not frame.empty:
+            logger.info(f"Extracted {len(frame)} records from sheet '{sheet}'")
+        else:
+            logger.warning(f"No records extracted from sheet '{sheet}'")
+        return frame
+
+    except Exception as e:
+        logger.error(f"Error processing sheet {sheet}: {e}")
+        return pd.DataFrame(columns=RECORD_COLUMNS)
+
+
+def extract_aihw_excel(file_path: str, jobs: Optional[int] = None, debug: bool = False,
+                       layout_cache_dir: Optional[Path] = None) -> Tuple[List[AIHWRecord], pd.DataFrame]:
+    """
+    Extract the records from an AIHW Excel file and build the cleaned DataFrame.
+
+    Sheets are read one after another from the single open workbook and each
+    is handed to a process pool as soon as it is loaded, so sheets are
+    processed in parallel while later ones are still being read. Records are
+    merged in sheet order whatever order the workers finish in.
+
+    Records are kept as columns throughout. AIHWRecord objects are only built
+    in debug mode, when each one is also re-validated by the model.
+
     Args:
         file_path: Path to input Excel file
-        output_path: Path to save processed CSV file
+        jobs: Worker processes for the per-sheet work; defaults to the CPU count.
+        debug: Also build and return the AIHWRecord objects.
+        layout_cache_dir: Directory of cached sheet layouts; sheets whose header
+            region is unchanged skip layout detection. No caching if omitted.
+
+    Returns:
+        The extracted records (empty unless ``debug``) and the cleaned
+        DataFrame. When nothing could be extracted the DataFrame is empty but
+        carries the expected headers.
     """
     logger.info(f"Processing {Path(file_path).name}")
-    
-    # Read Excel file
-    xl = pd.ExcelFile(file_path)
-    sheets = [s for s in xl.sheet_names if s not in SHEETS_TO_EXCLUDE]
-    logger.info(f"Found {len(sheets)} data sheets: {sheets}")
-    
-    all_records = []
-    
-    # Process each sheet
-    for sheet in sheets:
-        try:
-            # Read the sheet without assuming header row
-            logger.info(f"Loading sheet: '{sheet}'")
-            df = pd.read_excel(file_path, sheet_name=sheet, header=None)
-            
-            # Skip empty sheets
-            if df.empty or df.isna().all().all():
-                logger.info(f"Sheet '{sheet}' is empty. Skipping.")
-                continue
-                
-            logger.info(f"Processing sheet '{sheet}'. Shape: {df.shape}")
-            
-            # Process the sheet
-            records = process_sheet(df, sheet, Path(file_path).name)
-            if records:
-                logger.info(f"Extracted {len(records)} records from sheet '{sheet}'")
-                all_records.extend(records)
-            else:
-                logger.warning(f"No records extracted from sheet '{sheet}'")
-            
-        except Exception as e:
-            logger.error(f"Error processing sheet {sheet}: {e}")
-            continue
-    
-    if not all_records:
-        logger.warning("No records were extracted from any sheet. Writing empty output file with headers.")
+
+    file_name = Path(file_path).name
+    sheet_frames = []
+
+    # Open the workbook once; each sheet is streamed only when it is reached
+    with StreamingWorkbook(file_path) as workbook:
+        sheets = [s for s in workbook.sheet_names if s not in SHEETS_TO_EXCLUDE]
+        logger.info(f"Found {len(sheets)} data sheets: {sheets}")
+
+        jobs = max(1, min(jobs or os.cpu_count() or 1, len(sheets)))
+        sheet_results = []
+        with (ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else nullcontext()) as pool:
+            for sheet in sheets:
+                try:
+                    # Read the sheet without assuming header row, stopping at the end of known tables
+                    logger.info(f"Loading sheet: '{sheet}'")
+                    df = workbook.read_sheet(sheet, stop=table_end_detector(sheet, file_name))
+                except Exception as e:
+                    logger.error(f"Error processing sheet {sheet}: {e}")
+                    continue
+                if pool is None:
+                    sheet_results.append(_extract_sheet(df, sheet, file_name, layout_cache_dir))
+                else:
+                    sheet_results.append(pool.submit(_extract_sheet, df, sheet, file_name, layout_cache_dir))
+
+            for result in sheet_results:
+                frame = result.result() if isinstance(result, Future) else result
+                if not frame.empty:
+                    sheet_frames.append(frame)
+
+    if not sheet_frames:
+        logger.warning("No records were extracted from any sheet.")
         # Define the expected columns for the output CSV
         expected_columns = ['year', 'source_sheet', 'sex', 'age_group', 'metric', 'value', 'unit', 'condition', 'source_table']
-        empty_df = pd.DataFrame(columns=expected_columns)
-        empty_df.to_csv(output_path, index=False)
-        logger.info(f"Saved empty output file with headers to {output_path}")
-        return AIHWDataset(
-            records=[],
-            source_file=Path(file_path).name,
-            processed_date=datetime.now()
-        )
-    
-    # Convert records to DataFrame
-    records_data = []
-    for record in all_records:
-        try:
-            # Use model_dump instead of dict
-            record_dict = record.model_dump()
-            records_data.append(record_dict)
-        except Exception as e:
-            logger.warning(f"Invalid record: {e}")
-            continue
-    
-    df = pd.DataFrame(records_data)
-    
+        return [], pd.DataFrame(columns=expected_columns)
+
+    df = pd.concat(sheet_frames, ignore_index=True)
+    records = records_from_frame(df, validate=True) if debug else []
+
     # Clean up the DataFrame
     if not df.empty:
         # Filter by valid year range (2009-2022 only)
@@ -778,21 +1062,93 @@ def process_aihw_excel(file_path: str, output_path: str) -> AIHWDataset:
         
         # Drop duplicate records
         df = df.drop_duplicates()
-        
-        # Save to CSV
-        df.to_csv(output_path, index=False)
-        logger.info(f"Saved {len(df)} records to {output_path}")
         logger.info(f"DataFrame shape: {df.shape}")
         logger.info(f"Columns: {', '.join(df.columns)}")
     else:
         logger.error("No valid records to save")
     
+    return records, df
+
+def save_aihw_frame(df: pd.DataFrame, output_path: str) -> None:
+    """Write a cleaned AIHW DataFrame, skipping frames with neither rows nor headers."""
+    if df.empty and len(df.columns) == 0:
+        return
+    write_dataset(df, output_path)
+    if df.empty:
+        logger.info(f"Saved empty output file with headers to {output_path}")
+    else:
+        logger.info(f"Saved {len(df)} records to {output_path}")
+
+def process_aihw_excel(file_path: str, output_path: str, jobs: Optional[int] = None,
+                       debug: bool = False) -> AIHWDataset:
+    """
+    Process an AIHW Excel file into a standardised dataset and save to CSV.
+
+    Args:
+        file_path: Path to input Excel file
+        output_path: Path to save processed CSV file
+        jobs: Worker processes for the per-sheet work; defaults to the CPU count.
+        debug: Build (and re-validate) the dataset's AIHWRecord objects; otherwise
+            only the saved frame is produced and the dataset has no records.
+    """
+    records, df = extract_aihw_excel(file_path, jobs, debug)
+    save_aihw_frame(df, output_path)
     return AIHWDataset(
-        records=all_records,
+        records=records,
         source_file=Path(file_path).name,
         processed_date=datetime.now()
     )
 
+def _extract_and_save_workbook(input_path: Path, output_path: Path, jobs: int,
+                               layout_cache_dir: Optional[Path] = None) -> pd.DataFrame:
+    """Extract and save one workbook. Module-level so it can run in a worker process."""
+    logger.info(f"Processing {input_path.name}")
+    _, df = extract_aihw_excel(str(input_path), jobs, layout_cache_dir=layout_cache_dir)
+    save_aihw_frame(df, str(output_path))
+    return df
+
+
+def extract_aihw_workbooks(workbooks: Sequence[Tuple[Path, Path]], jobs: Optional[int] = None,
+                           layout_cache_dir: Optional[Path] = None) -> Dict[Path, pd.DataFrame]:
+    """
+    Extract and save several AIHW workbooks, one worker process per workbook.
+
+    The available workers are shared out between the workbooks and their
+    sheets, so the total number of processes stays close to ``jobs``.
+
+    Args:
+        workbooks: (input Excel file, output path) pairs.
+        jobs: Total worker processes; defaults to the CPU count.
+        layout_cache_dir: Directory of cached sheet layouts (see extract_aihw_excel).
+
+    Returns:
+        The cleaned frame for each workbook that was processed, keyed by output
+        path in the order given. Failed workbooks are logged and left out.
+    """
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    workbook_jobs = max(1, min(jobs, len(workbooks)))
+    sheet_jobs = max(1, jobs // workbook_jobs)
+    frames = {}
+    with (ProcessPoolExecutor(max_workers=workbook_jobs) if workbook_jobs > 1 else nullcontext()) as pool:
+        if pool is None:
+            pending = [(paths, None) for paths in workbooks]
+        else:
+            pending = [(paths, pool.submit(_extract_and_save_workbook, *paths, sheet_jobs, layout_cache_dir))
+                       for paths in workbooks]
+        for (input_path, output_path), future in pending:
+            try:
+                df = (future.result() if future is not None
+                      else _extract_and_save_workbook(input_path, output_path, sheet_jobs, layout_cache_dir))
+            except Exception as e:
+                logger.error(f"Error processing {Path(input_path).name}: {e}")
+                continue
+            logger.info(f"Successfully processed {Path(input_path).name}")
+            logger.info(f"  Shape: {df.shape}")
+            logger.info(f"  Columns: {', '.join(df.columns)}")
+            frames[output_path] = df
+    return frames
+
+
 def validate_data(df, source_file):
     """Validate data using Pydantic models."""
     valid_records = []
@@ -835,8 +1191,41 @@ def validate_data(df, source_file):
         return pd.DataFrame([record.dict() for record in valid_records])
     return pd.DataFrame()
 
+def extract_table_specs(file_path: str) -> pd.DataFrame:
+    """
+    Extract every TableSpec table held by a workbook into one record frame.
+
+    The workbook is opened once and only the sheets named by its specs are
+    read, each up to the end of its table. Specs whose table cannot be found
+    are logged and skipped.
+    """
+    file_name = Path(file_path).name
+    specs = [spec for spec in TABLE_SPECS if spec.file_marker in file_name]
+    frames = []
+    with StreamingWorkbook(file_path) as workbook:
+        for spec in specs:
+            if spec.sheet not in workbook.sheet_names:
+                logger.warning(f"Sheet '{spec.sheet}' not found in {file_name}")
+                continue
+            logger.info(f"Processing {spec.label} from sheet '{spec.sheet}' of {file_name}")
+            df = workbook.read_sheet(spec.sheet, stop=table_end_detector(spec.sheet, file_name))
+            layout = detect_layout(df, spec.sheet, file_name)
+            if layout.kind != spec.name:
+                logger.warning(f"Could not locate {spec.label} in {file_name}")
+                continue
+            frames.append(validate_record_frame(table_spec_frame(df, spec, layout)))
+    if not frames:
+        return pd.DataFrame(columns=RECORD_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+
 def process_all_aihw_files(raw_dir, processed_dir):
-    """Process all AIHW Excel files in the raw directory."""
+    """
+    Process all AIHW Excel files in the raw directory.
+
+    Workbooks described by TABLE_SPECS are reduced to those tables; any other
+    workbook gets the generic sheet-by-sheet processing.
+    """
     results = {}
     
     # Define file mappings
@@ -852,285 +1241,26 @@ def process_all_aihw_files(raw_dir, processed_dir):
         
         if os.path.exists(input_path):
             try:
-                # Handle specific sheets based on the file
-                if 'S2-Prevalence' in excel_file:
-                    logger.info(f"Processing only sheet S2.4 from {excel_file}")
-                    # Read only sheet S2.4 (dementia prevalence by year)
-                    df = pd.read_excel(input_path, sheet_name='S2.4', header=None)
-                    
-                    # Custom handling for S2.4 which has a specific structure
-                    # The sheet has years in rows and separate columns for men/women/persons
-                    records = []
-                    
-                    # Find where the actual data begins by looking for the header row
-                    header_row = None
-                    for i in range(min(15, len(df))):
-                        if pd.notna(df.iloc[i, 0]) and ("Year" in str(df.iloc[i, 0]) or "year" in str(df.iloc[i, 0]).lower()):
-                            header_row = i
-                            break
-                    
-                    if header_row is not None:
-                        logger.info(f"Found header row at row {header_row}")
-                        # Skip the header row and get data rows
-                        data_rows = df.iloc[header_row+1:].reset_index(drop=True)
-                        
-                        # Keep only rows that have a year in the first column
-                        valid_rows = []
-                        for idx, row in data_rows.iterrows():
-                            if pd.notna(row.iloc[0]):
-                                try:
-                                    # Try to extract a year from the first column
-                                    year_val = row.iloc[0]
-                                    # Handle both integer and float years
-                                    if isinstance(year_val, (int, float)):
-                                        year_int = int(year_val)
-                                        if 1980 <= year_int <= 2060:  # Allow projections to 2060
-                                            valid_rows.append(row)
-                                    else:
-                                        year_str = str(year_val).strip()
-                                        # Handle possible float strings like "2010.0"
-                                        if '.' in year_str:
-                                            year_str = year_str.split('.')[0]
-                                        if year_str.isdigit() and 1980 <= int(year_str) <= 2060:
-                                            valid_rows.append(row)
-                                except Exception as e:
-                                    logger.debug(f"Error parsing year in S2.4 row {idx}: {e}")
-                                    continue
-                        
-                        if valid_rows:
-                            # Create a DataFrame from valid rows
-                            valid_df = pd.DataFrame(valid_rows).reset_index(drop=True)
-                            
-                            # Process each valid row
-                            for idx, row in valid_df.iterrows():
-                                # Handle both integer and float years
-                                year_val = row.iloc[0]
-                                if isinstance(year_val, (int, float)):
-                                    year = int(year_val)
-                                else:
-                                    year_str = str(year_val).strip()
-                                    if '.' in year_str:
-                                        year_str = year_str.split('.')[0]
-                                    year = int(year_str)
-                                
-                                # Create records for men (col 1), women (col 2), persons (col 3)
-                                for col_idx, sex in [(1, "men"), (2, "women"), (3, "persons")]:
-                                    if col_idx < len(row) and pd.notna(row.iloc[col_idx]):
-                                        try:
-                                            value = float(row.iloc[col_idx])
-                                            records.append(AIHWRecord(
-                                                year=year,
-                                                value=value,
-                                                metric_type=MetricType.NUMBER,
-                                                source_sheet="S2.4",
-                                                sex=sex,
-                                                age_group=None,
-                                                table_name="Australians living with dementia",
-                                                condition="Dementia"
-                                            ))
-                                        except:
-                                            continue
-                                            
-                            logger.info(f"Extracted {len(records)} prevalence records from sheet S2.4")
-                    else:
-                        logger.warning("Could not locate header row in sheet S2.4")
-                    
-                    # Convert records to DataFrame
-                    records_data = []
-                    for record in records:
-                        record_dict = record.model_dump()
-                        records_data.append(record_dict)
-                    
-                    if records_data:
-                        df = pd.DataFrame(records_data)
-                        # Clean up the DataFrame
-                        columns_to_drop = ['region', 'indigenous_status', 'notes']
-                        df = df.drop(columns=columns_to_drop, errors='ignore')
-                        
-                        # Sort by year and clean up
-                        if 'year' in df.columns:
-                            df = df.sort_values('year')
-                        
-                        df.to_csv(output_path, index=False)
-                        logger.info(f"Successfully saved {len(df)} records to {csv_file}")
-                        results[csv_file] = df
-                    else:
-                        logger.warning(f"No valid records found in sheet S2.4")
-
-                elif 'S3-Mortality' in excel_file:
-                    logger.info(f"Processing only sheet S3.5 from {excel_file}")
-                    # Read only sheet S3.5 (dementia mortality data)
-                    df = pd.read_excel(input_path, sheet_name='S3.5', header=None)
-                    # Process only this sheet
-                    records = process_sheet(df, 'S3.5', excel_file)
-                    
-                    # Convert records to DataFrame
-                    records_data = []
-                    for record in records:
-                        record_dict = record.model_dump()
-                        records_data.append(record_dict)
-                    
-                    if records_data:
-                        df = pd.DataFrame(records_data)
-                        # Clean up the DataFrame
-                        columns_to_drop = ['region', 'indigenous_status', 'notes']
-                        df = df.drop(columns=columns_to_drop, errors='ignore')
-                        
-                        # Sort by year and clean up
-                        if 'year' in df.columns:
-                            df = df.sort_values('year')
-                        
-                        df.to_csv(output_path, index=False)
-                        logger.info(f"Successfully saved {len(df)} records to {csv_file}")
-                        results[csv_file] = df
-                    else:
-                        logger.warning(f"No valid records found in sheet S3.5")
-                
-                elif 'CVD' in excel_file:
-                    logger.info(f"Processing Table 11 (CVD mortality time series from 1980-2022) from {excel_file}")
-                    
-                    # Read the All CVD sheet
-                    df = pd.read_excel(input_path, sheet_name='All CVD', header=None)
-                    
-                    # Special handling for CVD Table 11 (Cardiovascular disease deaths 1980-2022)
-                    records = []
-                    # Table 11 starts around row 229 in the Excel file
-                    table_start = None
-                    table_end = None
-                    
-                    # Find Table 11 by looking for its header row
-                    for i in range(len(df)):
-                        if pd.notna(df.iloc[i, 0]) and "Table 11" in str(df.iloc[i, 0]):
-                            table_start = i
-                            # Find where table ends (looking for empty rows or notes)
-                            for j in range(i + 10, len(df)):  # Start at least 10 rows after table header
-                                if pd.isna(df.iloc[j, 0]) or str(df.iloc[j, 0]).startswith("Note"):
-                                    table_end = j
-                                    break
-                            break
-                    
-                    if table_start is not None and table_end is not None:
-                        logger.info(f"Found Table 11 from rows {table_start} to {table_end}")
-                        # Extract the table data (skip header rows - years start 2-3 rows after table title)
-                        data_start = table_start + 3  # Adjust based on the actual structure
-                        table_data = df.iloc[data_start:table_end].reset_index(drop=True)
-                        
-                        # Process each row in the table
-                        for idx, row in table_data.iterrows():
-                            try:
-                                # Year is in column 0
-                                year_val = row.iloc[0]
-                                if pd.isna(year_val):
-                                    continue
-                                
-                                try:
-                                    # Extract year - for CVD data, we want ALL years including 1980s
-                                    year = int(str(year_val))
-                                    if 1980 <= year <= 2022:  # Allow full historical range
-                                        # Create records for each metric
-                                        
-                                        # Men deaths - col 1
-                                        if not pd.isna(row.iloc[1]):
-                                            records.append(AIHWRecord(
-                                                year=year,
-                                                value=float(row.iloc[1]),
-                                                metric_type=MetricType.NUMBER,
-                                                source_sheet="Table 11",
-                                                sex="men",
-                                                age_group=None,
-                                                table_name="Cardiovascular disease deaths in Australia",
-                                                condition="Cardiovascular Disease"
-                                            ))
-                                        
-                                        # Women deaths - col 2
-                                        if not pd.isna(row.iloc[2]):
-                                            records.append(AIHWRecord(
-                                                year=year,
-                                                value=float(row.iloc[2]),
-                                                metric_type=MetricType.NUMBER,
-                                                source_sheet="Table 11",
-                                                sex="women",
-                                                age_group=None,
-                                                table_name="Cardiovascular disease deaths in Australia",
-                                                condition="Cardiovascular Disease"
-                                            ))
-                                        
-                                        # Persons deaths - col 3
-                                        if not pd.isna(row.iloc[3]):
-                                            records.append(AIHWRecord(
-                                                year=year,
-                                                value=float(row.iloc[3]),
-                                                metric_type=MetricType.NUMBER,
-                                                source_sheet="Table 11",
-                                                sex="persons",
-                                                age_group=None,
-                                                table_name="Cardiovascular disease deaths in Australia",
-                                                condition="Cardiovascular Disease"
-                                            ))
-                                        
-                                        # Crude rates - cols 4-6
-                                        for col_idx, sex in [(4, "men"), (5, "women"), (6, "persons")]:
-                                            if not pd.isna(row.iloc[col_idx]):
-                                                records.append(AIHWRecord(
-                                                    year=year,
-                                                    value=float(row.iloc[col_idx]),
-                                                    metric_type=MetricType.CRUDE_RATE,
-                                                    source_sheet="Table 11",
-                                                    sex=sex,
-                                                    age_group=None,
-                                                    table_name="Cardiovascular disease deaths in Australia",
-                                                    condition="Cardiovascular Disease"
-                                                ))
-                                        
-                                        # Age-standardised rates - cols 7-9
-                                        for col_idx, sex in [(7, "men"), (8, "women"), (9, "persons")]:
-                                            if not pd.isna(row.iloc[col_idx]):
-                                                records.append(AIHWRecord(
-                                                    year=year,
-                                                    value=float(row.iloc[col_idx]),
-                                                    metric_type=MetricType.STANDARDISED_RATE,
-                                                    source_sheet="Table 11",
-                                                    sex=sex,
-                                                    age_group=None,
-                                                    table_name="Cardiovascular disease deaths in Australia",
-                                                    condition="Cardiovascular Disease"
-                                                ))
-                                except (ValueError, TypeError) as e:
-                                    logger.warning(f"Error processing year in Table 11 row {idx}: {e}")
-                                    continue
-                            except Exception as e:
-                                logger.warning(f"Error processing Table 11 row {idx}: {e}")
-                                continue
-                        
-                        logger.info(f"Extracted {len(records)} CVD mortality records from Table 11")
-                    else:
-                        logger.warning("Could not locate Table 11 in the CVD Excel file")
-                    
-                    # Convert records to DataFrame
-                    records_data = []
-                    for record in records:
-                        record_dict = record.model_dump()
-                        records_data.append(record_dict)
-                    
-                    if records_data:
-                        df = pd.DataFrame(records_data)
-                        # Clean up the DataFrame
-                        columns_to_drop = ['region', 'indigenous_status', 'notes']
-                        df = df.drop(columns=columns_to_drop, errors='ignore')
-                        
-                        # Sort by year
-                        if 'year' in df.columns:
-                            df = df.sort_values('year')
-                        
-                        df.to_csv(output_path, index=False)
-                        logger.info(f"Successfully saved {len(df)} CVD records to {csv_file}")
-                        results[csv_file] = df
-                    else:
-                        logger.warning(f"No valid records found in Table 11")
+                if any(spec.file_marker in excel_file for spec in TABLE_SPECS):
+                    df = extract_table_specs(input_path)
+                    if df.empty:
+                        logger.warning(f"No valid records found in {excel_file}")
+                        continue
+
+                    # Clean up the DataFrame
+                    columns_to_drop = ['region', 'indigenous_status', 'notes']
+                    df = df.drop(columns=columns_to_drop, errors='ignore')
+
+                    # Sort by year
+                    df = df.sort_values('year', kind='stable')
+
+                    write_dataset(df, output_path)
+                    logger.info(f"Successfully saved {len(df)} records to {csv_file}")
+                    results[csv_file] = df
                 
                 else:
                     # Standard processing for other files
-                    dataset = process_aihw_excel(input_path, output_path)
+                    dataset = process_aihw_excel(input_path, output_path, debug=True)
                     
                     # Convert records to DataFrame
                     records_data = []
@@ -1152,7 +1282,7 @@ def process_all_aihw_files(raw_dir, processed_dir):
                             if filtered_count > 0:
                                 logger.info(f"Final filtering: removed {filtered_count} records with invalid years from {csv_file}")
                         
-                        df.to_csv(output_path, index=False)
+                        write_dataset(df, output_path)
                         logger.info(f"Successfully saved {len(df)} records to {csv_file}")
                         results[csv_file] = df
                     else:
@@ -1,15 +1,33 @@
-"""Module for processing FAOSTAT Food Balance Sheets data"""
+"""Module for processing FAOSTAT Food Balance Sheets data
+
+FAOSTAT bulk downloads are ZIP archives. Their CSV members are streamed
+straight out of the archive in chunks, so the archives never need extracting;
+plain CSV files are read the same way.
+
+Both process_faostat_data and clean_faostat_data run on stream_faostat: a
+chain of generator stages (read, filter, melt, convert units, drop missing,
+deduplicate, validate) that handles one chunk at a time. Duplicates are
+caught across chunk boundaries by remembering only a hash of each kept row's
+keys, so the melted data is never held in full before it is deduplicated.
+
+Australia is processed by default. clean_faostat_areas handles several
+Oceania areas in one pass over the inputs, pivoting each area in its own
+worker process.
+"""
 import os
+import zipfile
 import pandas as pd
 import numpy as np
 import gc
 import re
 from datetime import datetime
 import logging
-from typing import Dict, List, Union, Optional, Type, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import ClassVar, Dict, Iterator, List, Sequence, Union, Optional, Type, Tuple
 from pathlib import Path
 from pydantic import BaseModel, Field, field_validator
 from pydantic import BaseModel, validator
+from src.pipeline.storage import write_dataset
 
 # Configure logging
 logging.basicConfig(
@@ -18,11 +36,38 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+FAOSTAT_CHUNK_SIZE = 5000
+# Area processed by the standard pipeline; other Oceania areas are opt-in (run_etl --areas)
+DEFAULT_AREA = 'Australia'
+# Lookup tables shipped alongside the data in FAOSTAT bulk archives
+FAOSTAT_LOOKUP_SUFFIXES = ('_areacodes.csv', '_elements.csv', '_itemcodes.csv', '_flags.csv')
+FAOSTAT_NOFLAG_SUFFIX = '_noflag.csv'
+# Columns read from each FAOSTAT table besides the Y#### year values (normalised names)
+FAOSTAT_KEPT_COLUMNS = ('area', 'item', 'element', 'unit', 'year', 'value')
+FAOSTAT_CODE_COLUMNS = ('area_code', 'item_code', 'element_code')
+FAOSTAT_CATEGORICAL_COLUMNS = ('area', 'item', 'element', 'unit')
+FAOSTAT_REQUIRED_COLUMNS = ('area', 'item', 'element', 'year', 'value', 'unit')
+# A row is a duplicate when these match an earlier row (first occurrence wins)
+FAOSTAT_DEDUP_KEYS = ('area', 'year', 'item', 'element')
+YEAR_COLUMN_PATTERN = re.compile(r'^Y\d{4}$', re.IGNORECASE)
+
 class InvalidFBSEntry(Exception):
     """Custom exception for invalid FBS entries"""
     pass
 
 class FAOStatRecord(BaseModel):
+    """A validated FAOSTAT food balance record.
+
+    The rule parameters and messages are class constants so the field
+    validators and the vectorised ``rule_violations`` apply identical rules.
+    """
+    VALID_AREA: ClassVar[str] = 'australia'
+    MIN_YEAR: ClassVar[int] = 1961
+    MAX_YEAR: ClassVar[int] = 2022
+    AREA_ERROR: ClassVar[str] = 'Area must be Australia'
+    VALUE_ERROR: ClassVar[str] = 'Value must be non-negative'
+    YEAR_ERROR: ClassVar[str] = f'Year must be between {MIN_YEAR} and {MAX_YEAR} inclusive'
+
     area_code: int
     area: str
     item_code: int
@@ -35,23 +80,34 @@ class FAOStatRecord(BaseModel):
 
     @field_validator('area')
     def area_must_be_australia(cls, v):
-        if v.lower() != 'australia':
-            raise ValueError('Area must be Australia')
+        if v.lower() != cls.VALID_AREA:
+            raise ValueError(cls.AREA_ERROR)
         return v
 
     @field_validator('value')
     def value_must_be_positive(cls, v):
         if v < 0:
-            raise ValueError('Value must be non-negative')
+            raise ValueError(cls.VALUE_ERROR)
         return v
 
     @field_validator('year')
     def year_must_be_valid(cls, v):
-        if not (1961 <= v <= 2022):
-            raise ValueError('Year must be between 1961 and 2022 inclusive')
-        return v
+        if not (cls.MIN_YEAR <= v <= cls.MAX_YEAR):
+            raise ValueError(cls.YEAR_ERROR)
         return v
 
+    @classmethod
+    def rule_violations(cls, df: pd.DataFrame) -> Dict[str, pd.Series]:
+        """The field validators' rules as boolean masks of the rows that break them.
+
+        ``df`` must already hold correctly typed columns (see validate_frame).
+        """
+        return {
+            cls.AREA_ERROR: df['area'].str.lower() != cls.VALID_AREA,
+            cls.VALUE_ERROR: df['value'] < 0,
+            cls.YEAR_ERROR: ~df['year'].between(cls.MIN_YEAR, cls.MAX_YEAR),
+        }
+
 def identify_year_columns(df: pd.DataFrame) -> List[str]:
     """Identify year columns in the dataset."""
     year_pattern = r'^Y\d{4}$'
@@ -62,9 +118,13 @@ def clean_column_names(df: pd.DataFrame) -> pd.DataFrame:
     df.columns = df.columns.str.lower()
     return df
 
+def filter_area_data(df: pd.DataFrame, areas: Sequence[str]) -> pd.DataFrame:
+    """Filter data to the given areas (matched case-insensitively)."""
+    return df[df['area'].str.lower().isin([area.lower() for area in areas])].copy()
+
 def filter_australia_data(df: pd.DataFrame) -> pd.DataFrame:
     """Filter data for Australia only."""
-    return df[df['area'].str.lower() == 'australia'].copy()
+    return filter_area_data(df, [DEFAULT_AREA])
 
 def melt_year_columns(df: pd.DataFrame, year_cols: List[str]) -> pd.DataFrame:
     """Melt year columns into long format."""
@@ -92,234 +152,465 @@ def convert_units(df: pd.DataFrame) -> pd.DataFrame:
     
     return df
 
-def validate_records(df: pd.DataFrame) -> pd.DataFrame:
-    """Validate each record using the Pydantic model."""
-    valid_records = []
-    for _, row in df.iterrows():
-        try:
-            record = FAOStatRecord(
-                area_code=row['area_code'],
-                area=row['area'],
-                item_code=row['item_code'],
-                item=row['item'],
-                element_code=row['element_code'],
-                element=row['element'],
-                unit=row['unit'],
-                year=row['year'],
-                value=row['value']
-            )
-            valid_records.append(record.dict())
-        except Exception as e:
-            logger.warning(f"Invalid record: {row}, Error: {e}")
+def _coerce_field(series: pd.Series, annotation: type) -> Tuple[pd.Series, pd.Series]:
+    """Coerce a column to a model field's type, returning the values and a mask of failures."""
+    if annotation is int:
+        numbers = pd.to_numeric(series, errors='coerce')
+        bad = numbers.isna() | (numbers % 1 != 0)
+        return numbers.where(~bad), bad
+    if annotation is float:
+        numbers = pd.to_numeric(series, errors='coerce')
+        # Missing values are valid floats (NaN); anything unparseable is not
+        return numbers.astype(float), numbers.isna() & series.notna()
+    # Strings: a numeric column cannot hold text, and missing values are not strings
+    if pd.api.types.is_numeric_dtype(series):
+        return series, pd.Series(True, index=series.index)
+    return series, series.isna()
+
+
+def validate_frame(df: pd.DataFrame, model: Type[BaseModel] = FAOStatRecord) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Validate every row of ``df`` against ``model`` with vectorised column checks.
+
+    Each field is coerced to its annotated type, then the model's
+    ``rule_violations`` masks are applied, so a row is accepted exactly when
+    constructing the model from it would succeed.
+
+    Returns:
+        Tuple of the valid rows (model fields only, coerced to their types) and
+        the invalid rows with an ``errors`` column listing every reason.
+    """
+    reasons = pd.Series('', index=df.index, dtype=object)
+    typed = pd.DataFrame(index=df.index)
+    type_errors = pd.Series(False, index=df.index)
+
+    def add_reason(mask: pd.Series, message: str) -> None:
+        nonlocal reasons
+        reasons = reasons.where(~mask, reasons + message + '; ')
+
+    for name, field in model.model_fields.items():
+        if name not in df.columns:
+            add_reason(pd.Series(True, index=df.index), f"{name}: field required")
+            type_errors[:] = True
             continue
-    
-    return pd.DataFrame(valid_records)
+        typed[name], bad = _coerce_field(df[name], field.annotation)
+        add_reason(bad, f"{name}: expected {field.annotation.__name__}")
+        type_errors |= bad
+
+    if not type_errors.all():
+        checkable = typed[~type_errors]
+        for message, mask in model.rule_violations(checkable).items():
+            add_reason(mask.reindex(df.index, fill_value=False), message)
+
+    invalid = reasons != ''
+    valid_df = typed[~invalid]
+    valid_df = valid_df.astype({name: 'int64' for name, field in model.model_fields.items()
+                                if field.annotation is int})
+    errors_df = df[invalid].assign(errors=reasons[invalid].str.rstrip('; '))
+    return valid_df.reset_index(drop=True), errors_df
+
+
+def validate_records(df: pd.DataFrame) -> pd.DataFrame:
+    """Validate records against the Pydantic model's rules, returning the valid rows."""
+    valid_df, errors_df = validate_frame(df)
+    if not errors_df.empty:
+        top_reasons = errors_df['errors'].value_counts().head(3).to_dict()
+        logger.warning(f"Dropped {len(errors_df)} invalid FAOSTAT records; most common errors: {top_reasons}")
+    return valid_df
 
 def process_faostat_data(input_file: Path, is_historical: bool = False) -> pd.DataFrame:
     """Process FAOSTAT data, handling both historical and modern formats.
 
     Ensures rows with missing values are dropped and duplicates are removed.
+    Returns validated long-format records (one row per item, element and year)
+    with food supply quantities converted to g/cap/d.
     All code and comments use Australian English.
     """
     logger.info(f"Reading FAOSTAT data from {input_file}")
+    stats = FAOStatStreamStats()
+    chunks = stream_faostat(
+        [input_file],
+        chunksize=10000,
+        keep_codes=True,
+        unit_conversion=True,
+        dedup_keys=[name for name in FAOStatRecord.model_fields if name != 'value'],
+        validate=True,
+        stats=stats,
+    )
+    df = collect_stream(chunks, columns=list(FAOStatRecord.model_fields))
+    stats.log()
+    return df
 
-    # Read data in chunks to handle large files
-    chunk_size = 10000
-    chunks = []
-
-    for chunk in pd.read_csv(input_file, chunksize=chunk_size):
-        # Clean column names
-        chunk = clean_column_names(chunk)
-
-        # Filter for Australia
-        chunk = filter_australia_data(chunk)
-
-        # Identify year columns
-        year_cols = identify_year_columns(chunk)
-
-        # Melt year columns
-        chunk = melt_year_columns(chunk, year_cols)
+def zip_data_members(zip_ref: zipfile.ZipFile) -> List[str]:
+    """
+    Names of the data CSV members in a FAOSTAT bulk archive.
 
-        # Convert year format
-        chunk = convert_year_format(chunk)
+    Lookup tables (area, element, item and flag codes) are skipped. When an
+    archive ships both a flagged and a ``_NOFLAG`` copy of the same table, only
+    the flagged copy is read, so the rows are not parsed twice.
+    """
+    members = [name for name in zip_ref.namelist()
+               if name.lower().endswith('.csv') and not name.lower().endswith(FAOSTAT_LOOKUP_SUFFIXES)]
+    lower = {name.lower() for name in members}
+    return [name for name in members
+            if not (name.lower().endswith(FAOSTAT_NOFLAG_SUFFIX)
+                    and name.lower()[:-len(FAOSTAT_NOFLAG_SUFFIX)] + '.csv' in lower)]
 
-        # Convert units
-        chunk = convert_units(chunk)
 
-        # Drop rows with missing values in the 'value' column
-        chunk = chunk.dropna(subset=['value'])
+def normalise_column(column: str) -> str:
+    """Standard column name: 'Area Code' -> 'area_code', 'y2010' -> 'Y2010'."""
+    if YEAR_COLUMN_PATTERN.match(column):
+        return column.upper()
+    return re.sub(r'\s+', '_', column.strip().lower())
 
-        # Remove duplicate rows based on all columns except 'value'
-        dedup_columns = [col for col in chunk.columns if col != 'value']
-        chunk = chunk.drop_duplicates(subset=dedup_columns, keep='first')
 
-        chunks.append(chunk)
+def faostat_read_options(columns: List[str], keep_codes: bool = False) -> Optional[Dict]:
+    """
+    ``pd.read_csv`` options that load only what cleaning needs from a FAOSTAT table.
+
+    Only the area, item, element and unit columns and the year values are kept
+    (plus the area, item and element codes if ``keep_codes``). Flag
+    (``Y####F``) and note (``Y####N``) columns are never parsed. Descriptive
+    columns are read as categoricals. Year values are left to the parser, since
+    FAOSTAT cells such as '<0.5' are not numbers; _melt_stage coerces them to
+    NaN. Returns None for tables without the FAOSTAT identifier columns (e.g.
+    code lookup tables).
+    """
+    normalised = {normalise_column(col): col for col in columns}
+    if not all(col in normalised for col in FAOSTAT_CATEGORICAL_COLUMNS):
+        return None
+    kept = FAOSTAT_KEPT_COLUMNS + (FAOSTAT_CODE_COLUMNS if keep_codes else ())
+    year_cols = [col for col in columns if YEAR_COLUMN_PATTERN.match(col)]
+    usecols = [normalised[col] for col in kept if col in normalised] + year_cols
+    dtype = {normalised[col]: 'category' for col in FAOSTAT_CATEGORICAL_COLUMNS}
+    return {'usecols': usecols, 'dtype': dtype, 'engine': 'c'}
+
+
+def iter_faostat_tables(source: Union[str, Path], chunksize: int = FAOSTAT_CHUNK_SIZE,
+                        keep_codes: bool = False) -> Iterator[Tuple[str, Iterator[pd.DataFrame]]]:
+    """
+    Yield ``(label, chunks)`` for every FAOSTAT table in ``source``.
 
-    # Combine all chunks
-    df = pd.concat(chunks, ignore_index=True)
+    ``source`` is either a CSV file or a FAOSTAT bulk ZIP archive. Archive
+    members are decompressed and parsed chunk by chunk straight from the
+    archive, without extracting them to disk. Only the columns cleaning needs
+    are parsed (see faostat_read_options). Each chunk iterator must be consumed
+    before the next table is requested.
+    """
+    source = Path(source)
+    if source.suffix.lower() != '.zip':
+        options = faostat_read_options(list(pd.read_csv(source, nrows=0).columns), keep_codes)
+        if options is None:
+            logger.warning(f"Skipping {source}: not a FAOSTAT data table")
+            return
+        yield str(source), pd.read_csv(source, chunksize=chunksize, **options)
+        return
+    with zipfile.ZipFile(source) as zip_ref:
+        for member in zip_data_members(zip_ref):
+            label = f"{source.name}:{member}"
+            with zip_ref.open(member) as member_file:
+                options = faostat_read_options(list(pd.read_csv(member_file, nrows=0).columns), keep_codes)
+            if options is None:
+                logger.warning(f"Skipping {label}: not a FAOSTAT data table")
+                continue
+            with zip_ref.open(member) as member_file:
+                yield label, pd.read_csv(member_file, chunksize=chunksize, **options)
 
-    # Validate records
-    df = validate_records(df)
-
-    return df
 
 def harmonize_overlapping_years(historical_df: pd.DataFrame, modern_df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Harmonize data for overlapping years (2010-2013) between historical and modern datasets."""
     overlap_years = set(historical_df['year']).intersection(set(modern_df['year']))
     logger.info(f"Harmonizing overlapping years: {sorted(overlap_years)}")
-    
-    # Calculate adjustment factors for each element based on overlapping years
-    adjustment_factors = {}
-    for element in modern_df['element'].unique():
-        hist_data = historical_df[
-            (historical_df['element'] == element) & 
-            (historical_df['year'].isin(overlap_years))
-        ]['value'].mean()
-        
-        modern_data = modern_df[
-            (modern_df['element'] == element) & 
-            (modern_df['year'].isin(overlap_years))
-        ]['value'].mean()
-        
-        if hist_data > 0 and modern_data > 0:
-            adjustment_factors[element] = modern_data / hist_data
-            logger.info(f"Adjustment factor for {element}: {adjustment_factors[element]:.3f}")
-    
-    # Apply adjustment factors to historical data
+
+    # One grouped mean per dataset over the overlapping years, aligned by element
+    hist_means = historical_df[historical_df['year'].isin(overlap_years)].groupby('element')['value'].mean()
+    modern_means = modern_df[modern_df['year'].isin(overlap_years)].groupby('element')['value'].mean()
+    means = modern_means.to_frame('modern').join(hist_means.rename('historical'), how='inner')
+    means = means[(means['modern'] > 0) & (means['historical'] > 0)]
+    adjustment_factors = means['modern'] / means['historical']
     for element, factor in adjustment_factors.items():
-        historical_df.loc[historical_df['element'] == element, 'value'] *= factor
-    
+        logger.info(f"Adjustment factor for {element}: {factor:.3f}")
+
+    # Apply adjustment factors to historical data
+    historical_df['value'] *= historical_df['element'].astype(object).map(adjustment_factors).fillna(1.0)
+
     return historical_df, modern_df
 
-def clean_faostat_data(input_files: list, output_file: str):
+def area_slug(area: str) -> str:
+    """File-name form of an area name, e.g. 'Papua New Guinea' -> 'papua_new_guinea'."""
+    return re.sub(r'[^a-z0-9]+', '_', area.lower()).strip('_')
+
+
+def area_output_path(path: Union[str, Path], area: str) -> Path:
     """
-    Clean and combine FAOSTAT food balance sheet data.
-    
-    Args:
-        input_files: List of input CSV files to process
-        output_file: Path to save the cleaned output
+    Per-area variant of an Australian output path.
+
+    'australia' in the file name is replaced by the area's slug (or the slug is
+    appended to the stem), so the paths for Australia are unchanged.
     """
-    dfs = []
-    
-    # Process each input file
-    for file in input_files:
-        if not Path(file).exists():
-            logger.warning(f"Input file not found: {file}")
+    path = Path(path)
+    slug = area_slug(area)
+    if slug == area_slug(DEFAULT_AREA):
+        return path
+    if area_slug(DEFAULT_AREA) in path.name:
+        return path.with_name(path.name.replace(area_slug(DEFAULT_AREA), slug))
+    return path.with_name(f"{path.stem}_{slug}{path.suffix}")
+
+
+class FAOStatStreamStats(BaseModel):
+    """Running totals kept by the streaming stages, updated one chunk at a time."""
+    chunks_read: int = 0
+    rows_read: int = 0
+    rows_in_areas: int = 0
+    rows_missing: int = 0
+    duplicates_removed: int = 0
+    invalid_rows: int = 0
+    rows_out: int = 0
+    error_counts: Dict[str, int] = Field(default_factory=dict)
+
+    def log(self) -> None:
+        logger.info(
+            f"FAOSTAT stream: read {self.rows_read} rows in {self.chunks_read} chunks, "
+            f"{self.rows_in_areas} in the requested areas, dropped {self.rows_missing} with missing values "
+            f"and {self.duplicates_removed} duplicates, kept {self.rows_out}"
+        )
+        if self.invalid_rows:
+            top_reasons = dict(sorted(self.error_counts.items(), key=lambda kv: -kv[1])[:3])
+            logger.warning(f"Dropped {self.invalid_rows} invalid FAOSTAT records; most common errors: {top_reasons}")
+
+
+def _read_stage(sources: Sequence[Union[str, Path]], chunksize: int, keep_codes: bool,
+                stats: FAOStatStreamStats) -> Iterator[pd.DataFrame]:
+    """Yield pruned chunks from every table of every source, with normalised column names."""
+    for source in sources:
+        if not Path(source).exists():
+            logger.warning(f"Input file not found: {source}")
             continue
-            
+        logger.info(f"Processing {source}")
         try:
-            logger.info(f"Processing {file}")
-            # Read data in chunks to manage memory
-            chunks = pd.read_csv(file, chunksize=5000)
-            
-            file_dfs = []
-            # Define required columns for a valid processed chunk
-            required_chunk_cols = ['area', 'item', 'element', 'year', 'value', 'unit']
-            for chunk in chunks:
-                logger.info(f"Processing chunk with {len(chunk)} rows")
-                # Basic cleaning
-                chunk = chunk.copy()
-                
-                # Check if this is historical data by looking for year columns (Y1961, Y1962, etc.)
-                year_cols = [col for col in chunk.columns if re.match(r'^Y\d{4}$', col)]
-                
-                # Handle historical data format 
-                if year_cols:
-                    logger.info(f"Detected historical data format with {len(year_cols)} year columns")
-                    # Keep only essential non-year columns for melting
-                    id_vars = [col for col in chunk.columns 
-                              if not re.match(r'^Y\d{4}$', col) 
-                              and not col.endswith(('F', 'N'))]
-                    
-                    # Melt year columns into rows
-                    chunk = pd.melt(
-                        chunk,
-                        id_vars=id_vars,
-                        value_vars=year_cols,
-                        var_name='year',
-                        value_name='value'
-                    )
-                    
-                    # Extract year number from 'Y1961' format
-                    chunk['year'] = chunk['year'].str.extract(r'Y(\d{4})').astype(int)
-                
-                # Ensure column names are standardized (after potential melting)
-                chunk.columns = [col.lower() for col in chunk.columns]
-                
-                # Keep only essential columns
-                # Filter for Australia only
-                if 'area' in chunk.columns:
-                    chunk = chunk[chunk['area'].str.lower() == 'australia']
-
-                # Filter columns after all processing to avoid dropping added columns prematurely
-                
-                    
-                
-                # Skip empty chunks
-                if len(chunk) == 0:
-                    continue
-                    
-                if not chunk.empty and all(col in chunk.columns for col in required_chunk_cols):
-                    file_dfs.append(chunk)
-                else:
-                    logger.warning(f"Skipping chunk from {file} due to missing required columns after processing. Columns present: {chunk.columns.tolist()}")
-            
-            if file_dfs:
-                df = pd.concat(file_dfs, ignore_index=True)
-                if not df.empty:
-                    dfs.append(df)
-                    logger.info(f"Added {len(df)} rows from {file}")
-                
+            # Read data in chunks to manage memory, straight out of ZIP archives
+            for label, chunks in iter_faostat_tables(source, chunksize, keep_codes):
+                for chunk in chunks:
+                    chunk.columns = [normalise_column(col) for col in chunk.columns]
+                    stats.chunks_read += 1
+                    stats.rows_read += len(chunk)
+                    yield chunk
         except Exception as e:
-            logger.error(f"Error processing {file}: {e}")
+            logger.error(f"Error processing {source}: {e}")
+
+
+def _filter_stage(chunks: Iterator[pd.DataFrame], areas: Sequence[str],
+                  stats: FAOStatStreamStats) -> Iterator[pd.DataFrame]:
+    """Keep the requested areas' rows; comparing a categorical touches each distinct area once."""
+    wanted_areas = [area.lower() for area in areas]
+    for chunk in chunks:
+        chunk = chunk[chunk['area'].str.lower().isin(wanted_areas)]
+        stats.rows_in_areas += len(chunk)
+        if not chunk.empty:
+            yield chunk
+
+
+def _melt_stage(chunks: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """Reshape wide tables (one Y#### column per year) into one row per year, with numeric values."""
+    for chunk in chunks:
+        year_cols = [col for col in chunk.columns if YEAR_COLUMN_PATTERN.match(col)]
+        if year_cols:
+            id_vars = [col for col in chunk.columns if col not in year_cols]
+            chunk = chunk.melt(id_vars=id_vars, value_vars=year_cols,
+                               var_name='year', value_name='value')
+            chunk['year'] = chunk['year'].map({col: int(col[1:]) for col in year_cols}).astype(int)
+        if not all(col in chunk.columns for col in FAOSTAT_REQUIRED_COLUMNS):
+            logger.warning(f"Skipping chunk due to missing required columns after processing. "
+                           f"Columns present: {chunk.columns.tolist()}")
             continue
-    
-    if not dfs:
-        logger.error("No data to process after reading input files")
+        # Non-numeric cells (e.g. '<0.5') become NaN and are dropped with the other missing values
+        yield chunk.assign(value=pd.to_numeric(chunk['value'], errors='coerce'))
+
+
+def _unit_stage(chunks: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    for chunk in chunks:
+        # The converted unit is not one of the parsed categories
+        yield convert_units(chunk.assign(unit=chunk['unit'].astype(object)))
+
+
+def _drop_missing_stage(chunks: Iterator[pd.DataFrame], stats: FAOStatStreamStats) -> Iterator[pd.DataFrame]:
+    """Coerce year and value to numbers and drop rows missing a year, value or element."""
+    for chunk in chunks:
+        chunk = chunk.assign(year=pd.to_numeric(chunk['year'], errors='coerce').astype('Int64'),
+                             value=pd.to_numeric(chunk['value'], errors='coerce'))
+        complete = chunk.dropna(subset=['year', 'value', 'element'])
+        stats.rows_missing += len(chunk) - len(complete)
+        if not complete.empty:
+            yield complete
+
+
+def _dedup_stage(chunks: Iterator[pd.DataFrame], keys: Sequence[str],
+                 stats: FAOStatStreamStats) -> Iterator[pd.DataFrame]:
+    """
+    Drop rows whose keys were already seen in this or any earlier chunk.
+
+    Only a 64-bit hash of each kept row's keys is remembered, so duplicates
+    are caught across chunk boundaries without holding the melted data.
+    """
+    keys = list(keys)
+    seen = set()
+    for chunk in chunks:
+        hashes = pd.util.hash_pandas_object(chunk[keys], index=False).to_numpy()
+        first_in_chunk = ~pd.Series(hashes).duplicated().to_numpy()
+        unseen = np.fromiter((h not in seen for h in hashes), dtype=bool, count=len(hashes))
+        keep = first_in_chunk & unseen
+        seen.update(hashes[keep].tolist())
+        stats.duplicates_removed += int((~keep).sum())
+        if keep.any():
+            yield chunk[keep]
+
+
+def _validate_stage(chunks: Iterator[pd.DataFrame], stats: FAOStatStreamStats) -> Iterator[pd.DataFrame]:
+    """Keep rows that satisfy FAOStatRecord, tallying the reasons for the rest."""
+    for chunk in chunks:
+        valid_df, errors_df = validate_frame(chunk)
+        stats.invalid_rows += len(errors_df)
+        for reason, count in errors_df['errors'].value_counts().items():
+            stats.error_counts[reason] = stats.error_counts.get(reason, 0) + int(count)
+        if not valid_df.empty:
+            yield valid_df
+
+
+def stream_faostat(sources: Sequence[Union[str, Path]], areas: Sequence[str] = (DEFAULT_AREA,),
+                   chunksize: int = FAOSTAT_CHUNK_SIZE, keep_codes: bool = False,
+                   unit_conversion: bool = False, dedup_keys: Sequence[str] = FAOSTAT_DEDUP_KEYS,
+                   validate: bool = False,
+                   stats: Optional[FAOStatStreamStats] = None) -> Iterator[pd.DataFrame]:
+    """
+    Stream cleaned long-format FAOSTAT chunks through read, filter, melt,
+    convert units, drop missing, deduplicate and validate stages.
+
+    Each stage is a generator that handles one chunk at a time, so memory is
+    bounded by the chunk size and the rows kept, never by the file size.
+    Consumers can aggregate incrementally as chunks arrive, or collect them
+    with ``collect_stream``.
+
+    Args:
+        sources: FAOSTAT CSV files or bulk ZIP archives (read without extracting).
+        areas: Areas to keep (matched case-insensitively).
+        chunksize: Rows per chunk read from each table.
+        keep_codes: Also keep the area, item and element code columns.
+        unit_conversion: Convert food supply quantities from kg/cap/yr to g/cap/d.
+        dedup_keys: Columns identifying a record; later repeats are dropped.
+        validate: Drop rows that FAOStatRecord would reject (requires ``keep_codes``).
+        stats: Optional running totals, updated as the stream is consumed.
+    """
+    stats = stats if stats is not None else FAOStatStreamStats()
+    chunks = _read_stage(sources, chunksize, keep_codes, stats)
+    chunks = _filter_stage(chunks, areas, stats)
+    chunks = _melt_stage(chunks)
+    if unit_conversion:
+        chunks = _unit_stage(chunks)
+    chunks = _drop_missing_stage(chunks, stats)
+    chunks = _dedup_stage(chunks, dedup_keys, stats)
+    if validate:
+        chunks = _validate_stage(chunks, stats)
+    for chunk in chunks:
+        stats.rows_out += len(chunk)
+        yield chunk
+
+
+def collect_stream(chunks: Iterator[pd.DataFrame], columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Concatenate a stream's chunks, turning categoricals back into plain strings."""
+    frames = list(chunks)
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    df = pd.concat(frames, ignore_index=True)
+    # Categoricals only pay off while parsing whole files; downstream stages expect plain strings
+    categorical_cols = df.select_dtypes('category').columns
+    df[categorical_cols] = df[categorical_cols].astype(object)
+    return df[columns] if columns else df
+
+
+def read_faostat_areas(input_files: list, areas: Sequence[str] = (DEFAULT_AREA,)) -> pd.DataFrame:
+    """Read the cleaned long-format rows for every area in ``areas`` in a single pass over the inputs."""
+    stats = FAOStatStreamStats()
+    df = collect_stream(stream_faostat(input_files, areas, stats=stats))
+    stats.log()
+    return df
+
+
+def pivot_faostat_area(combined_df: pd.DataFrame) -> pd.DataFrame:
+    """Pivot one area's cleaned long data (see stream_faostat) into one column per element."""
+    logger.info(f"Combined data shape: {combined_df.shape}")
+    # The stream leaves one row per year, item and element, so a plain unstack suffices
+    values = combined_df.set_index(['year', 'item', 'element'])['value'].sort_index()
+    return values.unstack('element').reset_index()
+
+
+def _pivot_and_write_area(area: str, area_df: pd.DataFrame, output_file: Union[str, Path]) -> pd.DataFrame:
+    """Pivot and save one area. Module-level so it can run in a worker process."""
+    if area_df.empty:
+        logger.error(f"No FAOSTAT data found for {area}")
         # Create empty output file to indicate processing was attempted
-        pd.DataFrame().to_csv(output_file, index=False)
-        return
-    
+        pivot_df = pd.DataFrame()
+    else:
+        pivot_df = pivot_faostat_area(area_df)
+    # Save in the configured processed data format
+    write_dataset(pivot_df, output_file)
+    logger.info(f"Successfully saved cleaned {area} data to {output_file}")
+    return pivot_df
+
+
+def clean_faostat_areas(input_files: list, output_files: Dict[str, Union[str, Path]],
+                        jobs: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Clean FAOSTAT data for several areas with a single pass over the inputs.
+
+    Rows for every requested area are kept while reading, grouped by area, and
+    each area is then pivoted and saved. With more than one area the per-area
+    work is spread across a process pool, so N countries cost little more
+    than one.
+
+    Args:
+        input_files: FAOSTAT CSV files or bulk ZIP archives (read without extracting)
+        output_files: Output path for each area name (matched case-insensitively)
+        jobs: Worker processes for the per-area work; defaults to the CPU count.
+
+    Returns:
+        The cleaned, pivoted data for each area, keyed as in ``output_files``.
+    """
+    areas = list(output_files)
+    combined_df = read_faostat_areas(input_files, areas)
+    if combined_df.empty:
+        logger.error("No data to process after reading input files")
+        by_area = {}
+    else:
+        by_area = dict(tuple(combined_df.groupby(combined_df['area'].str.lower(), sort=False)))
+    area_frames = {area: by_area.get(area.lower(), pd.DataFrame()) for area in areas}
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(areas)))
     try:
-        # Combine all data
-        combined_df = pd.concat(dfs, ignore_index=True)
-        logger.info(f"Combined data shape: {combined_df.shape}")
-        
-        # Convert year to int
-        combined_df['year'] = pd.to_numeric(combined_df['year'], errors='coerce').astype('Int64')
-        
-        # Convert value to float
-        combined_df['value'] = pd.to_numeric(combined_df['value'], errors='coerce')
-        
-        # Drop rows with missing essential data
-        combined_df = combined_df.dropna(subset=['year', 'value', 'element'])
-        logger.info(f"After dropping NA, data shape: {combined_df.shape}")
-        # Log columns present before sorting and duplicate removal for debugging missing 'data_type' issues
-        logger.info(f"Columns before FAOSTAT duplicate removal: {combined_df.columns.tolist()}")
-
-        # Sort and remove duplicates based on year, item, and element to ensure data integrity before pivoting
-        combined_df.sort_values(by=['year', 'item', 'element'], inplace=True)
-        before_dedup_len = len(combined_df)
-        combined_df.drop_duplicates(subset=['year', 'item', 'element'], keep='first', inplace=True)
-        duplicates_removed = before_dedup_len - len(combined_df)
-        logger.info(f"Removed {duplicates_removed} duplicate records from FAOSTAT data")
-        
-        # Create pivot table for easier analysis
-        pivot_df = combined_df.pivot_table(
-            index=['year', 'item'],
-            columns='element',
-            values='value',
-            aggfunc='first'
-        ).reset_index()
-        
-        # Save to CSV
-        pivot_df.to_csv(output_file, index=False)
-        logger.info(f"Successfully saved cleaned data to {output_file}")
-        
+        if jobs == 1:
+            return {area: _pivot_and_write_area(area, area_frames[area], output_files[area])
+                    for area in areas}
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {area: pool.submit(_pivot_and_write_area, area, area_frames[area], output_files[area])
+                       for area in areas}
+            return {area: future.result() for area, future in futures.items()}
     except Exception as e:
         logger.error(f"Error creating final output: {e}")
         raise
 
+
+def clean_faostat_data(input_files: list, output_file: str) -> pd.DataFrame:
+    """
+    Clean and combine FAOSTAT food balance sheet data for Australia.
+
+    Args:
+        input_files: FAOSTAT CSV files or bulk ZIP archives (read without extracting)
+        output_file: Path to save the cleaned output
+
+    Returns:
+        The cleaned, pivoted data that was written to ``output_file``.
+    """
+    return clean_faostat_areas(input_files, {DEFAULT_AREA: output_file}, jobs=1)[DEFAULT_AREA]
+
 if __name__ == "__main__":
     data_dir = Path("data/processed")
     # Deprecated intermediate files removed from processing pipeline
@@ -16,6 +16,7 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from src import config
+from src.pipeline.storage import read_dataset, write_dataset
 from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 from pydantic import BaseModel, Field
@@ -109,10 +110,10 @@ def load_data() -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     try:
         # Load FAOSTAT data
-        fao_df = pd.read_csv(config.FAOSTAT_PROCESSED_FILE)
+        fao_df = read_dataset(config.FAOSTAT_PROCESSED_FILE)
         
         # Load LA content data
-        la_df = pd.read_csv(config.LA_CONTENT_FIREINABOTTLE_PROCESSED_FILE)
+        la_df = read_dataset(config.LA_CONTENT_FIREINABOTTLE_PROCESSED_FILE)
         
         return fao_df, la_df
     except Exception as e:
@@ -170,7 +171,7 @@ def main():
     # Create and save mapping table
     mapping_df = pd.DataFrame(matches)
     output_path = config.FAO_LA_MAPPING_SEMANTIC_MATCHES_FILE
-    mapping_df.to_csv(output_path, index=False)
+    write_dataset(mapping_df, output_path)
     logger.info(f"Saved mapping table to {output_path}")
     
     # Print summary
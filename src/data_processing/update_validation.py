@@ -6,10 +6,11 @@ import pandas as pd
 import logging
 from pathlib import Path
 from src import config
+from src.pipeline.storage import read_dataset, write_dataset
 from .validation_utils import (
     get_manual_mapping,
     find_closest_match,
-    get_la_content_for_item,
+    get_la_content_for_items,
     validate_mapping,
     get_notes_for_item
 )
@@ -99,16 +100,14 @@ def main():
     
     # Load LA content data to get LA values
     logger.info("Loading LA content data")
-    la_content_df = pd.read_csv(config.LA_CONTENT_FIREINABOTTLE_PROCESSED_FILE)
+    la_content_df = read_dataset(config.LA_CONTENT_FIREINABOTTLE_PROCESSED_FILE)
     
     # Add LA content values using utility function
-    validation_df['la_content_per_100g'] = validation_df['matched_la_item'].apply(
-        lambda x: get_la_content_for_item(x, la_content_df)
-    )
+    validation_df['la_content_per_100g'] = get_la_content_for_items(validation_df['matched_la_item'], la_content_df)
     
     # Save the updated validation
     output_path = config.FAOSTAT_LA_MAPPING_FILE
-    validation_df.to_csv(output_path, index=False)
+    write_dataset(validation_df, output_path)
     logger.info(f"Saved updated mapping to {output_path}")
     
     # Print statistics
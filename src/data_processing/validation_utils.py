@@ -1,9 +1,23 @@
 """
 Utility functions for FAO-LA content mapping validation.
+
+LA content lookups go through LAContentIndex, which is built once per LA
+content table. Food names are indexed by character trigram, so a substring
+query only checks the rows that hold all of its trigrams instead of scanning
+the whole table.
+
+Fuzzy name matching goes through FuzzyMatcher, built once per list of
+names. Its trigram index picks the names whose trigrams overlap most with a
+query, and only those are scored with difflib's similarity ratio.
 """
 
+import heapq
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
 import pandas as pd
-from difflib import get_close_matches
+from difflib import SequenceMatcher
 import logging
 
 # Set up logging
@@ -28,90 +42,259 @@ def get_manual_mapping():
         'Beans, kidney, raw': 'Beans, kidney, red, mature seeds, raw'
     }
 
-def find_closest_match(food_name: str, available_names: list, manual_mapping: dict) -> tuple[str, float]:
+NGRAM_SIZE = 3
+
+
+def ngrams(text: str, size: int = NGRAM_SIZE) -> Set[str]:
+    """Distinct character n-grams of a string (empty if it is shorter than ``size``)."""
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+# Minimum similarity ratio for a fuzzy match
+FUZZY_MATCH_CUTOFF = 0.8
+# Names with the highest trigram overlap with a query that are scored for each fuzzy match
+FUZZY_MATCH_CANDIDATES = 50
+# Preparation suffixes ignored when comparing food names
+FOOD_NAME_VARIATIONS = (', raw', ', dried', ', cooked')
+
+
+def normalise_food_name(name: str) -> str:
+    """Remove common preparation variations (e.g. ', raw') from a food name."""
+    for variation in FOOD_NAME_VARIATIONS:
+        name = name.replace(variation, '')
+    return name
+
+
+class FuzzyMatcher:
+    """
+    Name matcher over a fixed list of available names.
+
+    Holds an exact name set, a map from normalised name to the first name with
+    that normalisation, and a trigram inverted index. Fuzzy queries only score
+    the ``max_candidates`` names with the highest (case-insensitive) trigram
+    overlap with the query, using difflib's similarity ratio, so a query
+    costs roughly the size of its trigram posting lists instead of a full
+    comparison with every name.
+    """
+
+    def __init__(self, available_names: Iterable[str], max_candidates: int = FUZZY_MATCH_CANDIDATES):
+        self.names = list(dict.fromkeys(available_names))
+        self.max_candidates = max_candidates
+        self._exact = set(self.names)
+        self._normalised: Dict[str, str] = {}
+        self._gram_counts: List[int] = []
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for position, name in enumerate(self.names):
+            self._normalised.setdefault(normalise_food_name(name), name)
+            grams = ngrams(name.lower())
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                postings[gram].append(position)
+        self._postings = dict(postings)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def candidates(self, query: str) -> List[str]:
+        """Names sharing trigrams with ``query``, by trigram overlap (Dice), up to ``max_candidates``."""
+        grams = ngrams(query.lower())
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        best = heapq.nlargest(self.max_candidates, shared.items(),
+                              key=lambda item: item[1] / (len(grams) + self._gram_counts[item[0]]))
+        return [self.names[position] for position, _ in best]
+
+    def top_k(self, query: str, k: int = 1, cutoff: float = FUZZY_MATCH_CUTOFF) -> List[Tuple[str, float]]:
+        """
+        Up to ``k`` candidate names with a similarity ratio of at least ``cutoff``.
+
+        Returns:
+            ``(name, ratio)`` pairs, best first; ties go to the larger name, as in difflib.
+        """
+        scorer = SequenceMatcher()
+        # SequenceMatcher caches details about the second sequence, so the query goes there
+        scorer.set_seq2(query)
+        scored = []
+        for name in self.candidates(query):
+            scorer.set_seq1(name)
+            if scorer.real_quick_ratio() >= cutoff and scorer.quick_ratio() >= cutoff:
+                ratio = scorer.ratio()
+                if ratio >= cutoff:
+                    scored.append((ratio, name))
+        return [(name, ratio) for ratio, name in heapq.nlargest(k, scored)]
+
+    def top_k_batch(self, queries: Iterable[str], k: int = 1,
+                    cutoff: float = FUZZY_MATCH_CUTOFF) -> Dict[str, List[Tuple[str, float]]]:
+        """``top_k`` for every distinct query."""
+        return {query: self.top_k(query, k, cutoff) for query in dict.fromkeys(queries)}
+
+    def match(self, food_name: str, manual_mapping: dict) -> Tuple[Optional[str], float]:
+        """Closest name for ``food_name`` and its score, as ``find_closest_match`` returns."""
+        # Check manual mapping first
+        mapped_name = manual_mapping.get(food_name)
+        if mapped_name is not None and mapped_name in self._exact:
+            return mapped_name, 1.0
+
+        if food_name in self._exact:
+            return food_name, 1.0
+
+        # Try removing common variations
+        normalised = self._normalised.get(normalise_food_name(food_name))
+        if normalised is not None:
+            return normalised, 1.0
+
+        # Try fuzzy matching with higher cutoff
+        matches = self.top_k(food_name, k=1, cutoff=FUZZY_MATCH_CUTOFF)
+        if matches:
+            return matches[0][0], FUZZY_MATCH_CUTOFF
+
+        return None, 0.0
+
+
+def find_closest_match(food_name: str, available_names: list, manual_mapping: dict,
+                       matcher: Optional[FuzzyMatcher] = None) -> tuple[str, float]:
     """
     Find the closest matching food name in the LA content database
     Returns the closest match and its similarity score
+
+    Pass a FuzzyMatcher built over ``available_names`` to reuse its index
+    across calls; one is built on the fly if omitted.
     """
-    # Check manual mapping first
-    if food_name in manual_mapping:
-        mapped_name = manual_mapping[food_name]
-        if mapped_name in available_names:
-            return mapped_name, 1.0
-    
-    # Try exact match first
-    if food_name in available_names:
-        return food_name, 1.0
-    
-    # Try removing common variations
-    normalized_name = food_name.replace(', raw', '').replace(', dried', '').replace(', cooked', '')
-    for available in available_names:
-        normalized_available = available.replace(', raw', '').replace(', dried', '').replace(', cooked', '')
-        if normalized_name == normalized_available:
-            return available, 1.0
-    
-    # Try fuzzy matching with higher cutoff
-    matches = get_close_matches(food_name, available_names, n=1, cutoff=0.8)
-    if matches:
-        return matches[0], 0.8
-    
-    return None, 0.0
+    if matcher is None:
+        matcher = FuzzyMatcher(available_names)
+    return matcher.match(food_name, manual_mapping)
+
+
+def find_closest_matches(food_names: Iterable[str], available_names: list,
+                         manual_mapping: dict) -> List[Tuple[Optional[str], float]]:
+    """``find_closest_match`` for many food names with one index build."""
+    matcher = FuzzyMatcher(available_names)
+    return [matcher.match(food_name, manual_mapping) for food_name in food_names]
+
+
+# FAO names whose LA content row is named differently
+LA_NAME_MAPPING = {
+    "Oil, sunflower": "Oil, sunflower, linoleic",
+    "Oil, soybean": "Oil, soybean, salad or cooking",
+    "Oil, peanut": "Oil, peanut, salad or cooking",
+    "Oil, corn germ": "Oil, corn, industrial and retail",
+    "Oil, sesame": "Oil, sesame, salad or cooking",
+    "Oil, olive": "Oil, olive, extra virgin",
+    "Oil, palm": "Oil, palm kernel",
+    "Oil, rapeseed": "Oil, canola",
+    "Nuts, walnuts": "Nuts, walnuts, english",
+    "Seeds, sunflower": "Seeds, sunflower seed kernels",
+    "Seeds, sesame": "Seeds, sesame seed kernels",
+    "Peanuts": "Peanuts, all types",
+    "Soybeans": "Soybeans, mature seeds",
+}
+# Only words longer than this are tried as partial matches
+PARTIAL_MATCH_MIN_LENGTH = 3
+# Queries containing these are regular expressions and are matched by scanning
+_REGEX_CHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+class LAContentIndex:
+    """
+    Lookup index over an LA content table (``food_name`` and ``percent`` columns).
+
+    Answers the same queries as a case-insensitive ``str.contains`` over the
+    food names, returning the first matching row, but only checks rows whose
+    names contain every trigram of the query. Results are memoised per query.
+    """
+
+    def __init__(self, la_content_df: pd.DataFrame):
+        self._names = [name.lower() if isinstance(name, str) else None for name in la_content_df['food_name']]
+        self._percent = la_content_df['percent'].to_numpy()
+        postings: Dict[str, Set[int]] = defaultdict(set)
+        for position, name in enumerate(self._names):
+            if name is not None:
+                for gram in ngrams(name):
+                    postings[gram].add(position)
+        self._postings = dict(postings)
+        self._first_match: Dict[str, Optional[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _scan(self, matches) -> Optional[int]:
+        return next((position for position, name in enumerate(self._names)
+                     if name is not None and matches(name)), None)
 
-def get_la_content_for_item(item_name: str, la_content_df: pd.DataFrame) -> float:
+    def first_match(self, query: str) -> Optional[int]:
+        """Position of the first food name containing ``query`` (already lower-cased), or None."""
+        if query in self._first_match:
+            return self._first_match[query]
+        if _REGEX_CHARACTERS.intersection(query):
+            # str.contains treats the query as a pattern; keep that behaviour for these rare queries
+            pattern = re.compile(query)
+            position = self._scan(lambda name: pattern.search(name) is not None)
+        elif len(query) < NGRAM_SIZE:
+            position = self._scan(lambda name: query in name)
+        else:
+            grams = sorted(ngrams(query), key=lambda gram: len(self._postings.get(gram, ())))
+            candidates = set(self._postings.get(grams[0], ()))
+            for gram in grams[1:]:
+                if not candidates:
+                    break
+                candidates &= self._postings.get(gram, set())
+            position = next((p for p in sorted(candidates) if query in self._names[p]), None)
+        self._first_match[query] = position
+        return position
+
+    def la_content(self, item_name: str) -> float:
+        """LA content percentage for an item, or 0 if no food name matches."""
+        query = item_name.lower()
+        position = self.first_match(query)
+        mapped_name = LA_NAME_MAPPING.get(item_name)
+        if position is None and mapped_name:
+            position = self.first_match(mapped_name.lower())
+        if position is None:
+            words = (word for word in query.split() if len(word) > PARTIAL_MATCH_MIN_LENGTH)
+            position = next((p for p in map(self.first_match, words) if p is not None), None)
+        if position is None:
+            logging.warning(f"No LA content data found for item: {item_name}")
+            return 0.0
+        return float(self._percent[position])
+
+
+def get_la_content_for_item(item_name: str, la_content_df: pd.DataFrame,
+                            index: Optional[LAContentIndex] = None) -> float:
     """Get LA content percentage for a given food item.
     
+    Tries the item name, then its mapped LA name, then each word longer than
+    three characters, as case-insensitive substrings of the food names.
+
     Args:
         item_name: Name of the food item
         la_content_df: DataFrame containing LA content data
+        index: Prebuilt index over ``la_content_df``; built on the fly if omitted
         
     Returns:
         float: LA content percentage for the item, or 0 if not found
     """
-    # Dictionary mapping FAO names to LA content names
-    name_mapping = {
-        "Oil, sunflower": "Oil, sunflower, linoleic",
-        "Oil, soybean": "Oil, soybean, salad or cooking",
-        "Oil, peanut": "Oil, peanut, salad or cooking",
-        "Oil, corn germ": "Oil, corn, industrial and retail",
-        "Oil, sesame": "Oil, sesame, salad or cooking",
-        "Oil, olive": "Oil, olive, extra virgin",
-        "Oil, palm": "Oil, palm kernel",
-        "Oil, rapeseed": "Oil, canola",
-        "Nuts, walnuts": "Nuts, walnuts, english",
-        "Seeds, sunflower": "Seeds, sunflower seed kernels",
-        "Seeds, sesame": "Seeds, sesame seed kernels",
-        "Peanuts": "Peanuts, all types",
-        "Soybeans": "Soybeans, mature seeds",
-    }
-    
     try:
-        # Try exact match first
-        mask = la_content_df['food_name'].str.lower().str.contains(item_name.lower())
-        if mask.any():
-            return float(la_content_df.loc[mask, 'percent'].iloc[0])
-            
-        # Try mapped name
-        mapped_name = name_mapping.get(item_name)
-        if mapped_name:
-            mask = la_content_df['food_name'].str.lower().str.contains(mapped_name.lower())
-            if mask.any():
-                return float(la_content_df.loc[mask, 'percent'].iloc[0])
-                
-        # Try partial match
-        words = item_name.lower().split()
-        for word in words:
-            if len(word) > 3:  # Only try matching words longer than 3 chars
-                mask = la_content_df['food_name'].str.lower().str.contains(word)
-                if mask.any():
-                    return float(la_content_df.loc[mask, 'percent'].iloc[0])
-        
-        logging.warning(f"No LA content data found for item: {item_name}")
-        return 0.0
-        
+        if index is None:
+            index = LAContentIndex(la_content_df)
+        return index.la_content(item_name)
     except Exception as e:
         logging.error(f"Error getting LA content for {item_name}: {str(e)}")
         return 0.0
 
+
+def get_la_content_for_items(item_names: Iterable, la_content_df: pd.DataFrame) -> List[Optional[float]]:
+    """
+    Get LA content percentages for many food items with one index build.
+
+    Each distinct name is looked up once; missing names (None or NaN) give None.
+    """
+    index = LAContentIndex(la_content_df)
+    item_names = list(item_names)
+    contents = {name: get_la_content_for_item(name, la_content_df, index)
+                for name in dict.fromkeys(name for name in item_names if pd.notna(name))}
+    return [contents[name] if pd.notna(name) else None for name in item_names]
+
 def validate_mapping(fao_items: list, matched_la_items: list) -> list:
     """
     Create validation status list based on matched items
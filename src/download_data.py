@@ -1,10 +1,35 @@
+"""
+Download the raw data files used by the ETL pipeline.
+
+Files are fetched concurrently by a bounded pool of worker threads. Requests
+to the same host share a pooled session, so connections are reused, and a
+worker that backs off after a failed attempt does not hold up the others.
+
+A download manifest (DownloadCache) records each file's ETag, Last-Modified,
+size and checksum. Later runs send conditional requests, so an unchanged source
+costs a single round-trip, and resume interrupted downloads with HTTP Range
+requests instead of starting again.
+All code and comments use Australian English.
+"""
+
+import argparse
+import csv
+import json
 import os
 import requests
+import threading
 import zipfile
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlsplit
+from xml.etree import ElementTree
+from pydantic import BaseModel, Field
+from requests.adapters import HTTPAdapter
 from src import config
+from src.pipeline.manifest import hash_file
 from typing import Dict, List, Optional
 import pandas as pd
 
@@ -13,18 +38,26 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 
 # Use centralised configuration for data directories
 config.RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
-FAOSTAT_EXTRACT_DIR = config.RAW_DATA_DIR / "faostat_oceania"
-FAOSTAT_HISTORIC_EXTRACT_DIR = config.RAW_DATA_DIR / "faostat_historic_oceania"
-FAOSTAT_EXTRACT_DIR.mkdir(parents=True, exist_ok=True)
-FAOSTAT_HISTORIC_EXTRACT_DIR.mkdir(parents=True, exist_ok=True)
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Leading bytes read when checking a file's structure
+VALIDATION_SAMPLE_BYTES = 64 * 1024
+ZIP_MAGIC = b'PK\x03\x04'
+OLE2_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+STATUS_DOWNLOADED = "downloaded"
+STATUS_RESUMED = "resumed"
+STATUS_NOT_MODIFIED = "not_modified"
+STATUS_FAILED = "failed"
 
 # Common headers for requests
 DEFAULT_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 }
 
-# List of files to download with their specific requirements
-# List of files to download with their specific requirements (centralised in config)
+# List of files to download with their specific requirements (centralised in config).
+# FAOSTAT archives are not extracted: the ETL streams their CSV members directly.
 FILES_TO_DOWNLOAD = [
     {
         "url": config.NCD_DIABETES_URL,
@@ -45,6 +78,7 @@ FILES_TO_DOWNLOAD = [
         "url": config.AIHW_PREVALENCE_URL,
         "filename": config.AIHW_PREVALENCE_FILENAME,
         "type": "excel",
+        "sheets": ["S2.4"],
         "headers": {
             'Accept': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
             'Referer': 'https://www.aihw.gov.au/'
@@ -54,6 +88,7 @@ FILES_TO_DOWNLOAD = [
         "url": config.AIHW_MORTALITY_URL,
         "filename": config.AIHW_MORTALITY_FILENAME,
         "type": "excel",
+        "sheets": ["S3.5"],
         "headers": {
             'Accept': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
             'Referer': 'https://www.aihw.gov.au/'
@@ -63,6 +98,7 @@ FILES_TO_DOWNLOAD = [
         "url": config.AIHW_CVD_URL,
         "filename": config.AIHW_CVD_FILENAME,
         "type": "excel",
+        "sheets": ["All CVD"],
         "headers": {
             'Accept': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
             "Referer": "https://www.aihw.gov.au/"
@@ -76,139 +112,562 @@ FILES_TO_DOWNLOAD = [
     {
         "url": config.ABS_POPULATION_URL,
         "filename": config.ABS_POPULATION_FILENAME,
-        "type": "excel"
+        "type": "excel",
+        "sheets": ["Data1"]
     },
     {
         "url": config.FAOSTAT_FBS_URL,
         "filename": config.FAOSTAT_FBS_FILENAME,
-        "type": "zip",
-        "extract": True
+        "type": "zip"
     },
     {
         "url": config.FAOSTAT_HISTORIC_URL,
         "filename": config.FAOSTAT_HISTORIC_FILENAME,
         "type": "zip",
-        "extract": True,
         "specific_files": config.FAOSTAT_HISTORIC_SPECIFIC_FILES
     }
 ]
-def validate_file(file_path: Path, file_type: str) -> bool:
-    """Validates downloaded files based on their type."""
+def _read_head(file_path: Path, size: int = VALIDATION_SAMPLE_BYTES) -> bytes:
+    with open(file_path, 'rb') as f:
+        return f.read(size)
+
+
+def _check_csv(file_path: Path) -> Optional[str]:
+    """Check a bounded sample holds a header and at least one data row."""
+    head = _read_head(file_path)
+    if head.lstrip().startswith(b'<'):
+        # Servers that block a download often return an HTML page with status 200
+        return "looks like an HTML page, not CSV"
+    lines = [line for line in head.decode('utf-8', errors='replace').splitlines() if line.strip()]
+    if len(head) == VALIDATION_SAMPLE_BYTES and len(lines) > 1:
+        lines = lines[:-1]  # The last line of a truncated sample may be cut short
+    if len(lines) < 2:
+        return "has no data rows after the header"
+    header_fields = len(next(csv.reader([lines[0]])))
+    if header_fields < 2:
+        return "header has fewer than two columns"
+    return None
+
+
+def _workbook_sheet_names(zip_ref: zipfile.ZipFile) -> List[str]:
+    """Sheet names from xl/workbook.xml, without parsing any worksheet."""
+    root = ElementTree.fromstring(zip_ref.read('xl/workbook.xml'))
+    return [el.get('name') for el in root.iter() if el.tag.endswith('}sheet') or el.tag == 'sheet']
+
+
+def _check_excel(file_path: Path, required_sheets: Optional[List[str]] = None) -> Optional[str]:
+    """Check magic bytes, the zip central directory and the workbook's sheet list."""
+    magic = _read_head(file_path, 8)
+    if magic.startswith(OLE2_MAGIC):
+        return None  # Legacy .xls: the container signature is all that can be checked cheaply
+    if not magic.startswith(ZIP_MAGIC):
+        return "is not an Excel workbook (bad magic bytes)"
+    with zipfile.ZipFile(file_path, 'r') as zip_ref:
+        if 'xl/workbook.xml' not in zip_ref.namelist():
+            return "has no xl/workbook.xml"
+        sheets = _workbook_sheet_names(zip_ref)
+    if not sheets:
+        return "has no worksheets"
+    missing = [name for name in (required_sheets or []) if name not in sheets]
+    if missing:
+        return f"is missing expected sheet(s) {missing}; found {sheets}"
+    return None
+
+
+def _check_zip(file_path: Path, specific_files: Optional[List[str]] = None) -> Optional[str]:
+    """Check magic bytes and that the central directory lists the expected members."""
+    if not _read_head(file_path, 4).startswith(ZIP_MAGIC):
+        return "is not a ZIP archive (bad magic bytes)"
+    with zipfile.ZipFile(file_path, 'r') as zip_ref:
+        names = zip_ref.namelist()
+    if not names:
+        return "is an empty ZIP archive"
+    missing = [name for name in (specific_files or []) if name not in names]
+    if missing:
+        return f"does not contain {missing}"
+    return None
+
+
+def _full_parse(file_path: Path, file_type: str) -> Optional[str]:
+    """Original validation: parse the whole file and require at least one row."""
+    if file_type == "csv":
+        df = pd.read_csv(file_path)
+    elif file_type == "excel":
+        df = pd.read_excel(file_path)
+    elif file_type == "zip":
+        with zipfile.ZipFile(file_path, 'r') as zip_ref:
+            bad_member = zip_ref.testzip()
+        return f"has a corrupt member {bad_member}" if bad_member else None
+    else:
+        return None
+    return None if len(df) > 0 else "has no rows"
+
+
+def validate_file(file_path: Path, file_type: str, required_sheets: Optional[List[str]] = None,
+                  specific_files: Optional[List[str]] = None, expected_sha256: Optional[str] = None,
+                  full: bool = False) -> bool:
+    """
+    Validates downloaded files based on their type.
+
+    By default only the file's structure is checked, which takes milliseconds:
+    magic bytes, a bounded header sample for CSVs, the zip central directory
+    for ZIPs, and the sheet list in xl/workbook.xml for Excel workbooks. The
+    ETL parses the data itself, so parsing it here as well is wasted work.
+
+    Args:
+        file_path: Downloaded file.
+        file_type: "csv", "excel" or "zip".
+        required_sheets: Sheet names an Excel workbook must contain.
+        specific_files: Members a ZIP archive must contain.
+        expected_sha256: If given, the file's checksum must match (e.g. from the download manifest).
+        full: Also parse the whole file (CSV/Excel) or CRC-check every member (ZIP).
+    """
     try:
         if not file_path.exists():
             return False
-        
+
         if file_path.stat().st_size == 0:
             logging.error(f"File {file_path} is empty")
             return False
 
         if file_type == "csv":
-            df = pd.read_csv(file_path)
-            return len(df) > 0
+            problem = _check_csv(file_path)
         elif file_type == "excel":
-            df = pd.read_excel(file_path)
-            return len(df) > 0
+            problem = _check_excel(file_path, required_sheets)
         elif file_type == "zip":
-            with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                return len(zip_ref.namelist()) > 0
+            problem = _check_zip(file_path, specific_files)
+        else:
+            problem = None
+        if problem is None and expected_sha256 and hash_file(file_path) != expected_sha256:
+            problem = "does not match the checksum in the download manifest"
+        if problem is None and full:
+            problem = _full_parse(file_path, file_type)
+        if problem:
+            logging.error(f"Validation failed for {file_path}: file {problem}")
+            return False
         return True
     except Exception as e:
         logging.error(f"Validation failed for {file_path}: {e}")
         return False
 
-def download_file(url: str, destination: Path, headers: Optional[Dict] = None, max_retries: int = 3) -> bool:
-    """Downloads a file from a URL to a destination path with retries."""
+
+class SessionPool:
+    """
+    One pooled requests session per host, shared by every download worker.
+
+    Files from the same host (three NCD-RisC CSVs, three AIHW workbooks, two
+    FAOSTAT zips) reuse kept-alive connections instead of opening a fresh
+    connection and TLS handshake for each request.
+    """
+
+    def __init__(self, pool_size: int = config.DOWNLOAD_MAX_WORKERS):
+        self.pool_size = max(1, pool_size)
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> requests.Session:
+        """Return the session for the URL's host, creating it on first use."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                session.headers.update(DEFAULT_HEADERS)
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._sessions[host] = session
+            return session
+
+    def close(self):
+        """Close every session and its pooled connections."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class DownloadProgress:
+    """Thread-safe tally of finished files and bytes received, logged as each file completes."""
+
+    def __init__(self, total_files: int):
+        self.total_files = total_files
+        self.finished_files = 0
+        self.bytes_received = 0
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add_bytes(self, count: int):
+        with self._lock:
+            self.bytes_received += count
+
+    def file_finished(self, filename: str, success: bool):
+        with self._lock:
+            self.finished_files += 1
+            elapsed = time.perf_counter() - self.started
+            logging.info(f"[{self.finished_files}/{self.total_files}] "
+                         f"{'Finished' if success else 'Failed'} {filename} "
+                         f"({self.bytes_received / 1e6:.1f} MB received in {elapsed:.1f}s)")
+
+
+class DownloadResult(BaseModel):
+    """Outcome of fetching and validating one entry of FILES_TO_DOWNLOAD."""
+    filename: str
+    url: str
+    success: bool
+    status: str = Field(..., description="downloaded, resumed, not_modified or failed")
+    bytes_received: int = Field(0, ge=0)
+    duration_seconds: float = Field(0.0, ge=0)
+    error: Optional[str] = None
+
+
+class DownloadCache:
+    """
+    JSON manifest of downloaded artefacts, keyed by file name.
+
+    Each entry records the source URL, the server's ETag and Last-Modified
+    validators, and the size and SHA-256 of the file on disk. These let the next
+    run send a conditional request, so an unchanged source costs one round-trip.
+    While a download is in progress the entry also holds the validators of the
+    partial file, so an interrupted transfer can resume with a Range request.
+    Entries are updated from several worker threads; every change is saved
+    atomically under a lock.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load the manifest, starting empty if it is missing or unreadable."""
+        if not self.path.exists():
+            return
+        try:
+            self.entries = json.loads(self.path.read_text()).get('files', {})
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not read download manifest {self.path}, starting fresh: {e}")
+            self.entries = {}
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        tmp_path.write_text(json.dumps({'files': self.entries}, indent=2, sort_keys=True))
+        tmp_path.replace(self.path)
+
+    def get(self, filename: str, url: str) -> Optional[Dict]:
+        """Return the entry for ``filename`` if it was fetched from ``url``."""
+        with self._lock:
+            entry = self.entries.get(filename)
+            if entry and entry.get('url') == url:
+                return dict(entry)
+            return None
+
+    def record_partial(self, filename: str, url: str, etag: Optional[str], last_modified: Optional[str]):
+        """Remember the validators of a download that has started, so it can be resumed."""
+        with self._lock:
+            entry = self.entries.setdefault(filename, {'url': url})
+            if entry.get('url') != url:
+                entry.clear()
+                entry['url'] = url
+            entry['partial'] = {'etag': etag, 'last_modified': last_modified}
+            self._save()
+
+    def discard_partial(self, filename: str, url: str):
+        """Forget the validators of a partial download that can no longer be resumed."""
+        with self._lock:
+            entry = self.entries.get(filename)
+            if entry and entry.get('url') == url and entry.pop('partial', None) is not None:
+                self._save()
+
+    def record(self, destination: Path, url: str, etag: Optional[str], last_modified: Optional[str]):
+        """Record a completed download with its validators, size and checksum."""
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'size': destination.stat().st_size,
+            'sha256': hash_file(destination),
+            'downloaded_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        with self._lock:
+            self.entries[destination.name] = entry
+            self._save()
+
+
+def partial_path(destination: Path) -> Path:
+    """Path an in-progress download is written to before it replaces ``destination``."""
+    return destination.with_name(destination.name + '.part')
+
+
+def _cached_copy_is_intact(destination: Path, entry: Optional[Dict]) -> bool:
+    """True when the file on disk is the one the manifest describes (checked by size)."""
+    return bool(entry) and entry.get('size') is not None and destination.exists() \
+        and destination.stat().st_size == entry['size']
+
+
+def _conditional_headers(entry: Dict) -> Dict[str, str]:
+    headers = {}
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+
+def _resume_headers(part_path: Path, entry: Optional[Dict]) -> Dict[str, str]:
+    """Range headers to resume ``part_path``, or none if it cannot be resumed safely."""
+    partial = (entry or {}).get('partial') or {}
+    # If-Range needs a validator, otherwise bytes from two versions of the file could be spliced
+    validator = partial.get('etag') or partial.get('last_modified')
+    if not validator or not part_path.exists() or part_path.stat().st_size == 0:
+        return {}
+    return {'Range': f"bytes={part_path.stat().st_size}-", 'If-Range': validator}
+
+
+def _resumes_at(response: requests.Response, offset: int) -> bool:
+    """True when the response is a 206 continuing exactly where the partial file ends."""
+    content_range = response.headers.get('Content-Range', '')
+    return response.status_code == 206 and content_range.startswith(f"bytes {offset}-")
+
+
+def fetch_file(url: str, destination: Path, headers: Optional[Dict] = None,
+               max_retries: int = config.DOWNLOAD_MAX_RETRIES,
+               session: Optional[requests.Session] = None,
+               progress: Optional[DownloadProgress] = None,
+               cache: Optional[DownloadCache] = None, force: bool = False) -> str:
+    """
+    Download ``url`` to ``destination`` with retries, returning the download status.
+
+    With a cache, a file whose validators are recorded is requested
+    conditionally (If-None-Match / If-Modified-Since) and left untouched on a
+    304, and a partial download kept from an earlier attempt or run is resumed
+    with a Range request. The body is written to a ``.part`` file that only
+    replaces ``destination`` once complete, so a failed download never
+    clobbers the previous good copy.
+
+    Args:
+        url: Source URL.
+        destination: Path to write the file to.
+        headers: Extra request headers, merged over DEFAULT_HEADERS.
+        max_retries: Attempts before giving up; failed attempts back off exponentially.
+        session: Pooled session to send the request on; a one-off request is made if omitted.
+        progress: Optional shared progress tally updated as chunks arrive.
+        cache: Optional download manifest enabling conditional and resumed requests.
+        force: Ignore recorded validators and fetch the file again (partials still resume).
+
+    Returns:
+        str: One of STATUS_DOWNLOADED, STATUS_RESUMED, STATUS_NOT_MODIFIED or STATUS_FAILED.
+    """
     all_headers = {**DEFAULT_HEADERS, **(headers or {})}
-    
+    http = session if session is not None else requests
+    part_path = partial_path(destination)
+    if cache is None and part_path.exists():
+        # Without recorded validators a leftover partial cannot be resumed safely
+        part_path.unlink()
+
     for attempt in range(max_retries):
+        entry = cache.get(destination.name, url) if cache is not None else None
+        request_headers = dict(all_headers)
+        if not force and _cached_copy_is_intact(destination, entry):
+            request_headers.update(_conditional_headers(entry))
+        resume = _resume_headers(part_path, entry)
+        request_headers.update(resume)
+        offset = part_path.stat().st_size if resume else 0
+
         try:
-            logging.info(f"Attempting to download: {url} (Attempt {attempt + 1}/{max_retries})")
-            response = requests.get(url, stream=True, timeout=60, headers=all_headers)
-            response.raise_for_status()
-
-            with open(destination, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            logging.info(f"Successfully downloaded: {destination.name}")
-            return True
+            logging.info(f"Attempting to download: {url} (Attempt {attempt + 1}/{max_retries})"
+                         + (f", resuming at byte {offset}" if resume else ""))
+            with http.get(url, stream=True, timeout=config.DOWNLOAD_TIMEOUT_SECONDS,
+                          headers=request_headers) as response:
+                if response.status_code == 304:
+                    logging.info(f"{destination.name} is unchanged since the last download")
+                    return STATUS_NOT_MODIFIED
+                if response.status_code == 416:
+                    # The partial no longer fits the remote file; start again from scratch
+                    part_path.unlink(missing_ok=True)
+                    raise requests.exceptions.HTTPError(f"416 Range Not Satisfiable for {url}",
+                                                        response=response)
+                response.raise_for_status()
+
+                resumed = bool(resume) and _resumes_at(response, offset)
+                if response.status_code == 206 and not resumed:
+                    # Writing a range that does not continue the partial would truncate the file;
+                    # drop the partial so the next attempt fetches the whole body
+                    part_path.unlink(missing_ok=True)
+                    if cache is not None:
+                        cache.discard_partial(destination.name, url)
+                    raise requests.exceptions.HTTPError(
+                        f"Partial response for {url} does not resume at byte {offset} "
+                        f"(Content-Range: {response.headers.get('Content-Range')})", response=response)
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                if not resumed and cache is not None:
+                    cache.record_partial(destination.name, url, etag, last_modified)
+                with open(part_path, 'ab' if resumed else 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        if progress is not None:
+                            progress.add_bytes(len(chunk))
+
+            part_path.replace(destination)
+            if cache is not None:
+                # A resumed response may omit validators; fall back to those of the partial
+                partial = ((entry or {}).get('partial') or {}) if resumed else {}
+                cache.record(destination, url, etag or partial.get('etag'),
+                             last_modified or partial.get('last_modified'))
+            logging.info(f"Successfully {'resumed' if resumed else 'downloaded'}: {destination.name}")
+            return STATUS_RESUMED if resumed else STATUS_DOWNLOADED
         except requests.exceptions.RequestException as e:
             logging.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
-            if destination.exists():
-                destination.unlink()
+            if cache is None:
+                part_path.unlink(missing_ok=True)
+            elif part_path.exists():
+                logging.info(f"Keeping {part_path.stat().st_size} bytes of {destination.name} to resume")
             if attempt < max_retries - 1:
+                # Only this worker waits; other downloads carry on meanwhile
                 time.sleep(2 ** attempt)  # Exponential backoff
             continue
         except Exception as e:
             logging.error(f"An unexpected error occurred while downloading {url}: {e}")
-            if destination.exists():
-                destination.unlink()
-            return False
-    return False
+            part_path.unlink(missing_ok=True)
+            return STATUS_FAILED
+    return STATUS_FAILED
+
+
+def download_file(url: str, destination: Path, headers: Optional[Dict] = None,
+                  max_retries: int = config.DOWNLOAD_MAX_RETRIES,
+                  session: Optional[requests.Session] = None,
+                  progress: Optional[DownloadProgress] = None,
+                  cache: Optional[DownloadCache] = None) -> bool:
+    """Downloads a file from a URL to a destination path with retries (see fetch_file)."""
+    status = fetch_file(url, destination, headers=headers, max_retries=max_retries,
+                        session=session, progress=progress, cache=cache)
+    return status != STATUS_FAILED
+
+
+def _recorded_checksum(cache: Optional[DownloadCache], filename: str, url: str) -> Optional[str]:
+    entry = cache.get(filename, url) if cache is not None else None
+    return entry.get('sha256') if entry else None
+
+
+def fetch_entry(file_info: Dict, dest_dir: Path, sessions: SessionPool,
+                progress: Optional[DownloadProgress] = None,
+                max_retries: int = config.DOWNLOAD_MAX_RETRIES,
+                cache: Optional[DownloadCache] = None, force: bool = False,
+                verify: bool = False, full_validation: bool = False) -> DownloadResult:
+    """
+    Download and validate a single FILES_TO_DOWNLOAD entry.
+
+    With ``verify``, a file the server reports unchanged is checked against the
+    SHA-256 recorded before this fetch; a file downloaded now has nothing
+    earlier to compare with, and its new checksum is recorded instead.
+    """
+    url = file_info["url"]
+    filename = file_info["filename"]
+    destination_path = Path(dest_dir) / filename
+    start = time.perf_counter()
+    error = None
+    # Read before fetching: a new download replaces the recorded checksum with its own
+    recorded_sha256 = _recorded_checksum(cache, filename, url) if verify else None
+
+    status = fetch_file(url, destination_path, headers=file_info.get("headers"),
+                        max_retries=max_retries, session=sessions.get(url), progress=progress,
+                        cache=cache, force=force)
+    if status == STATUS_FAILED:
+        error = "Download failed"
+    elif not validate_file(destination_path, file_info["type"],
+                           required_sheets=file_info.get("sheets"),
+                           specific_files=file_info.get("specific_files"),
+                           expected_sha256=recorded_sha256 if status == STATUS_NOT_MODIFIED else None,
+                           full=full_validation):
+        logging.error(f"File validation failed for {filename}")
+        error = "Validation failed"
+        status = STATUS_FAILED
+
+    if progress is not None:
+        progress.file_finished(filename, error is None)
+    return DownloadResult(
+        filename=filename,
+        url=url,
+        success=error is None,
+        status=status,
+        bytes_received=destination_path.stat().st_size if destination_path.exists() else 0,
+        duration_seconds=time.perf_counter() - start,
+        error=error,
+    )
+
 
-def extract_zip(zip_path: Path, extract_to: Path, specific_files: Optional[List[str]] = None):
+def download_all(files: Optional[List[Dict]] = None, dest_dir: Path = config.RAW_DATA_DIR,
+                 max_workers: int = config.DOWNLOAD_MAX_WORKERS,
+                 max_retries: int = config.DOWNLOAD_MAX_RETRIES,
+                 cache_path: Optional[Path] = None, use_cache: bool = True,
+                 force: bool = False, verify: bool = False,
+                 full_validation: bool = False) -> List[DownloadResult]:
     """
-    Extracts a ZIP file to a specified directory.
-    
+    Fetch every file concurrently with a bounded number of worker threads.
+
+    Unless ``use_cache`` is False, a download manifest in ``dest_dir`` (or at
+    ``cache_path``) makes unchanged sources cost one conditional request and
+    lets interrupted downloads resume.
+
     Args:
-        zip_path: Path to the ZIP file
-        extract_to: Directory to extract to
-        specific_files: Optional list of specific files to extract. If None, extracts all files.
+        files: Entries in the FILES_TO_DOWNLOAD format; defaults to FILES_TO_DOWNLOAD.
+        dest_dir: Directory downloaded files are written to.
+        max_workers: Maximum number of files fetched at the same time.
+        max_retries: Attempts per file before it is reported as failed.
+        cache_path: Download manifest location; defaults to dest_dir / config.DOWNLOAD_MANIFEST_FILENAME.
+        use_cache: Set False to always fetch whole files without a manifest.
+        force: Re-download files even if the server reports them unchanged.
+        verify: Check each file's SHA-256 against the download manifest.
+        full_validation: Fully parse every file instead of only checking its structure.
+
+    Returns:
+        List[DownloadResult]: One result per entry, in the order given.
     """
-    try:
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            if specific_files:
-                # Only extract specified files
-                for file in specific_files:
-                    if file in zip_ref.namelist():
-                        zip_ref.extract(file, extract_to)
-                        logging.info(f"Successfully extracted {file} from {zip_path.name}")
-                    else:
-                        logging.warning(f"File {file} not found in {zip_path.name}")
-            else:
-                # Extract all files
-                zip_ref.extractall(extract_to)
-                logging.info(f"Successfully extracted all files from {zip_path.name}")
-    except zipfile.BadZipFile:
-        logging.error(f"Error: {zip_path.name} is not a valid ZIP file or is corrupted.")
-    except Exception as e:
-        logging.error(f"Failed to extract {zip_path.name}: {e}")
-
-def main():
-    """Main function to download and extract files."""
-    successful_downloads = []
-    failed_downloads = []
-
-    # First handle regular file downloads
-    for file_info in FILES_TO_DOWNLOAD:
-        url = file_info["url"]
-        filename = file_info["filename"]
-        file_type = file_info["type"]
-        destination_path = config.RAW_DATA_DIR / filename
-        headers = file_info.get("headers")
-
-        if download_file(url, destination_path, headers=headers):
-            if validate_file(destination_path, file_type):
-                successful_downloads.append(filename)
-                # Handle extraction if needed
-                if file_info.get("extract"):
-                    # Determine extraction directory and specific files
-                    extract_dir = FAOSTAT_HISTORIC_EXTRACT_DIR if "Historic" in filename else FAOSTAT_EXTRACT_DIR
-                    specific_files = file_info.get("specific_files")
-                    extract_zip(destination_path, extract_dir, specific_files)
-            else:
-                failed_downloads.append(url)
-                logging.error(f"File validation failed for {filename}")
-        else:
-            failed_downloads.append(url)
+    files = FILES_TO_DOWNLOAD if files is None else files
+    if not files:
+        return []
+    dest_dir = Path(dest_dir)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    max_workers = max(1, min(max_workers, len(files)))
+    progress = DownloadProgress(len(files))
+    cache = None
+    if use_cache:
+        cache = DownloadCache(cache_path or dest_dir / config.DOWNLOAD_MANIFEST_FILENAME)
+    logging.info(f"Downloading {len(files)} files with {max_workers} worker(s)")
+
+    with SessionPool(pool_size=max_workers) as sessions, \
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="download") as pool:
+        futures = [pool.submit(fetch_entry, file_info, dest_dir, sessions, progress, max_retries,
+                               cache, force, verify, full_validation)
+                   for file_info in files]
+        return [future.result() for future in futures]
+
+
+def main(max_workers: int = config.DOWNLOAD_MAX_WORKERS, force: bool = False,
+         verify: bool = False, full_validation: bool = False):
+    """Main function to download files."""
+    results = download_all(max_workers=max_workers, force=force, verify=verify,
+                           full_validation=full_validation)
+    successful_downloads = [r.filename for r in results if r.success]
+    failed_downloads = [r.url for r in results if not r.success]
 
     # Print summary
     logging.info("\n--- Download Summary ---")
     if successful_downloads:
         logging.info("Successfully downloaded:")
-        for f in successful_downloads:
-            logging.info(f"  - {f}")
-        if any(f.endswith('.zip') for f in successful_downloads):
-             logging.info(f"  (ZIP contents extracted to {FAOSTAT_EXTRACT_DIR})")
+        for r in results:
+            if r.success:
+                note = " (unchanged)" if r.status == STATUS_NOT_MODIFIED else ""
+                logging.info(f"  - {r.filename}{note}")
     else:
         logging.info("No files were downloaded successfully.")
 
@@ -218,6 +677,18 @@ def main():
             logging.warning(f"  - {url}")
     else:
         logging.info("\nAll downloads attempted were successful.")
+    return results
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Download the raw data files used by the ETL pipeline.")
+    parser.add_argument('--workers', type=int, default=config.DOWNLOAD_MAX_WORKERS,
+                        help=f"Number of files to download at the same time (default: {config.DOWNLOAD_MAX_WORKERS})")
+    parser.add_argument('--force', action='store_true',
+                        help="Re-download files even if the server reports them unchanged")
+    parser.add_argument('--verify', action='store_true',
+                        help="Check each file's checksum against the download manifest")
+    parser.add_argument('--full-validation', action='store_true',
+                        help="Fully parse every file instead of only checking its structure")
+    args = parser.parse_args()
+    main(max_workers=args.workers, force=args.force, verify=args.verify,
+         full_validation=args.full_validation)
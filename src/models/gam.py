@@ -22,6 +22,7 @@ from typing import List, Dict, Tuple, Optional
 from pydantic import BaseModel, Field
 
 from src import config
+from src.pipeline.storage import read_dataset
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -326,7 +327,7 @@ if __name__ == '__main__':
     
     try:
         # Load the analytical dataset
-        df = pd.read_csv(config.ANALYTICAL_DATA_FINAL_FILE)
+        df = read_dataset(config.ANALYTICAL_DATA_FINAL_FILE)
         logger.info("Loaded analytical dataset")
         
         # Create output directory if it doesn't exist
@@ -21,6 +21,7 @@ from pathlib import Path
 import logging
 from pydantic import BaseModel, Field
 from src import config
+from src.pipeline.storage import read_dataset
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -258,7 +259,7 @@ def analyze_all_health_outcomes(df: pd.DataFrame, config: Optional[RegressionCon
 if __name__ == "__main__":
     # Load the analytical dataset
     try:
-        df = pd.read_csv(config.ANALYTICAL_DATA_FINAL_FILE)
+        df = read_dataset(config.ANALYTICAL_DATA_FINAL_FILE)
         logger.info("Loaded analytical dataset")
         
         # Create output directory if it doesn't exist
@@ -0,0 +1,8 @@
+"""
+Pipeline orchestration modules for the SeedoilsML ETL.
+
+Provides the declared stage graph, the scheduler used by run_etl.py, the
+build manifest for incremental rebuilds, the in-memory frame context and the
+processed dataset storage layer, and per-stage instrumentation.
+All code and comments use Australian English.
+"""
@@ -0,0 +1,82 @@
+"""
+In-memory DataFrame handoff between ETL stages.
+
+Within a single run_etl invocation, a stage that produces a processed dataset
+returns it to the scheduler, which keeps it in a PipelineContext keyed by the
+output path. Downstream stages receive the frames for their declared inputs
+directly, so the CSV written at each materialisation point is never parsed
+again in the same run. Frames for inputs produced in an earlier run (for
+example, an upstream stage skipped as up to date) are simply absent, and the
+consuming stage falls back to reading them from disk.
+
+Keys are normalised through the storage layer, so a frame stored under its
+logical ``.csv`` name is found by the Parquet or Arrow path of the same
+dataset and vice versa.
+
+The context also carries the stage's share of the scheduler's worker budget
+(``jobs``), which stages pass to their own process pools so nested pools do
+not multiply the number of processes.
+All code and comments use Australian English.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Mapping, Optional
+
+import pandas as pd
+
+from src.pipeline.storage import dataset_path
+
+logger = logging.getLogger(__name__)
+
+
+def context_key(path) -> Path:
+    """Normalise a path so lookups match however the caller spelt it."""
+    return dataset_path(path).resolve()
+
+
+class PipelineContext:
+    """Mapping of processed output path to the DataFrame produced this run."""
+
+    def __init__(self, frames: Optional[Mapping[Path, pd.DataFrame]] = None, jobs: int = 1):
+        self._frames: Dict[Path, pd.DataFrame] = {}
+        # Worker processes the stage may start for its own pools
+        self.jobs = max(1, jobs)
+        if frames:
+            self.update(frames)
+
+    def put(self, path, df: pd.DataFrame) -> None:
+        """Store the frame produced for ``path``."""
+        self._frames[context_key(path)] = df
+
+    def update(self, frames: Mapping[Path, pd.DataFrame]) -> None:
+        """Store every frame in ``frames``, ignoring entries that are not DataFrames."""
+        for path, df in frames.items():
+            if isinstance(df, pd.DataFrame):
+                self.put(path, df)
+            else:
+                logger.debug(f"Ignoring non-DataFrame artefact for {path}")
+
+    def get(self, path) -> Optional[pd.DataFrame]:
+        """Return the in-memory frame for ``path``, or None if it was not produced this run."""
+        return self._frames.get(context_key(path))
+
+    def subset(self, paths: Iterable[Path], jobs: int = 1) -> "PipelineContext":
+        """Return a context holding only the frames for ``paths`` (what a stage needs) and its worker budget."""
+        wanted = {context_key(p) for p in paths}
+        return PipelineContext({p: df for p, df in self._frames.items() if p in wanted}, jobs=jobs)
+
+    def retain(self, paths: Iterable[Path]) -> None:
+        """Drop every frame not in ``paths`` so memory is freed once no stage needs it."""
+        wanted = {context_key(p) for p in paths}
+        for path in [p for p in self._frames if p not in wanted]:
+            del self._frames[path]
+
+    def __contains__(self, path) -> bool:
+        return context_key(path) in self._frames
+
+    def __iter__(self) -> Iterator[Path]:
+        return iter(self._frames)
+
+    def __len__(self) -> int:
+        return len(self._frames)
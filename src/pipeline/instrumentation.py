@@ -0,0 +1,200 @@
+"""
+Per-stage instrumentation for the ETL pipeline.
+
+Every stage run by the scheduler is measured for wall time, CPU time, peak
+resident memory, rows in and out, and bytes read and written. The results are
+written as a machine-readable JSON run report and summarised as a table at the
+end of run_etl, giving data for capacity planning and for spotting regressions.
+
+Notes on the measurements:
+- CPU time is the executing process's user plus system time for the stage.
+- Peak RSS is the high-water mark of the process that ran the stage
+  (``ru_maxrss``). In a reused pool worker it carries over from earlier
+  stages, so it is an upper bound rather than this stage's own peak.
+  ``rss_growth_mb`` is how far the stage raised that high-water mark above
+  the value sampled just before it ran; it is zero when the stage stayed
+  below an earlier peak.
+- Rows in counts input frames handed over in memory, or the row count stored
+  in Parquet/Arrow metadata; CSV inputs are not scanned just to count rows.
+- Bytes read are the on-disk sizes of the declared inputs. Bytes written only
+  count declared output files the stage created or changed, so outputs left
+  over from an earlier run are not counted.
+- A stage that raises is still measured: its metrics travel on the exception
+  (``stage_metrics``) and are attached to the failed result.
+All code and comments use Australian English.
+"""
+
+import json
+import logging
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+from pydantic import BaseModel, Field
+
+from src.pipeline.context import PipelineContext
+from src.pipeline.stages import Stage
+from src.pipeline.storage import stored_row_count
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+if TYPE_CHECKING:
+    from src.pipeline.scheduler import StageResult
+
+logger = logging.getLogger(__name__)
+
+
+class StageMetrics(BaseModel):
+    """Resource usage of a single stage run."""
+    wall_seconds: float = Field(0.0, ge=0)
+    cpu_seconds: float = Field(0.0, ge=0)
+    peak_rss_mb: Optional[float] = Field(None, ge=0, description="High-water mark of the executing process, "
+                                                                 "including earlier stages in the same worker")
+    rss_growth_mb: Optional[float] = Field(None, ge=0, description="Rise in that high-water mark during the stage")
+    rows_in: Optional[int] = Field(None, ge=0)
+    rows_out: Optional[int] = Field(None, ge=0)
+    bytes_read: int = Field(0, ge=0)
+    bytes_written: int = Field(0, ge=0)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of the current process in MiB, if the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def path_bytes(paths: Iterable[Path]) -> int:
+    """Total on-disk size of the given files and directories (missing paths count as zero)."""
+    total = 0
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            total += sum(p.stat().st_size for p in path.rglob('*') if p.is_file())
+        elif path.is_file():
+            total += path.stat().st_size
+    return total
+
+
+def file_states(paths: Iterable[Path]) -> Dict[Path, Tuple[int, int]]:
+    """Modification time and size of every file in ``paths`` (directories are expanded)."""
+    states = {}
+    for path in paths:
+        path = Path(path)
+        files = [p for p in path.rglob('*') if p.is_file()] if path.is_dir() else [path] if path.is_file() else []
+        for file in files:
+            stat = file.stat()
+            states[file] = (stat.st_mtime_ns, stat.st_size)
+    return states
+
+
+def written_bytes(before: Dict[Path, Tuple[int, int]], paths: Iterable[Path]) -> int:
+    """Size of the files in ``paths`` that are new or changed since ``before`` was taken."""
+    return sum(size for file, (mtime, size) in file_states(paths).items() if before.get(file) != (mtime, size))
+
+
+def count_input_rows(stage: Stage, context: Optional[PipelineContext]) -> Optional[int]:
+    """Rows across a stage's inputs that can be counted without reading them."""
+    counts = []
+    for path in stage.inputs:
+        df = context.get(path) if context is not None else None
+        counts.append(len(df) if df is not None else stored_row_count(path))
+    counted = [c for c in counts if c is not None]
+    return sum(counted) if counted else None
+
+
+def measure_stage(stage: Stage, context: Optional[PipelineContext],
+                  run: Callable[[], Dict[Path, pd.DataFrame]]) -> Tuple[Dict[Path, pd.DataFrame], StageMetrics]:
+    """
+    Run ``run`` (the stage body) and measure it.
+
+    If the stage raises, the metrics gathered so far are set as the
+    exception's ``stage_metrics`` attribute before it propagates.
+
+    Returns:
+        The frames produced by the stage and its metrics.
+    """
+    bytes_read = path_bytes(stage.inputs)
+    rows_in = count_input_rows(stage, context)
+    outputs_before = file_states(stage.outputs)
+    rss_before = peak_rss_mb()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    produced = None
+
+    def collect() -> StageMetrics:
+        rss_after = peak_rss_mb()
+        return StageMetrics(
+            wall_seconds=time.perf_counter() - wall_start,
+            cpu_seconds=time.process_time() - cpu_start,
+            peak_rss_mb=rss_after,
+            rss_growth_mb=round(rss_after - rss_before, 1) if rss_after is not None else None,
+            rows_in=rows_in,
+            rows_out=sum(len(df) for df in produced.values()) if produced else None,
+            bytes_read=bytes_read,
+            bytes_written=written_bytes(outputs_before, stage.outputs),
+        )
+
+    try:
+        produced = run()
+    except Exception as e:
+        e.stage_metrics = collect()
+        raise
+    return produced, collect()
+
+
+def build_run_report(results: Dict[str, "StageResult"], started_at: datetime,
+                     wall_seconds: float, jobs: int) -> Dict:
+    """Assemble the JSON-serialisable run report."""
+    stages = []
+    for name, result in results.items():
+        entry = {'name': name, 'status': result.status, 'duration_seconds': round(result.duration_seconds, 3),
+                 'error': result.error}
+        if result.metrics is not None:
+            entry.update(result.metrics.model_dump())
+        stages.append(entry)
+    return {
+        'started_at': started_at.isoformat(timespec='seconds'),
+        'wall_seconds': round(wall_seconds, 3),
+        'jobs': jobs,
+        'peak_rss_mb': peak_rss_mb(),
+        'stages': stages,
+    }
+
+
+def write_run_report(report: Dict, path: Path) -> Path:
+    """Write the run report as JSON."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2))
+    logger.info(f"Saved ETL run report to {path}")
+    return path
+
+
+def format_summary(report: Dict) -> str:
+    """Render the run report's stages as a plain-text table."""
+    if not report['stages']:
+        return "No stages were run."
+    table = pd.DataFrame(report['stages']).set_index('name')
+    columns = [c for c in ['status', 'wall_seconds', 'cpu_seconds', 'peak_rss_mb', 'rss_growth_mb', 'rows_in',
+                           'rows_out', 'bytes_read', 'bytes_written'] if c in table.columns]
+    table = table[columns]
+    for col in ['bytes_read', 'bytes_written']:
+        if col in table.columns:
+            table[col] = table[col].map(lambda b: '' if pd.isna(b) else f"{b / (1024 * 1024):.1f} MiB")
+    for col in ['wall_seconds', 'cpu_seconds']:
+        if col in table.columns:
+            table[col] = table[col].map(lambda s: '' if pd.isna(s) else f"{s:.2f}")
+    for col in ['rows_in', 'rows_out']:
+        if col in table.columns:
+            table[col] = table[col].map(lambda n: '' if pd.isna(n) else f"{int(n):,}")
+    table = table.astype(object).where(table.notna(), '')
+    return table.to_string()
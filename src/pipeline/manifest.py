@@ -0,0 +1,130 @@
+"""
+Content-hash build manifest for incremental ETL rebuilds.
+
+For every stage the manifest records a fingerprint made from the stage code
+version, its config parameters and the SHA-256 of each declared input, plus the
+hashes of the outputs it produced. A stage is up to date when its fingerprint is
+unchanged and its outputs are still on disk with the recorded content. Because
+upstream outputs are downstream inputs, a dependent only rebuilds when an
+upstream output actually changes.
+All code and comments use Australian English.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.pipeline.stages import Stage
+
+logger = logging.getLogger(__name__)
+
+MISSING = "missing"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: Path, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """JSON-backed record of stage fingerprints and output hashes."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        # path -> {'size', 'mtime_ns', 'sha256'}; avoids rehashing unchanged files
+        self.file_cache: Dict[str, Dict[str, Any]] = {}
+        self.load()
+
+    def load(self) -> None:
+        """Load the manifest from disk, starting empty if it is missing or unreadable."""
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+            self.stages = data.get('stages', {})
+            self.file_cache = data.get('files', {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read build manifest {self.path}, starting fresh: {e}")
+            self.stages = {}
+            self.file_cache = {}
+
+    def save(self) -> None:
+        """Write the manifest atomically so an interrupted run cannot corrupt it."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        tmp_path.write_text(json.dumps({'stages': self.stages, 'files': self.file_cache},
+                                       indent=2, sort_keys=True))
+        tmp_path.replace(self.path)
+
+    def hash_path(self, path: Path) -> str:
+        """Hash a file or directory, reusing cached digests when size and mtime are unchanged."""
+        path = Path(path)
+        if path.is_dir():
+            digest = hashlib.sha256()
+            for child in sorted(p for p in path.rglob('*') if p.is_file()):
+                digest.update(str(child.relative_to(path)).encode())
+                digest.update(self.hash_path(child).encode())
+            return digest.hexdigest()
+        if not path.exists():
+            return MISSING
+
+        stat = path.stat()
+        key = str(path.resolve())
+        cached = self.file_cache.get(key)
+        if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+            return cached['sha256']
+        sha256 = hash_file(path)
+        self.file_cache[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256}
+        return sha256
+
+    def fingerprint(self, stage: Stage) -> str:
+        """Combine stage version, parameters and input hashes into a single digest."""
+        payload = {
+            'version': stage.version,
+            'params': stage.params,
+            'inputs': {str(p): self.hash_path(p) for p in stage.inputs},
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    def is_up_to_date(self, stage: Stage) -> bool:
+        """Return True when the stage can be skipped."""
+        record = self.stages.get(stage.name)
+        if not record or not stage.outputs:
+            return False
+        if record.get('fingerprint') != self.fingerprint(stage):
+            return False
+        recorded_outputs = record.get('outputs', {})
+        for output in stage.outputs:
+            current = self.hash_path(output)
+            if current == MISSING or recorded_outputs.get(str(output)) != current:
+                return False
+        return True
+
+    def record(self, stage: Stage) -> Optional[Dict[str, Any]]:
+        """Store the stage's fingerprint and output hashes after a successful run.
+
+        Stages that did not produce all of their declared outputs are not
+        recorded, so they run again next time.
+        """
+        outputs = {str(p): self.hash_path(p) for p in stage.outputs}
+        missing = [p for p, digest in outputs.items() if digest == MISSING]
+        if missing:
+            logger.warning(f"Stage '{stage.name}' did not produce {missing}; it will rerun next time")
+            self.stages.pop(stage.name, None)
+            return None
+        entry = {
+            'fingerprint': self.fingerprint(stage),
+            'outputs': outputs,
+            'built_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        self.stages[stage.name] = entry
+        return entry
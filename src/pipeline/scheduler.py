@@ -0,0 +1,235 @@
+"""
+Dependency-aware scheduler for the ETL stage graph.
+
+Independent stages run concurrently in a process pool, so a full rebuild takes
+roughly as long as the slowest chain of dependent stages rather than the sum of
+every stage. With ``jobs=1`` stages run in-process in topological order.
+
+When a build manifest is supplied, stages whose fingerprint (code version,
+parameters and input hashes) is unchanged are skipped without running.
+
+DataFrames returned by in-memory stages are held in a PipelineContext and
+handed to downstream stages directly, then released once no pending stage
+declares them as an input. The context also gives each stage its share of
+the ``jobs`` budget for any process pool of its own: a stage run on its own
+gets the whole budget, and stages started together split it between them.
+
+Each stage run is measured (see instrumentation) and its metrics attached to
+the StageResult, including for stages that fail.
+All code and comments use Australian English.
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+import pandas as pd
+from pydantic import BaseModel, Field
+
+from src.pipeline.context import PipelineContext, context_key
+from src.pipeline.instrumentation import StageMetrics, measure_stage
+from src.pipeline.manifest import BuildManifest
+from src.pipeline.stages import Stage, StageGraph
+
+logger = logging.getLogger(__name__)
+
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+STATUS_SKIPPED = "skipped"
+STATUS_UP_TO_DATE = "up_to_date"
+
+
+class StageResult(BaseModel):
+    """Outcome of a single stage run."""
+    name: str
+    status: str = Field(..., description="completed, failed, skipped or up_to_date")
+    duration_seconds: float = Field(0.0, ge=0)
+    error: Optional[str] = None
+    metrics: Optional[StageMetrics] = None
+
+
+def execute_stage(stage: Stage,
+                  context: Optional[PipelineContext] = None) -> Tuple[Dict[Path, pd.DataFrame], StageMetrics]:
+    """
+    Run and measure a stage. Module-level so it can be pickled into worker processes.
+
+    Returns:
+        Frames the stage produced for its declared outputs, and the stage metrics.
+    """
+    return measure_stage(stage, context, lambda: _call_stage(stage, context))
+
+
+def _call_stage(stage: Stage, context: Optional[PipelineContext]) -> Dict[Path, pd.DataFrame]:
+    """Call the stage function, returning the frames produced for its declared outputs."""
+    if not stage.in_memory:
+        stage.func()
+        return {}
+    produced = stage.func(context=context if context is not None else PipelineContext())
+    if not isinstance(produced, dict):
+        return {}
+    # Only hand back declared outputs; anything else would be pickled for nothing
+    declared = {context_key(p) for p in stage.outputs}
+    return {path: df for path, df in produced.items()
+            if context_key(path) in declared and isinstance(df, pd.DataFrame)}
+
+
+def _frames_still_needed(graph: StageGraph, pending: Dict[str, set]) -> Set[Path]:
+    """Inputs of pending in-memory stages; every other frame can be released."""
+    needed = set()
+    for name in pending:
+        stage = graph.stages[name]
+        if stage.in_memory:
+            needed.update(stage.inputs)
+    return needed
+
+
+def _skip_dependents(graph: StageGraph, failed: str, results: Dict[str, StageResult],
+                     pending: Dict[str, set]) -> None:
+    """Mark every stage downstream of a failed stage as skipped."""
+    for name in graph.dependents(failed):
+        if name in pending:
+            del pending[name]
+            results[name] = StageResult(name=name, status=STATUS_SKIPPED,
+                                        error=f"Upstream stage '{failed}' failed")
+            logger.warning(f"Skipping stage '{name}' because upstream stage '{failed}' failed")
+
+
+def _check_up_to_date(stage: Stage, manifest: Optional[BuildManifest], force: bool) -> bool:
+    """Return True if the manifest says the stage can be skipped."""
+    if manifest is None or force:
+        return False
+    if manifest.is_up_to_date(stage):
+        logger.info(f"Stage '{stage.name}' is up to date; skipping")
+        return True
+    return False
+
+
+def _record_success(stage: Stage, manifest: Optional[BuildManifest]) -> None:
+    """Persist the stage's fingerprint after it completes."""
+    if manifest is None:
+        return
+    manifest.record(stage)
+    manifest.save()
+
+
+def _run_sequential(graph: StageGraph, jobs: int, manifest: Optional[BuildManifest], force: bool,
+                    context: PipelineContext) -> Dict[str, StageResult]:
+    """Run stages one at a time in topological order, each with the whole ``jobs`` budget."""
+    results: Dict[str, StageResult] = {}
+    pending = {name: set(graph.dependencies[name]) for name in graph.order}
+    for name in graph.order:
+        if name not in pending:
+            continue
+        del pending[name]
+        stage = graph.stages[name]
+        if _check_up_to_date(stage, manifest, force):
+            results[name] = StageResult(name=name, status=STATUS_UP_TO_DATE)
+            continue
+        logger.info(f"Starting stage '{name}'")
+        start = time.perf_counter()
+        try:
+            produced, metrics = execute_stage(stage, context.subset(stage.inputs, jobs=jobs))
+            context.update(produced)
+            results[name] = StageResult(name=name, status=STATUS_COMPLETED,
+                                        duration_seconds=time.perf_counter() - start, metrics=metrics)
+            _record_success(stage, manifest)
+        except Exception as e:
+            logger.error(f"Stage '{name}' failed: {e}")
+            results[name] = StageResult(name=name, status=STATUS_FAILED,
+                                        duration_seconds=time.perf_counter() - start, error=str(e),
+                                        metrics=getattr(e, "stage_metrics", None))
+            _skip_dependents(graph, name, results, pending)
+        context.retain(_frames_still_needed(graph, pending))
+    return results
+
+
+def _run_parallel(graph: StageGraph, jobs: int, manifest: Optional[BuildManifest], force: bool,
+                  context: PipelineContext) -> Dict[str, StageResult]:
+    """Run independent stages concurrently, submitting each as soon as its dependencies finish."""
+    results: Dict[str, StageResult] = {}
+    pending = {name: set(graph.dependencies[name]) for name in graph.order}
+    running: Dict[Future, str] = {}
+    started: Dict[str, float] = {}
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(graph))) as pool:
+        while pending or running:
+            # Submit in topological order so scheduling is deterministic for a given graph
+            ready = [name for name in graph.order if name in pending and not pending[name]]
+            up_to_date = [name for name in ready
+                          if _check_up_to_date(graph.stages[name], manifest, force)]
+            for name in up_to_date:
+                del pending[name]
+                results[name] = StageResult(name=name, status=STATUS_UP_TO_DATE)
+                for deps in pending.values():
+                    deps.discard(name)
+            if up_to_date:
+                # Skipping may have unblocked further stages; re-evaluate before waiting
+                continue
+            # Stages running side by side share the budget, so nested pools stay close to ``jobs`` processes
+            stage_jobs = max(1, jobs // max(1, len(running) + len(ready)))
+            for name in ready:
+                del pending[name]
+                logger.info(f"Starting stage '{name}'")
+                started[name] = time.perf_counter()
+                stage = graph.stages[name]
+                running[pool.submit(execute_stage, stage, context.subset(stage.inputs, jobs=stage_jobs))] = name
+
+            if not running:
+                # Nothing runnable and nothing in flight: remaining stages are unreachable
+                for name in list(pending):
+                    results[name] = StageResult(name=name, status=STATUS_SKIPPED,
+                                                error="Dependencies could not be satisfied")
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                duration = time.perf_counter() - started[name]
+                try:
+                    produced, metrics = future.result()
+                except Exception as e:
+                    logger.error(f"Stage '{name}' failed: {e}")
+                    results[name] = StageResult(name=name, status=STATUS_FAILED,
+                                                duration_seconds=duration, error=str(e),
+                                                metrics=getattr(e, "stage_metrics", None))
+                    _skip_dependents(graph, name, results, pending)
+                    continue
+                context.update(produced)
+                results[name] = StageResult(name=name, status=STATUS_COMPLETED,
+                                            duration_seconds=duration, metrics=metrics)
+                _record_success(graph.stages[name], manifest)
+                logger.info(f"Finished stage '{name}' in {duration:.1f}s")
+                for deps in pending.values():
+                    deps.discard(name)
+            context.retain(_frames_still_needed(graph, pending))
+    return results
+
+
+def run_stages(graph: StageGraph, jobs: int = 1, manifest: Optional[BuildManifest] = None,
+               force: bool = False, context: Optional[PipelineContext] = None) -> Dict[str, StageResult]:
+    """
+    Run every stage in the graph, respecting declared dependencies.
+
+    Args:
+        graph: The stage graph to execute.
+        jobs: Worker budget. Up to this many stages run at the same time, and
+            stages running together split it for their own worker pools.
+            Values of 1 or less run stages sequentially in the current process.
+        manifest: Optional build manifest used to skip unchanged stages.
+        force: If True, run every stage regardless of the manifest.
+        context: Optional store of frames already in memory; a fresh one is used if omitted.
+
+    Returns:
+        Dict[str, StageResult]: Result for each stage, keyed by stage name.
+    """
+    if len(graph) == 0:
+        return {}
+    jobs = max(1, jobs)
+    logger.info(f"Running {len(graph)} stages with {jobs} job(s): {', '.join(graph.order)}")
+    if context is None:
+        context = PipelineContext()
+    if jobs == 1 or len(graph) == 1:
+        return _run_sequential(graph, jobs, manifest, force, context)
+    return _run_parallel(graph, jobs, manifest, force, context)
@@ -0,0 +1,121 @@
+"""
+Declarative stage graph for the ETL pipeline.
+
+Each stage declares the files it reads, the files it writes and the stages it
+depends on. Dependencies are the union of the explicit ``depends_on`` list and
+any stage whose declared outputs appear in this stage's inputs.
+All code and comments use Australian English.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class StageGraphError(ValueError):
+    """Raised when a stage graph is malformed (unknown dependency or cycle)."""
+    pass
+
+
+class Stage(BaseModel):
+    """A single unit of ETL work and its declared inputs, outputs and dependencies."""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    name: str = Field(..., min_length=1, description="Unique stage name")
+    func: Callable[..., Any] = Field(..., description="Module-level callable that performs the stage")
+    inputs: List[Path] = Field(default_factory=list, description="Files or directories read by the stage")
+    outputs: List[Path] = Field(default_factory=list, description="Files written by the stage")
+    depends_on: List[str] = Field(default_factory=list, description="Names of stages that must finish first")
+    version: str = Field("1", description="Bump when the stage's code changes its outputs")
+    params: Dict[str, Any] = Field(default_factory=dict, description="Config values that affect the outputs")
+    in_memory: bool = Field(False, description="Receives upstream frames via a ``context`` keyword and "
+                                               "returns a mapping of output path to DataFrame")
+    description: Optional[str] = Field(None, description="Short human-readable summary")
+
+
+class StageGraph:
+    """A validated, acyclic collection of stages."""
+
+    def __init__(self, stages: Iterable[Stage]):
+        self.stages: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise StageGraphError(f"Duplicate stage name: {stage.name}")
+            self.stages[stage.name] = stage
+        self.dependencies = self._resolve_dependencies()
+        self.order = self._topological_order()
+
+    def _resolve_dependencies(self) -> Dict[str, Set[str]]:
+        """Combine explicit dependencies with those implied by shared file paths."""
+        producers = {}
+        for stage in self.stages.values():
+            for output in stage.outputs:
+                producers[Path(output).resolve()] = stage.name
+
+        dependencies = {}
+        for stage in self.stages.values():
+            deps = set()
+            for dep in stage.depends_on:
+                if dep not in self.stages:
+                    raise StageGraphError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+                deps.add(dep)
+            for path in stage.inputs:
+                producer = producers.get(Path(path).resolve())
+                if producer and producer != stage.name:
+                    deps.add(producer)
+            dependencies[stage.name] = deps
+        return dependencies
+
+    def _topological_order(self) -> List[str]:
+        """Return stage names in dependency order, preserving declaration order for ties."""
+        remaining = {name: set(deps) for name, deps in self.dependencies.items()}
+        order = []
+        while remaining:
+            ready = [name for name in self.stages if name in remaining and not remaining[name]]
+            if not ready:
+                raise StageGraphError(f"Cycle detected between stages: {sorted(remaining)}")
+            for name in ready:
+                order.append(name)
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return order
+
+    def dependents(self, name: str) -> Set[str]:
+        """Return every stage that directly or transitively depends on ``name``."""
+        found = set()
+        frontier = [name]
+        while frontier:
+            current = frontier.pop()
+            for other, deps in self.dependencies.items():
+                if current in deps and other not in found:
+                    found.add(other)
+                    frontier.append(other)
+        return found
+
+    def subgraph(self, names: Iterable[str]) -> "StageGraph":
+        """Build a graph restricted to ``names``.
+
+        Dependencies on stages outside the selection are dropped; their outputs
+        are assumed to already exist on disk from an earlier run.
+        """
+        selected = set(names)
+        unknown = selected - set(self.stages)
+        if unknown:
+            raise StageGraphError(f"Unknown stages selected: {sorted(unknown)}")
+        stages = []
+        for name in self.stages:
+            if name not in selected:
+                continue
+            stage = self.stages[name]
+            stages.append(stage.model_copy(update={
+                'depends_on': [dep for dep in stage.depends_on if dep in selected]
+            }))
+        return StageGraph(stages)
+
+    def __len__(self) -> int:
+        return len(self.stages)
+
+    def __iter__(self):
+        return (self.stages[name] for name in self.order)
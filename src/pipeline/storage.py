@@ -0,0 +1,203 @@
+"""
+Pluggable storage for processed datasets.
+
+Processed artefacts are named in config by their logical ``.csv`` path. The
+storage layer maps that name onto the configured format (Parquet, Arrow IPC or
+CSV), writes the frame with its schema, and optionally keeps a CSV copy beside
+it as a side output for spreadsheets and notebooks. Readers use
+``read_dataset`` with an optional column list; columnar files are read with
+column projection (and memory-mapped for Arrow) instead of re-parsing CSV and
+re-inferring dtypes.
+
+pyarrow is optional: without it every dataset is stored as CSV.
+All code and comments use Australian English.
+"""
+
+import logging
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import pandas as pd
+
+from src import config
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    pa = None
+    logging.getLogger(__name__).warning(
+        "pyarrow is not installed; processed datasets will be stored as CSV. "
+        "Install it with 'pip install pyarrow' for Parquet/Arrow storage."
+    )
+
+logger = logging.getLogger(__name__)
+
+FORMAT_CSV = "csv"
+FORMAT_PARQUET = "parquet"
+FORMAT_ARROW = "arrow"
+FORMAT_SUFFIXES = {FORMAT_CSV: ".csv", FORMAT_PARQUET: ".parquet", FORMAT_ARROW: ".arrow"}
+# Suffix used by config for the logical (format-independent) dataset name
+LOGICAL_SUFFIX = ".csv"
+
+
+def active_format(fmt: Optional[str] = None) -> str:
+    """Return the storage format to use, falling back to CSV when pyarrow is unavailable."""
+    fmt = (fmt or config.PROCESSED_DATA_FORMAT).lower()
+    if fmt not in FORMAT_SUFFIXES:
+        raise ValueError(f"Unknown processed data format '{fmt}'. Expected one of {sorted(FORMAT_SUFFIXES)}")
+    if fmt != FORMAT_CSV and pa is None:
+        return FORMAT_CSV
+    return fmt
+
+
+def dataset_path(path, fmt: Optional[str] = None) -> Path:
+    """Map a logical ``.csv`` dataset name onto the file written in ``fmt``.
+
+    Paths with any other suffix (e.g. Markdown metadata) are returned unchanged.
+    """
+    path = Path(path)
+    if path.suffix.lower() != LOGICAL_SUFFIX:
+        return path
+    return path.with_suffix(FORMAT_SUFFIXES[active_format(fmt)])
+
+
+def dataset_files(path, fmt: Optional[str] = None, csv_export: Optional[bool] = None) -> List[Path]:
+    """Every file ``write_dataset`` produces for ``path``: the primary file and any CSV side output."""
+    primary = dataset_path(path, fmt)
+    files = [primary]
+    if csv_export is None:
+        csv_export = config.PROCESSED_CSV_EXPORT
+    csv_path = Path(path).with_suffix(LOGICAL_SUFFIX)
+    if csv_export and primary != csv_path and Path(path).suffix.lower() == LOGICAL_SUFFIX:
+        files.append(csv_path)
+    return files
+
+
+def write_dataset(df: pd.DataFrame, path, fmt: Optional[str] = None,
+                  csv_export: Optional[bool] = None) -> Path:
+    """
+    Write a processed dataset in the configured format.
+
+    Args:
+        df: Frame to write.
+        path: Logical dataset path (as declared in config).
+        fmt: Storage format; defaults to ``config.PROCESSED_DATA_FORMAT``.
+        csv_export: Also write a CSV copy; defaults to ``config.PROCESSED_CSV_EXPORT``.
+
+    Returns:
+        Path: The primary file written.
+    """
+    files = dataset_files(path, fmt, csv_export)
+    primary = files[0]
+    primary.parent.mkdir(parents=True, exist_ok=True)
+    fmt = active_format(fmt)
+
+    if fmt == FORMAT_CSV or primary.suffix.lower() == LOGICAL_SUFFIX:
+        df.to_csv(primary, index=False)
+    else:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            # Object columns holding mixed or non-primitive values cannot be typed by Arrow
+            logger.debug(f"Storing object columns of {primary.name} as strings: {e}")
+            table = pa.Table.from_pandas(_stringify_objects(df), preserve_index=False)
+        if fmt == FORMAT_PARQUET:
+            pq.write_table(table, primary)
+        else:
+            feather.write_feather(table, primary, compression="uncompressed")
+
+    for side_output in files[1:]:
+        df.to_csv(side_output, index=False)
+    logger.debug(f"Wrote {len(df)} rows to {', '.join(str(f) for f in files)}")
+    return primary
+
+
+def _stringify_objects(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast object columns to strings (keeping missing values) so Arrow can infer a schema."""
+    converted = df.copy()
+    for col in converted.columns[converted.dtypes == object]:
+        converted[col] = converted[col].map(_to_str)
+    return converted
+
+
+def _to_str(value):
+    """Stringify a value, leaving missing values (None, NaN, NA) as they are."""
+    if value is None or value is pd.NA or (isinstance(value, float) and value != value):
+        return value
+    return str(value)
+
+
+def find_dataset(path) -> Optional[Path]:
+    """Return the file holding ``path``, preferring the configured format, or None if absent."""
+    preferred = dataset_path(path)
+    if preferred.exists():
+        return preferred
+    candidates = [Path(path).with_suffix(suffix) for suffix in FORMAT_SUFFIXES.values()]
+    if Path(path).suffix.lower() != LOGICAL_SUFFIX:
+        candidates = [Path(path)]
+    for candidate in candidates:
+        if candidate.exists() and (pa is not None or candidate.suffix.lower() == LOGICAL_SUFFIX):
+            return candidate
+    return None
+
+
+def dataset_exists(path) -> bool:
+    """Return True if the dataset exists in any readable format."""
+    return find_dataset(path) is not None
+
+
+def dataset_columns(path) -> List[str]:
+    """Return a dataset's column names from its stored schema without loading the data."""
+    source = find_dataset(path)
+    if source is None:
+        raise FileNotFoundError(f"Dataset not found: {path}")
+    suffix = source.suffix.lower()
+    if suffix == FORMAT_SUFFIXES[FORMAT_PARQUET]:
+        return list(pq.read_schema(source).names)
+    if suffix == FORMAT_SUFFIXES[FORMAT_ARROW]:
+        with pa.memory_map(str(source)) as source_file:
+            return list(pa.ipc.open_file(source_file).schema.names)
+    return list(pd.read_csv(source, nrows=0).columns)
+
+
+def stored_row_count(path) -> Optional[int]:
+    """Row count from a columnar file's metadata, or None for CSV and missing files."""
+    path = Path(path)
+    if pa is None or not path.is_file():
+        return None
+    suffix = path.suffix.lower()
+    try:
+        if suffix == FORMAT_SUFFIXES[FORMAT_PARQUET]:
+            return pq.read_metadata(path).num_rows
+        if suffix == FORMAT_SUFFIXES[FORMAT_ARROW]:
+            with pa.memory_map(str(path)) as source_file:
+                reader = pa.ipc.open_file(source_file)
+                return sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+    except (OSError, pa.ArrowException) as e:
+        logger.debug(f"Could not read row count from {path}: {e}")
+    return None
+
+
+def read_dataset(path, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """
+    Read a processed dataset written by ``write_dataset``.
+
+    Args:
+        path: Logical dataset path (as declared in config).
+        columns: Optional subset of columns to load.
+
+    Raises:
+        FileNotFoundError: If the dataset does not exist in any format.
+    """
+    source = find_dataset(path)
+    if source is None:
+        raise FileNotFoundError(f"Dataset not found: {path}")
+    columns = list(columns) if columns is not None else None
+    suffix = source.suffix.lower()
+    if suffix == FORMAT_SUFFIXES[FORMAT_PARQUET]:
+        return pq.read_table(source, columns=columns, memory_map=True).to_pandas()
+    if suffix == FORMAT_SUFFIXES[FORMAT_ARROW]:
+        return feather.read_table(source, columns=columns, memory_map=True).to_pandas()
+    return pd.read_csv(source, usecols=columns)
@@ -20,6 +20,7 @@ from scipy import stats
 import statsmodels.api as sm
 
 from src.config import PROCESSED_DATA_DIR, FIGURES_DIR, ANALYTICAL_DATA_FINAL_FILE
+from src.pipeline.storage import dataset_exists, read_dataset
 from src.visualisation import (
     time_series,
     scatter,
@@ -41,13 +42,13 @@ def load_analytical_data() -> pd.DataFrame:
         FileNotFoundError: If the data file doesn't exist
         ValueError: If the data fails basic validation checks
     """
-    if not ANALYTICAL_DATA_FINAL_FILE.exists():
+    if not dataset_exists(ANALYTICAL_DATA_FINAL_FILE):
         raise FileNotFoundError(
             f"Analytical data file not found at {ANALYTICAL_DATA_FINAL_FILE}. "
             "Please run the ETL pipeline first."
         )
     
-    df = pd.read_csv(ANALYTICAL_DATA_FINAL_FILE)
+    df = read_dataset(ANALYTICAL_DATA_FINAL_FILE)
     
     # Basic validation
     if df.empty:
@@ -9,8 +9,16 @@ This script orchestrates the processing of all data files, including:
 - IHME GBD data
 - ABS Causes of Death data
 
+Stages are declared as a dependency graph (see build_stage_graph) and
+independent stages run concurrently in a process pool. A build manifest of
+input hashes skips stages whose inputs, code version and config are unchanged.
+Stages hand their DataFrames to downstream stages in memory; the processed
+files they write are materialisation points for later runs, not re-read in
+the same run. Every stage is instrumented and a JSON run report plus a summary
+table are produced at the end.
+
 Usage:
-  python src/run_etl.py [--aihw] [--ncd] [--faostat] [--fire] [--ihme]
+  python src/run_etl.py [--aihw] [--ncd] [--faostat] [--fire] [--ihme] [--areas A,B] [--jobs N] [--force] [--report PATH]
   
   Options:
     --aihw     Process only AIHW data
@@ -18,7 +26,13 @@ Usage:
     --faostat  Process only FAOSTAT data
     --fire     Process only Fire in a Bottle data
     --ihme     Process only IHME GBD and ABS CoD data
+    --areas A,B  Also produce FAOSTAT data and dietary metrics for these Oceania
+               areas (one pass over the FAOSTAT archives, one worker per area)
     --no-download  Skip the download step (assume files exist)
+    --jobs N   Run up to N independent stages at the same time (default: CPU count);
+               stages that start their own worker pools share this budget
+    --force    Rebuild every selected stage even if its inputs are unchanged
+    --report PATH  Where to write the JSON run report (default: config.ETL_RUN_REPORT_FILE)
     
   If no options are provided, all datasets will be processed.
 """
@@ -32,8 +46,11 @@ import subprocess
 import re
 import glob
 import argparse
-import gc  # Garbage collector
 import importlib.util
+import time
+from datetime import datetime
+from functools import partial
+from typing import Dict, List, Optional
 
 # Configure logging
 logging.basicConfig(
@@ -43,18 +60,29 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Import project modules
-from src.data_processing.process_faostat_fbs import clean_faostat_data
-from src.data_processing.scrape_fire_in_bottle import scrape_la_content, save_to_csv
+from src.data_processing.process_faostat_fbs import (
+    DEFAULT_AREA, area_output_path, clean_faostat_areas, clean_faostat_data,
+)
+from src.data_processing.scrape_fire_in_bottle import scrape_la_content
+from src import config
 from src.config import FIRE_IN_A_BOTTLE_URL
-from src.data_processing.process_aihw_data import process_aihw_excel
-from src.data_processing.validation_utils import get_la_content_for_item
+from src.data_processing.process_aihw_data import extract_aihw_workbooks
+from src.data_processing.validation_utils import get_la_content_for_items
 from src.data_processing.update_validation import create_validation_data
 from src.data_processing.calculate_dietary_metrics import calculate_dietary_metrics as calculate_dietary_metrics_main
+from src.data_processing.calculate_dietary_metrics import calculate_dietary_metrics_for_areas
 from src.data_processing.health_outcome_metrics import main as health_outcome_metrics_main
 from src.data_processing.merge_health_dietary import main as merge_health_dietary_main
 from src import download_data
 from src.data_processing.process_abs_population import process_abs_population_data
+from src.data_processing import process_abs_ihme_data
 from src.data_processing.process_abs_ihme_data import process_abs_cod, process_ihme_gbd
+from src.pipeline.context import PipelineContext
+from src.pipeline.instrumentation import build_run_report, format_summary, write_run_report
+from src.pipeline.storage import dataset_exists, dataset_files, dataset_path, read_dataset, write_dataset
+from src.pipeline.stages import Stage, StageGraph
+from src.pipeline.manifest import BuildManifest
+from src.pipeline.scheduler import run_stages, STATUS_FAILED
 
 
 # Define paths
@@ -70,6 +98,25 @@ PROCESSED_DATA_DIR.mkdir(parents=True, exist_ok=True)
 STAGING_DATA_DIR.mkdir(parents=True, exist_ok=True)  # Create staging directory
 REPORT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Raw input and processed output filenames for the per-source stages
+NCD_FILES = [
+    ("NCD_RisC_Lancet_2024_Diabetes_Australia.csv", "ncdrisc_diabetes_australia_processed.csv"),
+    ("NCD_RisC_Cholesterol_Australia.csv", "ncdrisc_cholesterol_australia_processed.csv"),
+    ("NCD_RisC_Lancet_2024_BMI_age_standardised_Australia.csv", "ncdrisc_bmi_australia_processed.csv")
+]
+AIHW_FILES = [
+    ("AIHW-DEM-02-S2-Prevalence.xlsx", "aihw_dementia_prevalence_australia_processed.csv"),
+    ("AIHW-DEM-02-S3-Mortality-202409.xlsx", "aihw_dementia_mortality_australia_processed.csv"),
+    ("AIHW-CVD-92-HSVD-facts-data-tables-12122024.xlsx", "aihw_cvd_metrics_australia_processed.csv")
+]
+FAOSTAT_DIR = RAW_DATA_DIR / "faostat_oceania"
+FAOSTAT_HISTORIC_DIR = RAW_DATA_DIR / "faostat_historic_oceania"
+# (bulk archive, directory older runs extracted it into)
+FAOSTAT_SOURCES = [
+    (RAW_DATA_DIR / config.FAOSTAT_FBS_FILENAME, FAOSTAT_DIR),
+    (RAW_DATA_DIR / config.FAOSTAT_HISTORIC_FILENAME, FAOSTAT_HISTORIC_DIR),
+]
+
 def run_downloads():
     """Run the download script to fetch all raw data files."""
     logger.info("=== Downloading raw data files ===")
@@ -84,16 +131,12 @@ def run_downloads():
         logger.error(f"Error during download process: {e}")
         return False
 
-def process_ncd_risc_csvs():
+def process_ncd_risc_csvs(context: Optional[PipelineContext] = None) -> Dict[Path, pd.DataFrame]:
     """Process NCD-RisC CSV files."""
     logger.info("=== Processing NCD-RisC datasets ===")
+    frames = {}
     
-    ncd_files = [
-        ("NCD_RisC_Lancet_2024_Diabetes_Australia.csv", "ncdrisc_diabetes_australia_processed.csv"),
-        ("NCD_RisC_Cholesterol_Australia.csv", "ncdrisc_cholesterol_australia_processed.csv"),
-        ("NCD_RisC_Lancet_2024_BMI_age_standardised_Australia.csv", "ncdrisc_bmi_australia_processed.csv")
-    ]
-    for input_filename, output_filename in ncd_files:
+    for input_filename, output_filename in NCD_FILES:
         input_path = RAW_DATA_DIR / input_filename
         output_path = PROCESSED_DATA_DIR / output_filename
         
@@ -117,102 +160,87 @@ def process_ncd_risc_csvs():
             df['source_file'] = input_filename
             
             # Save processed data
-            df.to_csv(output_path, index=False)
+            write_dataset(df, output_path)
             logger.info(f"Saved processed data to {output_path}")
             
             # Log basic stats
             logger.info(f"  Rows: {len(df)}")
             logger.info(f"  Columns: {len(df.columns)}")
-            
-            # Force garbage collection
-            del df
-            gc.collect()
+            frames[output_path] = df
             
         except Exception as e:
             logger.error(f"Error processing {input_filename}: {e}")
+    return frames
 
-def process_aihw_excel_files():
-    """Process AIHW Excel files using the new sheet-by-sheet approach."""
+def process_aihw_excel_files(context: Optional[PipelineContext] = None) -> Dict[Path, pd.DataFrame]:
+    """Process AIHW Excel files using the sheet-by-sheet approach, workbooks and sheets in parallel."""
     logger.info("=== Processing AIHW Excel files ===")
-    
-    aihw_files = [
-        ("AIHW-DEM-02-S2-Prevalence.xlsx", "aihw_dementia_prevalence_australia_processed.csv"),
-        ("AIHW-DEM-02-S3-Mortality-202409.xlsx", "aihw_dementia_mortality_australia_processed.csv"),
-        ("AIHW-CVD-92-HSVD-facts-data-tables-12122024.xlsx", "aihw_cvd_metrics_australia_processed.csv")
-    ]
-    for input_filename, output_filename in aihw_files:
+    workbooks = []
+    for input_filename, output_filename in AIHW_FILES:
         input_path = RAW_DATA_DIR / input_filename
-        output_path = PROCESSED_DATA_DIR / output_filename
-        
         if not input_path.exists():
             logger.warning(f"File not found: {input_path}")
             continue
-            
-        try:
-            logger.info(f"Processing {input_filename}")
-            # Use our new AIHW processing module
-            process_aihw_excel(str(input_path), str(output_path))
-            
-            # Log success and basic stats
-            if output_path.exists():
-                df = pd.read_csv(output_path)
-                logger.info(f"Successfully processed {input_filename}")
-                logger.info(f"  Shape: {df.shape}")
-                logger.info(f"  Columns: {', '.join(df.columns)}")
-                
-                # Force garbage collection
-                del df
-                gc.collect()
-                
-        except Exception as e:
-            logger.error(f"Error processing {input_filename}: {e}")
+        workbooks.append((input_path, PROCESSED_DATA_DIR / output_filename))
 
-def process_faostat_data(force_processing: bool = False):
-    """
-    Process FAOSTAT data by directly cleaning raw data directories.
+    return extract_aihw_workbooks(workbooks, jobs=context.jobs if context is not None else None,
+                                  layout_cache_dir=config.AIHW_LAYOUT_CACHE_DIR)
 
-    Args:
-        force_processing: If True, process the data even if output file already exists
+def faostat_areas(extra_areas: Optional[List[str]] = None) -> List[str]:
+    """Australia followed by any extra FAOSTAT areas requested with --areas, without duplicates."""
+    areas = [DEFAULT_AREA]
+    for area in extra_areas or []:
+        if area.lower() not in {a.lower() for a in areas}:
+            areas.append(area)
+    return areas
+
+def process_faostat_data(context: Optional[PipelineContext] = None,
+                         areas: Optional[List[str]] = None) -> Dict[Path, pd.DataFrame]:
+    """Process FAOSTAT data by streaming the raw bulk archives without extracting them.
+
+    With extra ``areas`` every area is read in the same pass over the archives
+    and pivoted in its own worker process.
     """
+    areas = faostat_areas(areas)
     logger.info("=== Processing FAOSTAT data ===")
 
-    faostat_dir = RAW_DATA_DIR / "faostat_oceania"
-    faostat_historic_dir = RAW_DATA_DIR / "faostat_historic_oceania"
     final_output_path = PROCESSED_DATA_DIR / "faostat_fbs_australia_processed.csv"
 
-    logger.debug(f"Checking FAOSTAT skip: force={force_processing}, exists={final_output_path.exists()}")
-    if not force_processing and final_output_path.exists():
-        logger.info(f"Using existing cleaned FAOSTAT data: {final_output_path}")
-        return
-
-    # Gather all CSV files from FAOSTAT directories
+    # Read each bulk archive directly; fall back to CSVs extracted by older runs
     input_files = []
-    if faostat_dir.exists():
-        input_files.extend(list(faostat_dir.glob("*.csv")))
-    else:
-        logger.warning(f"FAOSTAT directory not found: {faostat_dir}")
-
-    if faostat_historic_dir.exists():
-        input_files.extend(list(faostat_historic_dir.glob("*.csv")))
-    else:
-        logger.warning(f"FAOSTAT historical directory not found: {faostat_historic_dir}")
+    for archive, extract_dir in FAOSTAT_SOURCES:
+        if archive.exists():
+            input_files.append(archive)
+        elif extract_dir.exists() and any(extract_dir.glob("*.csv")):
+            logger.info(f"{archive.name} not found; reading extracted CSVs from {extract_dir}")
+            input_files.extend(sorted(extract_dir.glob("*.csv")))
+        else:
+            logger.warning(f"FAOSTAT archive not found: {archive}")
 
     if not input_files:
-        logger.error("No FAOSTAT data directories found to process")
-        return
+        logger.error("No FAOSTAT archives or extracted data found to process")
+        raise FileNotFoundError("No FAOSTAT archives or extracted data found to process")
 
     try:
-        logger.info("Cleaning FAOSTAT data from raw directories")
-        clean_faostat_data(
+        logger.info("Cleaning FAOSTAT data from raw archives")
+        if len(areas) > 1:
+            output_files = {area: area_output_path(final_output_path, area) for area in areas}
+            frames = clean_faostat_areas([str(f) for f in input_files], output_files,
+                                         jobs=context.jobs if context is not None else None)
+            logger.info(f"Saved cleaned FAOSTAT data for {', '.join(areas)}")
+            return {output_files[area]: df for area, df in frames.items()}
+        df = clean_faostat_data(
             input_files=[str(f) for f in input_files],
             output_file=str(final_output_path)
         )
         logger.info(f"Saved final cleaned FAOSTAT data to {final_output_path}")
+        return {final_output_path: df}
     except Exception as e:
         logger.error(f"Error cleaning FAOSTAT data: {e}")
+        raise
 
 
-def process_fire_in_bottle_data():
+def process_fire_in_bottle_data(context: Optional[PipelineContext] = None) -> Dict[Path, pd.DataFrame]:
     """Process Fire in a Bottle linoleic acid data using the scraper."""
     logger.info("=== Processing Fire in a Bottle data ===")
     
@@ -222,45 +250,48 @@ def process_fire_in_bottle_data():
         logger.info(f"Scraping Fire in a Bottle data from {FIRE_IN_A_BOTTLE_URL}")
         df = scrape_la_content(FIRE_IN_A_BOTTLE_URL)
         
-        if df is not None and not df.empty:
-            logger.info(f"Successfully scraped Fire in a Bottle data")
-            
-            # Save to CSV in the processed directory
-            save_to_csv(df, str(output_path))
-            logger.info(f"Saved processed data to {output_path}")
-            logger.info(f"  Shape: {df.shape}")
-            
-            # Force garbage collection
-            del df
-            gc.collect()
-        else:
-            logger.error("Failed to scrape Fire in a Bottle data")
+        if df is None or df.empty:
+            raise RuntimeError(f"No LA content data scraped from {FIRE_IN_A_BOTTLE_URL}")
+        logger.info(f"Successfully scraped Fire in a Bottle data")
+
+        # Save in the processed directory
+        write_dataset(df, output_path)
+        logger.info(f"Saved processed data to {output_path}")
+        logger.info(f"  Shape: {df.shape}")
+        return {output_path: df}
     except Exception as e:
         logger.error(f"Error processing Fire in a Bottle data: {e}")
+        raise
 
-def process_abs_population():
+def process_abs_population(context: Optional[PipelineContext] = None) -> Dict[Path, pd.DataFrame]:
     """Process the ABS population data.
     Note: This relies on the data being downloaded first.
     """
     logger.info("=== Processing ABS Population Data ===")
     try:
-        process_abs_population_data() # Call the function from the dedicated module
+        df = process_abs_population_data() # Call the function from the dedicated module
+        if df is None:
+            # The module logs the cause and returns None when processing fails
+            raise RuntimeError("ABS population data could not be processed")
         logger.info("ABS population data processing completed.")
+        return {config.ABS_POPULATION_PROCESSED_FILE: df}
     except Exception as e:
         logger.error(f"Error processing ABS population data: {e}", exc_info=True)
+        raise
 
-def process_semantic_validation():
+def process_semantic_validation(context: Optional[PipelineContext] = None) -> Dict[Path, pd.DataFrame]:
     """Process semantic validation between FAOSTAT and LA content data."""
     logger.info("=== Processing Semantic Validation ===")
     
     try:
-        # Load LA content data
+        # Load LA content data, preferring the frame scraped earlier in this run
         la_content_path = PROCESSED_DATA_DIR / 'la_content_fireinabottle_processed.csv'
-        if not la_content_path.exists():
-            logger.error("LA content data not found. Please process Fire in a Bottle data first.")
-            return False
-            
-        la_df = pd.read_csv(la_content_path)
+        la_df = context.get(la_content_path) if context is not None else None
+        if la_df is None:
+            if not dataset_exists(la_content_path):
+                logger.error("LA content data not found. Please process Fire in a Bottle data first.")
+                raise FileNotFoundError(f"LA content data not found: {la_content_path}")
+            la_df = read_dataset(la_content_path)
         
         # Create validation DataFrame
         logger.info("Creating validation DataFrame")
@@ -268,13 +299,11 @@ def process_semantic_validation():
         
         # Add LA content information
         logger.info("Adding LA content information")
-        validation_df['la_content_per_100g'] = validation_df['matched_la_item'].apply(
-            lambda x: get_la_content_for_item(x, la_df) if pd.notna(x) else None
-        )
+        validation_df['la_content_per_100g'] = get_la_content_for_items(validation_df['matched_la_item'], la_df)
         
         # Save final mapping
         output_path = PROCESSED_DATA_DIR / 'fao_la_mapping_validated.csv'
-        validation_df.to_csv(output_path, index=False)
+        write_dataset(validation_df, output_path)
         logger.info(f"Saved final mapping to {output_path}")
         
         # Print validation statistics
@@ -290,25 +319,211 @@ def process_semantic_validation():
         logger.info(f"Items with LA content: {has_la}")
         logger.info(f"Match rate: {(approved/total)*100:.1f}%")
         
-        return True
+        return {output_path: validation_df}
         
     except Exception as e:
         logger.error(f"Error during semantic validation: {e}")
-        return False
+        raise
 
-def process_ihme_and_abs_data():
+def process_ihme_and_abs_data(context: Optional[PipelineContext] = None) -> Dict[Path, pd.DataFrame]:
     """Process IHME GBD and ABS Causes of Death data."""
     logger.info("=== Processing IHME GBD and ABS CoD data ===")
+    frames = {}
     try:
         # Process ABS Causes of Death data
-        process_abs_cod()
+        abs_df = process_abs_cod()
+        if abs_df is not None:
+            frames[config.ABS_COD_PROCESSED_FILE] = abs_df
         
         # Process IHME GBD data
-        process_ihme_gbd()
+        frames.update(process_ihme_gbd())
         
         logger.info("IHME GBD and ABS CoD data processing completed successfully")
     except Exception as e:
         logger.error(f"Error processing IHME/ABS data: {e}")
+        raise
+    return frames
+
+def calculate_dietary_metrics_stage(context: Optional[PipelineContext] = None,
+                                    areas: Optional[List[str]] = None) -> Dict[Path, pd.DataFrame]:
+    """Calculate dietary metrics from the FAOSTAT data and LA mapping, for each area in parallel."""
+    jobs = context.jobs if context is not None else None
+    context = context if context is not None else PipelineContext()
+    areas = faostat_areas(areas)
+    if len(areas) == 1:
+        df = calculate_dietary_metrics_main(
+            fao_df=context.get(config.FAOSTAT_PROCESSED_FILE),
+            la_mapping=context.get(config.FAOSTAT_LA_MAPPING_FILE),
+        )
+        return {config.DIETARY_METRICS_FILE: df}
+
+    area_files = {
+        area: {
+            'fao_file': area_output_path(config.FAOSTAT_PROCESSED_FILE, area),
+            'output_file': area_output_path(config.DIETARY_METRICS_FILE, area),
+            'metadata_file': area_output_path(config.DIETARY_METRICS_METADATA_FILE, area),
+        }
+        for area in areas
+    }
+    results = calculate_dietary_metrics_for_areas(
+        area_files,
+        la_mapping=context.get(config.FAOSTAT_LA_MAPPING_FILE),
+        fao_frames={area: context.get(files['fao_file']) for area, files in area_files.items()},
+        jobs=jobs,
+    )
+    missing = [area for area in areas if area not in results]
+    if missing:
+        raise RuntimeError(f"Dietary metrics could not be calculated for {', '.join(missing)}")
+    return {area_files[area]['output_file']: df for area, df in results.items()}
+
+def health_metrics_stage(context: Optional[PipelineContext] = None) -> Dict[Path, pd.DataFrame]:
+    """Combine the per-source health outcome metrics."""
+    df = health_outcome_metrics_main(context)
+    return {config.HEALTH_METRICS_FILE: df} if df is not None else {}
+
+def merge_stage(context: Optional[PipelineContext] = None) -> Dict[Path, pd.DataFrame]:
+    """Merge dietary, health and population data into the analytical dataset."""
+    context = context if context is not None else PipelineContext()
+    df = merge_health_dietary_main(
+        dietary_df=context.get(config.DIETARY_METRICS_FILE),
+        health_df=context.get(config.HEALTH_METRICS_FILE),
+        population_df=context.get(config.ABS_POPULATION_PROCESSED_FILE),
+    )
+    return {config.ANALYTICAL_DATA_FINAL_FILE: df} if df is not None else {}
+
+def _datasets(*paths) -> List[Path]:
+    """Files written for each processed dataset: the primary format plus any CSV side output."""
+    return [f for path in paths for f in dataset_files(path)]
+
+def _dataset_inputs(*paths) -> List[Path]:
+    """The primary stored file of each processed dataset a stage reads."""
+    return [dataset_path(path) for path in paths]
+
+def build_stage_graph(areas: Optional[List[str]] = None) -> StageGraph:
+    """Declare every ETL stage with its inputs, outputs and dependencies.
+
+    Args:
+        areas: Extra FAOSTAT areas (besides Australia) to produce processed
+            FAOSTAT data and dietary metrics for.
+    """
+    areas = faostat_areas(areas)
+    faostat_files = [area_output_path(config.FAOSTAT_PROCESSED_FILE, area) for area in areas]
+    dietary_files = [area_output_path(path, area) for area in areas
+                     for path in (config.DIETARY_METRICS_FILE, config.DIETARY_METRICS_METADATA_FILE)]
+    area_params = {"areas": areas} if len(areas) > 1 else {}
+    return StageGraph([
+        Stage(
+            name="aihw",
+            func=process_aihw_excel_files,
+            inputs=[RAW_DATA_DIR / raw for raw, _ in AIHW_FILES],
+            outputs=_datasets(*[PROCESSED_DATA_DIR / out for _, out in AIHW_FILES]),
+            in_memory=True,
+            description="AIHW dementia and CVD workbooks",
+        ),
+        Stage(
+            name="ncd",
+            func=process_ncd_risc_csvs,
+            inputs=[RAW_DATA_DIR / raw for raw, _ in NCD_FILES],
+            outputs=_datasets(*[PROCESSED_DATA_DIR / out for _, out in NCD_FILES]),
+            in_memory=True,
+            description="NCD-RisC diabetes, cholesterol and BMI",
+        ),
+        Stage(
+            name="faostat",
+            func=partial(process_faostat_data, areas=areas),
+            inputs=[path for source in FAOSTAT_SOURCES for path in source],
+            outputs=_datasets(*faostat_files),
+            params=area_params,
+            in_memory=True,
+            description="FAOSTAT Food Balance Sheets",
+        ),
+        Stage(
+            name="fire",
+            func=process_fire_in_bottle_data,
+            outputs=_datasets(config.LA_CONTENT_FIREINABOTTLE_PROCESSED_FILE),
+            params={"url": FIRE_IN_A_BOTTLE_URL},
+            in_memory=True,
+            description="Fire in a Bottle LA content scrape",
+        ),
+        Stage(
+            name="ihme",
+            func=process_ihme_and_abs_data,
+            inputs=[process_abs_ihme_data.ABS_FILE, process_abs_ihme_data.IHME_ZIP],
+            outputs=_datasets(config.ABS_COD_PROCESSED_FILE, config.GBD_DEMENTIA_PROCESSED_FILE,
+                              config.GBD_CVD_PROCESSED_FILE, config.GBD_LONG_PROCESSED_FILE),
+            in_memory=True,
+            description="IHME GBD and ABS Causes of Death",
+        ),
+        Stage(
+            name="abs_population",
+            func=process_abs_population,
+            inputs=[RAW_DATA_DIR / config.ABS_POPULATION_FILENAME],
+            outputs=_datasets(config.ABS_POPULATION_PROCESSED_FILE),
+            in_memory=True,
+            description="ABS estimated resident population",
+        ),
+        Stage(
+            name="semantic_validation",
+            func=process_semantic_validation,
+            inputs=_dataset_inputs(config.LA_CONTENT_FIREINABOTTLE_PROCESSED_FILE),
+            outputs=_datasets(config.FAOSTAT_LA_MAPPING_FILE),
+            in_memory=True,
+            description="FAO item to LA content mapping",
+        ),
+        Stage(
+            name="dietary_metrics",
+            func=partial(calculate_dietary_metrics_stage, areas=areas),
+            inputs=_dataset_inputs(*faostat_files, config.FAOSTAT_LA_MAPPING_FILE),
+            outputs=_datasets(*dietary_files),
+            params=area_params,
+            in_memory=True,
+            description="Yearly LA intake and macronutrient supply",
+        ),
+        Stage(
+            name="health_metrics",
+            func=health_metrics_stage,
+            inputs=_dataset_inputs(*[PROCESSED_DATA_DIR / out for _, out in AIHW_FILES + NCD_FILES],
+                                   config.GBD_DEMENTIA_PROCESSED_FILE, config.GBD_CVD_PROCESSED_FILE),
+            outputs=_datasets(config.HEALTH_METRICS_FILE),
+            in_memory=True,
+            description="Combined yearly health outcome metrics",
+        ),
+        Stage(
+            name="merge",
+            func=merge_stage,
+            inputs=_dataset_inputs(config.DIETARY_METRICS_FILE, config.HEALTH_METRICS_FILE,
+                                   config.ABS_POPULATION_PROCESSED_FILE),
+            outputs=_datasets(config.ANALYTICAL_DATA_FINAL_FILE),
+            in_memory=True,
+            description="Final analytical dataset with lagged predictors",
+        ),
+    ])
+
+def select_stages(args) -> list:
+    """Work out which stages to run from the command line flags."""
+    run_all = not (args.aihw or args.ncd or args.faostat or args.fire or args.ihme)
+    selected = []
+    if args.aihw or run_all:
+        selected.append("aihw")
+    if args.ncd or run_all:
+        selected.append("ncd")
+    if args.faostat or run_all:
+        selected.append("faostat")
+    if args.fire or run_all:
+        selected.append("fire")
+    if args.ihme or run_all:
+        selected.append("ihme")
+    # ABS population data is always needed
+    selected.append("abs_population")
+    if args.areas and "faostat" not in selected:
+        selected.append("faostat")
+    if run_all or args.faostat or args.areas:
+        selected.extend(["semantic_validation", "dietary_metrics"])
+    if run_all or args.aihw or args.ncd or args.ihme:
+        selected.append("health_metrics")
+    if run_all:
+        selected.append("merge")
+    return selected
 
 def parse_args():
     """Parse command line arguments."""
@@ -318,16 +533,24 @@ def parse_args():
     parser.add_argument("--faostat", action="store_true", help="Process only FAOSTAT data")
     parser.add_argument("--fire", action="store_true", help="Process only Fire in a Bottle data")
     parser.add_argument("--ihme", action="store_true", help="Process only IHME GBD and ABS CoD data")
+    parser.add_argument("--areas", type=lambda value: [a.strip() for a in value.split(",") if a.strip()],
+                        default=[], metavar="AREA[,AREA...]",
+                        help="Also process these FAOSTAT areas besides Australia, "
+                             "e.g. 'New Zealand,Papua New Guinea'")
     parser.add_argument("--no-download", action="store_true", help="Skip the download step")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Maximum number of worker processes, shared by concurrent stages "
+                             "and their own worker pools")
+    parser.add_argument("--force", action="store_true",
+                        help="Rebuild every selected stage even if its inputs are unchanged")
+    parser.add_argument("--report", type=Path, default=config.ETL_RUN_REPORT_FILE,
+                        help="Where to write the JSON run report")
     return parser.parse_args()
 
 def main():
     """Main ETL process."""
     args = parse_args()
     
-    # Determine which processes to run
-    run_all = not (args.aihw or args.ncd or args.faostat or args.fire or args.ihme)
-    
     # Download data if needed
     if not args.no_download:
         success = run_downloads()
@@ -336,50 +559,23 @@ def main():
             sys.exit(1)
     
     try:
-        # Process AIHW data if specified or running all
-        if args.aihw or run_all:
-            process_aihw_excel_files()
-        
-        # Process NCD-RisC data if specified or running all
-        if args.ncd or run_all:
-            process_ncd_risc_csvs()
-        
-        # Process FAOSTAT data if specified or running all
-        if args.faostat or run_all:
-            process_faostat_data()
-        
-        # Process Fire in a Bottle data if specified or running all
-        if args.fire or run_all:
-            process_fire_in_bottle_data()
-            
-        # Process IHME and ABS data if specified or running all
-        if args.ihme or run_all:
-            process_ihme_and_abs_data()
-            
-        # Process ABS population data (always needed)
-        process_abs_population()
-        
-        # Run semantic validation if processing all or FAOSTAT
-        if run_all or args.faostat:
-            process_semantic_validation()
-            
-        # Calculate dietary metrics if processing all or FAOSTAT
-        if run_all or args.faostat:
-            calculate_dietary_metrics_main()
-            
-        # Process health outcome metrics if processing all or any health data
-        if run_all or args.aihw or args.ncd or args.ihme:
-            health_outcome_metrics_main()
-            
-        # Merge health and dietary data if processing all
-        if run_all:
-            merge_health_dietary_main()
-            
-        logger.info("ETL process completed successfully")
-        
+        graph = build_stage_graph(args.areas).subgraph(select_stages(args))
+        manifest = BuildManifest(config.BUILD_MANIFEST_FILE)
+        started_at, start = datetime.now(), time.perf_counter()
+        results = run_stages(graph, jobs=args.jobs, manifest=manifest, force=args.force)
     except Exception as e:
         logger.error(f"Error during ETL process: {e}")
         sys.exit(1)
 
+    report = build_run_report(results, started_at, time.perf_counter() - start, args.jobs)
+    write_run_report(report, args.report)
+    logger.info(f"ETL stage summary:\n{format_summary(report)}")
+
+    failed = [name for name, result in results.items() if result.status == STATUS_FAILED]
+    if failed:
+        logger.error(f"ETL process failed in stage(s): {', '.join(failed)}")
+        sys.exit(1)
+    logger.info("ETL process completed successfully")
+
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -10,6 +10,7 @@ import json
 from datetime import datetime
 import shutil
 import sys
+from src.pipeline.storage import read_dataset
 from src.visualisation.interactive import save_interactive_plots
 
 def create_dashboard_html(
@@ -193,7 +194,7 @@ def main():
     output_file = base_dir / "figures" / "dashboard.html"
     
     # Load the analytical dataset
-    df = pd.read_csv(base_dir / "data" / "processed" / "analytical_data_australia_final.csv")
+    df = read_dataset(base_dir / "data" / "processed" / "analytical_data_australia_final.csv")
     
     # Load model results if available
     model_results = None
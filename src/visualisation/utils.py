@@ -12,25 +12,27 @@ import pandas as pd
 import seaborn as sns
 from pydantic import BaseModel, Field
 
+from src.pipeline.storage import read_dataset
+
 class DatasetConfig(BaseModel):
     """Configuration for loading the unified dataset."""
     csv_path: str = Field(
         default="data/processed/analytical_data_australia_final.csv",
-        description="Path to the unified analytical dataset CSV"
+        description="Logical (.csv) path of the unified analytical dataset; stored as Parquet/Arrow or CSV"
     )
 
 def load_unified_dataset(config: Optional[DatasetConfig] = None) -> pd.DataFrame:
     """
-    Load the unified analytical dataset from CSV.
+    Load the unified analytical dataset in whichever format it is stored.
 
     Args:
-        config (DatasetConfig, optional): Configuration specifying the CSV path.
+        config (DatasetConfig, optional): Configuration specifying the dataset path.
 
     Returns:
         pd.DataFrame: Loaded dataset.
     """
     path = config.csv_path if config else DatasetConfig().csv_path
-    df = pd.read_csv(path)
+    df = read_dataset(path)
     return df
 
 def set_plot_style(style: str = "whitegrid") -> None:
@@ -0,0 +1,344 @@
+import hashlib
+import io
+import json
+import threading
+import time
+import zipfile
+from functools import partial
+from http.server import BaseHTTPRequestHandler, SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src import download_data
+
+
+class _CountingHandler(SimpleHTTPRequestHandler):
+    """Serves files from a directory, recording request concurrency."""
+    delay_seconds = 0.0
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+    requests_seen = []
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+            cls.requests_seen.append(self.path)
+        try:
+            time.sleep(cls.delay_seconds)
+            super().do_GET()
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_server(tmp_path):
+    """Local stand-in for the remote hosts, serving files from tmp_path / 'remote'."""
+    remote = tmp_path / "remote"
+    remote.mkdir()
+    handler = type("Handler", (_CountingHandler,), {
+        'lock': threading.Lock(), 'active': 0, 'max_active': 0, 'requests_seen': [],
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(handler, directory=str(remote)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", remote, handler
+    server.shutdown()
+    server.server_close()
+
+
+def _write_csv(path, rows=3):
+    path.write_text("Year,Value\n" + "".join(f"{2000 + i},{i}\n" for i in range(rows)))
+
+
+def test_download_all_fetches_and_validates(http_server, tmp_path):
+    base_url, remote, _ = http_server
+    _write_csv(remote / "a.csv")
+    with zipfile.ZipFile(remote / "bundle.zip", "w") as zf:
+        zf.writestr("inner.csv", "Year,Value\n2000,1\n")
+    dest = tmp_path / "raw"
+
+    results = download_data.download_all([
+        {"url": f"{base_url}/a.csv", "filename": "a.csv", "type": "csv"},
+        {"url": f"{base_url}/bundle.zip", "filename": "bundle.zip", "type": "zip"},
+    ], dest_dir=dest, max_workers=2)
+
+    assert [r.filename for r in results] == ["a.csv", "bundle.zip"]
+    assert all(r.success for r in results)
+    assert (dest / "a.csv").read_text() == (remote / "a.csv").read_text()
+    assert sorted(p.name for p in dest.iterdir() if p.suffix != ".json") == ["a.csv", "bundle.zip"]
+    assert results[0].bytes_received == (remote / "a.csv").stat().st_size
+
+
+def test_download_all_runs_files_concurrently(http_server, tmp_path):
+    base_url, remote, handler = http_server
+    handler.delay_seconds = 0.3
+    files = []
+    for i in range(4):
+        _write_csv(remote / f"f{i}.csv")
+        files.append({"url": f"{base_url}/f{i}.csv", "filename": f"f{i}.csv", "type": "csv"})
+
+    results = download_data.download_all(files, dest_dir=tmp_path / "raw", max_workers=4)
+
+    assert all(r.success for r in results)
+    assert handler.max_active > 1
+
+
+def test_download_all_reports_failures_without_stopping_others(http_server, tmp_path):
+    base_url, remote, _ = http_server
+    _write_csv(remote / "ok.csv")
+
+    results = download_data.download_all([
+        {"url": f"{base_url}/missing.csv", "filename": "missing.csv", "type": "csv"},
+        {"url": f"{base_url}/ok.csv", "filename": "ok.csv", "type": "csv"},
+    ], dest_dir=tmp_path / "raw", max_workers=2, max_retries=1)
+
+    assert [r.success for r in results] == [False, True]
+    assert results[0].error == "Download failed"
+    assert not (tmp_path / "raw" / "missing.csv").exists()
+
+
+def test_session_pool_shares_one_session_per_host():
+    with download_data.SessionPool(pool_size=2) as sessions:
+        first = sessions.get("https://example.org/a.csv")
+        assert sessions.get("https://example.org/b.csv") is first
+        assert sessions.get("https://example.com/a.csv") is not first
+        assert first.headers["User-Agent"] == download_data.DEFAULT_HEADERS["User-Agent"]
+
+
+class _ArtefactHandler(BaseHTTPRequestHandler):
+    """Serves in-memory files with ETags, conditional requests, Range and cut-off responses."""
+    files = {}
+    # path -> bytes to send before dropping the connection (applied once)
+    cut_after = {}
+    # path -> offset added to the start of the next range served (applied once)
+    range_shift = {}
+    log = []
+
+    def do_GET(self):
+        cls = type(self)
+        body = cls.files.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        cls.log.append((self.path, dict(self.headers)))
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        start = 0
+        range_header = self.headers.get('Range')
+        if range_header and self.headers.get('If-Range') == etag:
+            start = int(range_header.split('=')[1].rstrip('-')) + cls.range_shift.pop(self.path, 0)
+        payload = body[start:]
+        self.send_response(206 if start else 200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(payload)))
+        if start:
+            self.send_header('Content-Range', f"bytes {start}-{len(body) - 1}/{len(body)}")
+        self.end_headers()
+
+        cut = cls.cut_after.pop(self.path, None)
+        if cut is not None:
+            self.wfile.write(payload[:cut])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def artefact_server():
+    handler = type("Handler", (_ArtefactHandler,), {'files': {}, 'cut_after': {}, 'range_shift': {}, 'log': []})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", handler
+    server.shutdown()
+    server.server_close()
+
+
+def _zip_bytes(size):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr("data.csv", b"x" * size)
+    return buffer.getvalue()
+
+
+def test_unchanged_source_costs_one_conditional_request(artefact_server, tmp_path):
+    base_url, handler = artefact_server
+    handler.files["/a.csv"] = b"Year,Value\n2000,1\n"
+    files = [{"url": f"{base_url}/a.csv", "filename": "a.csv", "type": "csv"}]
+    dest = tmp_path / "raw"
+
+    first = download_data.download_all(files, dest_dir=dest, max_retries=1)
+    second = download_data.download_all(files, dest_dir=dest, max_retries=1)
+
+    assert first[0].status == download_data.STATUS_DOWNLOADED
+    assert second[0].status == download_data.STATUS_NOT_MODIFIED
+    assert second[0].success
+    assert len(handler.log) == 2
+    assert handler.log[1][1].get('If-None-Match')
+
+    manifest = json.loads((dest / "download_manifest.json").read_text())["files"]["a.csv"]
+    assert manifest["size"] == len(handler.files["/a.csv"])
+    assert manifest["sha256"] == hashlib.sha256(handler.files["/a.csv"]).hexdigest()
+
+
+def test_changed_source_is_downloaded_again(artefact_server, tmp_path):
+    base_url, handler = artefact_server
+    handler.files["/a.csv"] = b"Year,Value\n2000,1\n"
+    files = [{"url": f"{base_url}/a.csv", "filename": "a.csv", "type": "csv"}]
+    dest = tmp_path / "raw"
+    download_data.download_all(files, dest_dir=dest, max_retries=1)
+
+    handler.files["/a.csv"] = b"Year,Value\n2000,2\n2001,3\n"
+    result = download_data.download_all(files, dest_dir=dest, max_retries=1)[0]
+
+    assert result.status == download_data.STATUS_DOWNLOADED
+    assert (dest / "a.csv").read_bytes() == handler.files["/a.csv"]
+
+
+def test_interrupted_download_resumes_with_range_request(artefact_server, tmp_path):
+    base_url, handler = artefact_server
+    body = _zip_bytes(200_000)
+    handler.files["/big.zip"] = body
+    handler.cut_after["/big.zip"] = 150_000
+    dest = tmp_path / "raw"
+
+    result = download_data.download_all(
+        [{"url": f"{base_url}/big.zip", "filename": "big.zip", "type": "zip"}],
+        dest_dir=dest, max_retries=2)[0]
+
+    assert result.status == download_data.STATUS_RESUMED
+    assert (dest / "big.zip").read_bytes() == body
+    assert not (dest / "big.zip.part").exists()
+    # Everything up to the last whole chunk received is kept, so only the tail is fetched again
+    resumed_from = int(handler.log[1][1]["Range"].split("=")[1].rstrip("-"))
+    assert 0 < resumed_from <= 150_000
+
+
+def test_partial_from_earlier_run_resumes_next_run(artefact_server, tmp_path):
+    base_url, handler = artefact_server
+    body = _zip_bytes(300_000)
+    handler.files["/big.zip"] = body
+    handler.cut_after["/big.zip"] = 200_000
+    files = [{"url": f"{base_url}/big.zip", "filename": "big.zip", "type": "zip"}]
+    dest = tmp_path / "raw"
+
+    failed = download_data.download_all(files, dest_dir=dest, max_retries=1)[0]
+    assert not failed.success
+    assert (dest / "big.zip.part").stat().st_size > 0
+
+    result = download_data.download_all(files, dest_dir=dest, max_retries=1)[0]
+    assert result.status == download_data.STATUS_RESUMED
+    assert (dest / "big.zip").read_bytes() == body
+
+
+def test_mismatched_range_is_not_written_as_whole_file(artefact_server, tmp_path):
+    base_url, handler = artefact_server
+    body = _zip_bytes(300_000)
+    handler.files["/big.zip"] = body
+    handler.cut_after["/big.zip"] = 200_000
+    files = [{"url": f"{base_url}/big.zip", "filename": "big.zip", "type": "zip"}]
+    dest = tmp_path / "raw"
+    assert not download_data.download_all(files, dest_dir=dest, max_retries=1)[0].success
+
+    handler.range_shift["/big.zip"] = 1000
+    result = download_data.download_all(files, dest_dir=dest, max_retries=2)[0]
+
+    assert result.status == download_data.STATUS_DOWNLOADED
+    assert (dest / "big.zip").read_bytes() == body
+    assert "Range" in handler.log[1][1] and "Range" not in handler.log[2][1]
+    manifest = json.loads((dest / "download_manifest.json").read_text())["files"]["big.zip"]
+    assert manifest["sha256"] == hashlib.sha256(body).hexdigest()
+
+
+def test_verify_fails_for_corrupted_unchanged_file(artefact_server, tmp_path):
+    base_url, handler = artefact_server
+    handler.files["/a.csv"] = b"Year,Value\n2000,1\n"
+    files = [{"url": f"{base_url}/a.csv", "filename": "a.csv", "type": "csv"}]
+    dest = tmp_path / "raw"
+    download_data.download_all(files, dest_dir=dest, max_retries=1)
+    # Same size, so the copy still looks intact and the server answers 304
+    (dest / "a.csv").write_bytes(b"Year,Value\n2000,9\n")
+
+    unverified = download_data.download_all(files, dest_dir=dest, max_retries=1)[0]
+    verified = download_data.download_all(files, dest_dir=dest, max_retries=1, verify=True)[0]
+
+    assert unverified.status == download_data.STATUS_NOT_MODIFIED and unverified.success
+    assert not verified.success
+    assert verified.error == "Validation failed"
+
+
+def test_failed_update_keeps_previous_copy(artefact_server, tmp_path):
+    base_url, handler = artefact_server
+    handler.files["/a.csv"] = b"Year,Value\n2000,1\n"
+    dest = tmp_path / "raw"
+    destination = dest / "a.csv"
+    dest.mkdir()
+    destination.write_bytes(b"Year,Value\n1999,0\n")
+
+    assert not download_data.download_file(f"{base_url}/missing.csv", destination, max_retries=1)
+    assert destination.read_bytes() == b"Year,Value\n1999,0\n"
+
+
+def test_validate_csv_checks_header_sample(tmp_path):
+    good = tmp_path / "good.csv"
+    _write_csv(good)
+    html = tmp_path / "blocked.csv"
+    html.write_text("<!DOCTYPE html><html><body>Access denied</body></html>")
+    header_only = tmp_path / "header.csv"
+    header_only.write_text("Year,Value\n")
+
+    assert download_data.validate_file(good, "csv")
+    assert not download_data.validate_file(html, "csv")
+    assert not download_data.validate_file(header_only, "csv")
+
+
+def test_validate_excel_reads_sheet_names_only(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    workbook = openpyxl.Workbook()
+    workbook.active.title = "Data1"
+    workbook.create_sheet("Notes")
+    path = tmp_path / "book.xlsx"
+    workbook.save(path)
+    not_excel = tmp_path / "fake.xlsx"
+    not_excel.write_text("<html></html>")
+
+    assert download_data.validate_file(path, "excel", required_sheets=["Data1"])
+    assert not download_data.validate_file(path, "excel", required_sheets=["S2.4"])
+    assert not download_data.validate_file(not_excel, "excel")
+
+
+def test_validate_zip_checks_central_directory(tmp_path):
+    path = tmp_path / "bundle.zip"
+    path.write_bytes(_zip_bytes(10))
+    truncated = tmp_path / "truncated.zip"
+    truncated.write_bytes(path.read_bytes()[:-30])
+
+    assert download_data.validate_file(path, "zip", specific_files=["data.csv"])
+    assert not download_data.validate_file(path, "zip", specific_files=["other.csv"])
+    assert not download_data.validate_file(truncated, "zip")
+    assert download_data.validate_file(path, "zip", full=True)
+
+
+def test_validate_file_checks_expected_checksum(tmp_path):
+    path = tmp_path / "a.csv"
+    _write_csv(path)
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+
+    assert download_data.validate_file(path, "csv", expected_sha256=digest)
+    assert not download_data.validate_file(path, "csv", expected_sha256="0" * 64)
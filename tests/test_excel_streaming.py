@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+
+from src.data_processing.excel_streaming import StreamingWorkbook, cached_sheet_frame
+
+
+def _write_workbook(path):
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame([
+            ['Table 1: Deaths in Australia', None, None],
+            [None, None, None],
+            ['Year', 'Men', 'Women'],
+            [2010, 1.5, '1,200'],
+            [2011, 2.0, None],
+            ['Note: provisional', None, None],
+        ]).to_excel(writer, sheet_name='Data', header=False, index=False)
+        pd.DataFrame([[1, 2], [3, 4]]).to_excel(writer, sheet_name='Numbers', header=False, index=False)
+        pd.DataFrame().to_excel(writer, sheet_name='Empty', index=False)
+
+
+def test_read_sheet_matches_read_excel(tmp_path):
+    path = tmp_path / 'book.xlsx'
+    _write_workbook(path)
+
+    with StreamingWorkbook(path) as workbook:
+        assert workbook.sheet_names == ['Data', 'Numbers', 'Empty']
+        for sheet in workbook.sheet_names:
+            expected = pd.read_excel(path, sheet_name=sheet, header=None)
+            pd.testing.assert_frame_equal(workbook.read_sheet(sheet), expected)
+
+
+def test_read_sheet_stops_after_predicate_row(tmp_path):
+    path = tmp_path / 'book.xlsx'
+    _write_workbook(path)
+    seen = []
+
+    def stop(values, index):
+        seen.append(index)
+        return values[:1] == [2010]
+
+    with StreamingWorkbook(path) as workbook:
+        df = workbook.read_sheet('Data', stop=stop)
+        sheets = dict(workbook.iter_sheets(['Numbers']))
+
+    assert seen == [0, 1, 2, 3]
+    assert len(df) == 4
+    assert df.iloc[3, 0] == 2010
+    assert sheets['Numbers'].shape == (2, 2)
+
+
+def test_read_columns_matches_read_excel_projection(tmp_path):
+    path = tmp_path / 'book.xlsx'
+    _write_workbook(path)
+
+    with StreamingWorkbook(path) as workbook:
+        projected = workbook.read_columns('Data', [0, 2], skiprows=3)
+        kept = workbook.read_columns('Data', [0, 2], skiprows=2, keep=lambda values, index: values[1] != '')
+        with pytest.raises(ValueError):
+            workbook.read_columns('Numbers', [0, 3])
+
+    expected = pd.read_excel(path, sheet_name='Data', header=None, skiprows=3)[[0, 2]]
+    pd.testing.assert_frame_equal(projected, expected)
+    assert kept.values.tolist() == [['Year', 'Women'], [2010, '1,200']]
+
+
+def test_cached_sheet_frame_parses_each_workbook_version_once(tmp_path):
+    path = tmp_path / 'book.xlsx'
+    _write_workbook(path)
+    cache = tmp_path / 'cache'
+    parses = []
+
+    def parse():
+        parses.append(path.stat().st_mtime_ns)
+        with StreamingWorkbook(path) as workbook:
+            frame = workbook.read_columns('Numbers', [1])
+        frame.columns = ['b']
+        return frame
+
+    first = cached_sheet_frame(path, 'numbers', parse, cache)
+    second = cached_sheet_frame(path, 'numbers', parse, cache)
+    pd.DataFrame([[5, 6]]).to_excel(path, sheet_name='Numbers', header=False, index=False)
+    changed = cached_sheet_frame(path, 'numbers', parse, cache)
+
+    assert len(parses) == 2
+    pd.testing.assert_frame_equal(second, first)
+    assert changed['b'].tolist() == [6]
+    assert len(list(cache.iterdir())) == 1
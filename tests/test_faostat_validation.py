@@ -66,4 +66,47 @@ def test_process_faostat_data_integration(tmp_path):
     # Check outputs
     assert len(result) == 1
     assert result.iloc[0]['year'] == 2010
-    assert result.iloc[0]['area'].lower() == 'australia'
\ No newline at end of file
+    assert result.iloc[0]['area'].lower() == 'australia'
+
+def test_validate_frame_matches_per_row_model_validation(valid_fbs_data):
+    """Vectorised validation accepts exactly the rows FAOStatRecord accepts, with reasons for the rest."""
+    from src.data_processing.process_faostat_fbs import validate_frame
+
+    rows = [
+        valid_fbs_data,
+        {**valid_fbs_data, 'area': 'New Zealand'},
+        {**valid_fbs_data, 'value': -1.0},
+        {**valid_fbs_data, 'year': 1950, 'value': -2.0},
+        {**valid_fbs_data, 'item_code': 'abc'},
+        {**valid_fbs_data, 'item': None},
+        {**valid_fbs_data, 'area': 'AUSTRALIA', 'year': 2022.0},
+    ]
+    df = pd.DataFrame(rows)
+
+    valid, errors = validate_frame(df)
+
+    expected_valid = []
+    for row in rows:
+        try:
+            FAOStatRecord(**row)
+            expected_valid.append(True)
+        except pydantic.ValidationError:
+            expected_valid.append(False)
+    assert len(valid) == sum(expected_valid) == 2
+    assert list(errors.index) == [i for i, ok in enumerate(expected_valid) if not ok]
+    assert list(valid.columns) == list(FAOStatRecord.model_fields)
+    assert valid['year'].dtype == 'int64'
+    assert errors.loc[1, 'errors'] == FAOStatRecord.AREA_ERROR
+    assert FAOStatRecord.VALUE_ERROR in errors.loc[3, 'errors']
+    assert FAOStatRecord.YEAR_ERROR in errors.loc[3, 'errors']
+    assert errors.loc[4, 'errors'] == 'item_code: expected int'
+
+
+def test_validate_frame_reports_missing_columns(valid_fbs_data):
+    from src.data_processing.process_faostat_fbs import validate_frame
+
+    df = pd.DataFrame([valid_fbs_data]).drop(columns=['unit'])
+    valid, errors = validate_frame(df)
+
+    assert valid.empty
+    assert errors.loc[0, 'errors'] == 'unit: field required'
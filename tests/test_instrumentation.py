@@ -0,0 +1,99 @@
+"""
+Tests for per-stage ETL instrumentation and the run report.
+"""
+
+import json
+from datetime import datetime
+from functools import partial
+
+import pandas as pd
+import pytest
+
+from src.pipeline.instrumentation import build_run_report, format_summary, path_bytes, write_run_report
+from src.pipeline.scheduler import run_stages, STATUS_COMPLETED, STATUS_FAILED
+from src.pipeline.stages import Stage, StageGraph
+
+
+def write_rows(path, rows, context=None):
+    """In-memory stage producing ``rows`` rows."""
+    df = pd.DataFrame({"value": range(rows)})
+    df.to_csv(path, index=False)
+    return {path: df}
+
+
+def pass_through(src, dst, context=None):
+    """In-memory stage copying its input frame."""
+    df = context.get(src)
+    df.to_csv(dst, index=False)
+    return {dst: df}
+
+
+def test_stage_metrics_recorded(tmp_path):
+    """Completed stages carry wall/CPU time, row counts and byte counts (Australian English)."""
+    raw, out = tmp_path / "raw.csv", tmp_path / "out.csv"
+    graph = StageGraph([
+        Stage(name="produce", func=partial(write_rows, raw, 50), outputs=[raw], in_memory=True),
+        Stage(name="copy", func=partial(pass_through, raw, out), inputs=[raw], outputs=[out], in_memory=True),
+    ])
+    results = run_stages(graph)
+    produce, copy = results["produce"].metrics, results["copy"].metrics
+    assert results["copy"].status == STATUS_COMPLETED
+    assert produce.rows_out == 50 and produce.rows_in is None
+    assert copy.rows_in == 50 and copy.rows_out == 50
+    assert copy.bytes_read == raw.stat().st_size
+    assert copy.bytes_written == out.stat().st_size
+    assert produce.wall_seconds >= 0 and produce.cpu_seconds >= 0
+
+
+def test_run_report_and_summary(tmp_path):
+    """The run report is valid JSON with an entry per stage, and the summary lists each stage."""
+    raw = tmp_path / "raw.csv"
+    graph = StageGraph([Stage(name="produce", func=partial(write_rows, raw, 3), outputs=[raw], in_memory=True)])
+    results = run_stages(graph)
+    report = build_run_report(results, datetime.now(), 0.5, jobs=1)
+    path = write_run_report(report, tmp_path / "reports" / "run.json")
+    loaded = json.loads(path.read_text())
+    assert loaded["stages"][0]["name"] == "produce"
+    assert loaded["stages"][0]["rows_out"] == 3
+    assert "produce" in format_summary(report)
+
+
+def test_path_bytes_handles_directories_and_missing(tmp_path):
+    """Directories are summed recursively and missing paths count as zero."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "a.txt").write_text("abcd")
+    (tmp_path / "b.txt").write_text("ef")
+    assert path_bytes([tmp_path / "sub", tmp_path / "b.txt", tmp_path / "missing.txt"]) == 6
+
+
+def fail_after_work(context=None):
+    """In-memory stage that spends some CPU and then raises."""
+    sum(range(200_000))
+    raise ValueError("bad input")
+
+
+def write_nothing(context=None):
+    """In-memory stage that leaves its declared output untouched."""
+    return {}
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_failed_stage_keeps_its_metrics(tmp_path, jobs):
+    """A stage that raises still reports its timing and memory."""
+    graph = StageGraph([
+        Stage(name="bad", func=fail_after_work, in_memory=True),
+        Stage(name="other", func=write_nothing, in_memory=True),
+    ])
+    result = run_stages(graph, jobs=jobs)["bad"]
+    assert result.status == STATUS_FAILED
+    assert result.error == "bad input"
+    assert result.metrics is not None and result.metrics.wall_seconds > 0
+    assert result.metrics.rss_growth_mb is None or 0 <= result.metrics.rss_growth_mb <= result.metrics.peak_rss_mb
+
+
+def test_bytes_written_ignores_outputs_left_by_earlier_runs(tmp_path):
+    """An output file the stage did not write is not counted."""
+    stale = tmp_path / "stale.csv"
+    stale.write_text("value\n1\n")
+    graph = StageGraph([Stage(name="noop", func=write_nothing, outputs=[stale], in_memory=True)])
+    assert run_stages(graph)["noop"].metrics.bytes_written == 0
@@ -0,0 +1,248 @@
+"""
+Tests for the ETL stage graph and scheduler.
+"""
+
+import time
+from functools import partial
+
+import pandas as pd
+import pytest
+
+from src.pipeline.context import PipelineContext
+from src.pipeline.manifest import BuildManifest
+from src.pipeline.stages import Stage, StageGraph, StageGraphError
+from src.pipeline.scheduler import (
+    run_stages, STATUS_COMPLETED, STATUS_FAILED, STATUS_SKIPPED, STATUS_UP_TO_DATE
+)
+
+
+def noop():
+    """Stage that does nothing."""
+    return None
+
+
+def sleep_briefly():
+    """Stage that simulates a slow, independent source."""
+    time.sleep(1.0)
+
+
+def always_fails():
+    """Stage that raises to exercise failure handling."""
+    raise RuntimeError("boom")
+
+
+def test_dependencies_inferred_from_paths(tmp_path):
+    """A stage reading another stage's output depends on it (Australian English)."""
+    shared = tmp_path / "shared.csv"
+    graph = StageGraph([
+        Stage(name="downstream", func=noop, inputs=[shared]),
+        Stage(name="upstream", func=noop, outputs=[shared]),
+    ])
+    assert graph.dependencies["downstream"] == {"upstream"}
+    assert graph.order == ["upstream", "downstream"]
+
+
+def test_cycle_detection():
+    """Cyclic declarations are rejected."""
+    with pytest.raises(StageGraphError):
+        StageGraph([
+            Stage(name="a", func=noop, depends_on=["b"]),
+            Stage(name="b", func=noop, depends_on=["a"]),
+        ])
+
+
+def test_unknown_dependency():
+    """Depending on an undeclared stage is rejected."""
+    with pytest.raises(StageGraphError):
+        StageGraph([Stage(name="a", func=noop, depends_on=["missing"])])
+
+
+def test_subgraph_drops_unselected_dependencies():
+    """Selecting a subset keeps only dependencies inside the subset."""
+    graph = StageGraph([
+        Stage(name="a", func=noop),
+        Stage(name="b", func=noop, depends_on=["a"]),
+        Stage(name="c", func=noop, depends_on=["b"]),
+    ])
+    sub = graph.subgraph(["b", "c"])
+    assert sub.dependencies == {"b": set(), "c": {"b"}}
+
+
+def test_parallel_independent_stages_overlap():
+    """Independent stages run at the same time, so wall time tracks the longest chain."""
+    graph = StageGraph([
+        Stage(name="first", func=sleep_briefly),
+        Stage(name="second", func=sleep_briefly),
+        Stage(name="third", func=sleep_briefly),
+    ])
+    start = time.perf_counter()
+    results = run_stages(graph, jobs=3)
+    elapsed = time.perf_counter() - start
+    assert all(r.status == STATUS_COMPLETED for r in results.values())
+    assert elapsed < 2.5
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_failed_stage_skips_dependents(jobs):
+    """Downstream stages are skipped when an upstream stage raises."""
+    graph = StageGraph([
+        Stage(name="bad", func=always_fails),
+        Stage(name="child", func=noop, depends_on=["bad"]),
+        Stage(name="grandchild", func=noop, depends_on=["child"]),
+        Stage(name="independent", func=noop),
+    ])
+    results = run_stages(graph, jobs=jobs)
+    assert results["bad"].status == STATUS_FAILED
+    assert results["child"].status == STATUS_SKIPPED
+    assert results["grandchild"].status == STATUS_SKIPPED
+    assert results["independent"].status == STATUS_COMPLETED
+
+
+def copy_upper(src, dst):
+    """Stage that writes an upper-cased copy of ``src`` to ``dst``."""
+    dst.write_text(src.read_text().upper())
+
+
+@pytest.fixture
+def chained_graph(tmp_path):
+    """Two-stage chain raw -> mid -> final built from real files."""
+    raw, mid, final = tmp_path / "raw.txt", tmp_path / "mid.txt", tmp_path / "final.txt"
+    raw.write_text("abc")
+    graph = StageGraph([
+        Stage(name="clean", func=partial(copy_upper, raw, mid), inputs=[raw], outputs=[mid]),
+        Stage(name="report", func=partial(copy_upper, mid, final), inputs=[mid], outputs=[final]),
+    ])
+    return graph, raw, tmp_path / "manifest.json"
+
+
+def test_unchanged_stages_are_skipped(chained_graph):
+    """A second run with identical inputs skips every stage."""
+    graph, _, manifest_path = chained_graph
+    first = run_stages(graph, manifest=BuildManifest(manifest_path))
+    assert all(r.status == STATUS_COMPLETED for r in first.values())
+    second = run_stages(graph, manifest=BuildManifest(manifest_path))
+    assert all(r.status == STATUS_UP_TO_DATE for r in second.values())
+    forced = run_stages(graph, manifest=BuildManifest(manifest_path), force=True)
+    assert all(r.status == STATUS_COMPLETED for r in forced.values())
+
+
+def test_changed_input_rebuilds_dependents(chained_graph):
+    """Changing a raw input rebuilds the stage and, because its output changes, its dependent."""
+    graph, raw, manifest_path = chained_graph
+    run_stages(graph, manifest=BuildManifest(manifest_path))
+    raw.write_text("xyz")
+    results = run_stages(graph, manifest=BuildManifest(manifest_path))
+    assert results["clean"].status == STATUS_COMPLETED
+    assert results["report"].status == STATUS_COMPLETED
+
+
+def test_identical_upstream_output_skips_dependents(chained_graph):
+    """A rebuilt stage that writes identical output does not trigger its dependents."""
+    graph, raw, manifest_path = chained_graph
+    run_stages(graph, manifest=BuildManifest(manifest_path))
+    raw.write_text("ABC")  # upper-cases to the same intermediate content
+    results = run_stages(graph, manifest=BuildManifest(manifest_path))
+    assert results["clean"].status == STATUS_COMPLETED
+    assert results["report"].status == STATUS_UP_TO_DATE
+
+
+def test_version_or_params_change_invalidates(chained_graph):
+    """Bumping the stage version or changing its params forces a rebuild."""
+    graph, _, manifest_path = chained_graph
+    run_stages(graph, manifest=BuildManifest(manifest_path))
+    manifest = BuildManifest(manifest_path)
+    clean = graph.stages["clean"]
+    assert manifest.is_up_to_date(clean)
+    assert not manifest.is_up_to_date(clean.model_copy(update={"version": "2"}))
+    assert not manifest.is_up_to_date(clean.model_copy(update={"params": {"url": "other"}}))
+
+
+def produce_frame(path, context=None):
+    """In-memory stage that writes its output and hands the frame on."""
+    df = pd.DataFrame({"year": [2000, 2001], "value": [1.0, 2.0]})
+    df.to_csv(path, index=False)
+    return {path: df}
+
+
+def consume_frame(src, dst, context=None):
+    """In-memory stage that records whether its input arrived without a disk read."""
+    df = context.get(src)
+    source = "memory" if df is not None else "disk"
+    if df is None:
+        df = pd.read_csv(src)
+    dst.write_text(f"{source},{df['value'].sum()}")
+    return {}
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_frames_handed_over_in_memory(tmp_path, jobs):
+    """Downstream stages receive upstream frames directly within a run."""
+    mid, report = tmp_path / "mid.csv", tmp_path / "report.txt"
+    graph = StageGraph([
+        Stage(name="produce", func=partial(produce_frame, mid), outputs=[mid], in_memory=True),
+        Stage(name="consume", func=partial(consume_frame, mid, report), inputs=[mid],
+              outputs=[report], in_memory=True),
+        Stage(name="other", func=noop),
+    ])
+    results = run_stages(graph, jobs=jobs)
+    assert all(r.status == STATUS_COMPLETED for r in results.values())
+    assert report.read_text() == "memory,3.0"
+
+
+def test_skipped_upstream_falls_back_to_disk(tmp_path):
+    """When the producer is up to date, the consumer reads the materialised file."""
+    mid, report = tmp_path / "mid.csv", tmp_path / "report.txt"
+    produce = Stage(name="produce", func=partial(produce_frame, mid), outputs=[mid], in_memory=True)
+    consume = Stage(name="consume", func=partial(consume_frame, mid, report), inputs=[mid],
+                    outputs=[report], in_memory=True)
+    manifest_path = tmp_path / "manifest.json"
+    run_stages(StageGraph([produce]), manifest=BuildManifest(manifest_path))
+    results = run_stages(StageGraph([produce, consume]), manifest=BuildManifest(manifest_path))
+    assert results["produce"].status == STATUS_UP_TO_DATE
+    assert report.read_text() == "disk,3.0"
+
+
+def record_jobs(dst, context=None):
+    """In-memory stage that writes the worker budget it was given."""
+    dst.write_text(str(context.jobs))
+    return {}
+
+
+@pytest.mark.parametrize("jobs,expected", [(1, "1"), (4, "2")])
+def test_stages_share_the_jobs_budget(tmp_path, jobs, expected):
+    """Nested pools get a share of the scheduler's budget, not a CPU count each."""
+    graph = StageGraph([
+        Stage(name=name, func=partial(record_jobs, tmp_path / f"{name}.txt"), in_memory=True)
+        for name in ("first", "second")
+    ])
+    results = run_stages(graph, jobs=jobs)
+    assert all(r.status == STATUS_COMPLETED for r in results.values())
+    assert [(tmp_path / f"{name}.txt").read_text() for name in ("first", "second")] == [expected] * 2
+
+def test_context_lookup_normalises_paths(tmp_path):
+    """Frames are found regardless of how the path is spelt, and can be released."""
+    context = PipelineContext()
+    df = pd.DataFrame({"a": [1]})
+    context.put(tmp_path / "x" / ".." / "out.csv", df)
+    assert context.get(tmp_path / "out.csv") is df
+    assert len(context.subset([tmp_path / "other.csv"])) == 0
+    context.retain([])
+    assert tmp_path / "out.csv" not in context
+
+
+
+def test_etl_stage_error_fails_stage_and_skips_dependents(monkeypatch):
+    """An ETL stage whose body raises is reported failed, not completed, and its dependents are skipped."""
+    from src import run_etl
+
+    def scrape_fails(url):
+        raise ConnectionError("site unreachable")
+
+    monkeypatch.setattr(run_etl, "scrape_la_content", scrape_fails)
+    graph = run_etl.build_stage_graph().subgraph(["fire", "semantic_validation"])
+
+    results = run_stages(graph, jobs=1)
+
+    assert results["fire"].status == STATUS_FAILED
+    assert "site unreachable" in results["fire"].error
+    assert results["semantic_validation"].status == STATUS_SKIPPED
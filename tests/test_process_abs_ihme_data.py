@@ -0,0 +1,208 @@
+"""Tests for the ABS Causes of Death and IHME GBD processing module."""
+
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from src.data_processing import process_abs_ihme_data
+from src.data_processing.process_abs_ihme_data import HealthMetricRecord, validate_health_metrics
+
+
+def test_classify_causes_finds_every_condition_a_label_mentions():
+    causes = pd.Series(["Alzheimer disease", "Cancer", "Vascular dementia and stroke",
+                        "Alzheimer disease", None, "CORONARY HEART DISEASE"])
+
+    mapping = process_abs_ihme_data.classify_causes(causes)
+
+    pairs = set(zip(mapping["cause_of_death"], mapping["condition"].astype(str)))
+    assert pairs == {("Alzheimer disease", "dementia"), ("Vascular dementia and stroke", "dementia"),
+                     ("Vascular dementia and stroke", "stroke"), ("CORONARY HEART DISEASE", "ihd")}
+
+
+def test_process_abs_cod_averages_rates_per_year_and_condition(tmp_path):
+    source = tmp_path / "abs.xlsx"
+    pd.DataFrame({
+        "Year": [2019, 2019, 2019, 2020, 2020],
+        "Cause of death": ["Dementia", "Alzheimer disease", "Stroke", "Ischaemic heart disease", "Cancer"],
+        "Age-standardised rate": [40.0, 20.0, 25.0, 50.0, 99.0],
+    }).to_excel(source, sheet_name="Mortality Rates", index=False)
+
+    out = process_abs_ihme_data.process_abs_cod(source, tmp_path / "abs_cod_metrics.csv",
+                                                cache_dir=tmp_path / "cache")
+
+    assert list(out.columns) == list(HealthMetricRecord.model_fields)
+    assert list(zip(out["Year"], out["Metric"], out["Value"])) == [
+        (2019, "DEMENTIA_Mortality_Rate_ABS", 30.0),
+        (2019, "STROKE_Mortality_Rate_ABS", 25.0),
+        (2020, "IHD_Mortality_Rate_ABS", 50.0),
+    ]
+    assert set(out["Source"]) == {"ABS_COD"}
+
+
+def test_process_abs_cod_reuses_cached_rates_for_unchanged_workbook(tmp_path, monkeypatch):
+    source = tmp_path / "abs.xlsx"
+    pd.DataFrame({
+        "Notes": ["a", "b", "c"],
+        "Year": [2019, 2019, 2020],
+        "Cause of death": ["Dementia", "Cancer", "Stroke"],
+        "Age-standardised rate": [40.0, 99.0, 25.0],
+    }).to_excel(source, sheet_name="Mortality Rates", index=False)
+    reads = []
+    read_abs_rates = process_abs_ihme_data.read_abs_rates
+    monkeypatch.setattr(process_abs_ihme_data, "read_abs_rates", lambda path: reads.append(path) or read_abs_rates(path))
+
+    first = process_abs_ihme_data.process_abs_cod(source, tmp_path / "out.csv", cache_dir=tmp_path / "cache")
+    second = process_abs_ihme_data.process_abs_cod(source, tmp_path / "out.csv", cache_dir=tmp_path / "cache")
+
+    assert reads == [source]
+    pd.testing.assert_frame_equal(second, first)
+    assert read_abs_rates(source)["cause_of_death"].tolist() == ["Dementia", "Stroke"]
+
+
+def test_validate_health_metrics_matches_model_validation():
+    frame = pd.DataFrame({
+        "Year": [2019, 1975, 2030, 2019.5, 2020, 2021],
+        "Metric": ["A", "A", "A", "A", None, "A"],
+        "Value": [1.0, 1.0, 1.0, 1.0, 1.0, -2.0],
+        "Source": "ABS_COD",
+    })
+    frame.loc[len(frame)] = [2022, "A", np.nan, "ABS_COD"]
+
+    valid = validate_health_metrics(frame)
+
+    expected = []
+    for row in frame.to_dict("records"):
+        try:
+            expected.append(HealthMetricRecord(**{k: v for k, v in row.items() if v is not None}).model_dump())
+        except ValueError:
+            continue
+    assert valid.to_dict("records") == expected
+
+
+def _gbd_table(rows):
+    return pd.DataFrame(rows, columns=["measure", "location", "sex", "age", "cause", "metric", "year", "val",
+                                       "upper", "lower"])
+
+
+def _gbd_zip(path):
+    dementia = _gbd_table([
+        ["Prevalence", "Australia", "Both", "All ages", "Dementia", "Rate", 2019, 10.0, 11.0, 9.0],
+        ["Prevalence", "Australia", "Both", "All ages", "Dementia", "Rate", 2019, 20.0, 21.0, 19.0],
+        ["Prevalence", "Australia", "Both", "All ages", "Dementia", "Number", 2019, 5000.0, 5100.0, 4900.0],
+        ["Deaths", "New Zealand", "Both", "All ages", "Dementia", "Rate", 2019, 99.0, 100.0, 98.0],
+        ["Deaths", "Australia", "Both", "All ages", "Dementia", "Rate", 2018, 4.0, 5.0, 3.0],
+        ["DALYs (Disability-Adjusted Life Years)", "Australia", "Both", "All ages", "Dementia", "Rate", 2019,
+         7.0, 8.0, 6.0],
+    ])
+    stroke = _gbd_table([["Incidence", "Australia", "Both", "All ages", "Stroke", "Rate", 2019, 3.0, 4.0, 2.0]])
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("IHME-GBD/dementia_australia.csv", dementia.to_csv(index=False))
+        zf.writestr("IHME-GBD/stroke_australia.csv", stroke.to_csv(index=False))
+    return path
+
+
+def test_process_ihme_csv_streams_zip_member_with_filters(tmp_path):
+    source = _gbd_zip(tmp_path / "gbd.zip")
+
+    out = process_abs_ihme_data.process_ihme_csv(source, "Dementia", member="IHME-GBD/dementia_australia.csv",
+                                                 chunksize=2)
+
+    assert list(zip(out["Year"], out["Metric"], out["Value"], out["Measure"])) == [
+        (2018, "Dementia_Death_Rate_GBD", 4.0, "Deaths"),
+        (2019, "Dementia_Prevalence_Rate_GBD", 15.0, "Prevalence"),
+    ]
+
+
+def test_process_ihme_csv_chunked_totals_match_long_table_summary(tmp_path):
+    source = _gbd_zip(tmp_path / "gbd.zip")
+    member = "IHME-GBD/dementia_australia.csv"
+
+    streamed = process_abs_ihme_data.process_ihme_csv(source, "Dementia", member=member, chunksize=1)
+
+    long_df = process_abs_ihme_data.extract_gbd_long(source, {"Dementia": [member]})
+    pd.testing.assert_frame_equal(streamed, process_abs_ihme_data.summarise_gbd(long_df, "Dementia"))
+
+def test_process_ihme_csv_without_metric_filter_averages_every_metric(tmp_path):
+    source = _gbd_zip(tmp_path / "gbd.zip")
+
+    out = process_abs_ihme_data.process_ihme_csv(source, "Dementia", member="IHME-GBD/dementia_australia.csv",
+                                                 metric=None)
+
+    assert out.loc[out["Metric"] == "Dementia_Prevalence_Rate_GBD", "Value"].item() == (10.0 + 20.0 + 5000.0) / 3
+
+
+def test_process_ihme_gbd_reads_members_without_extracting(tmp_path):
+    source = _gbd_zip(tmp_path / "gbd.zip")
+    out = tmp_path / "out"
+
+    outputs = process_abs_ihme_data.process_ihme_gbd(source, out / "dementia.csv", out / "cvd.csv",
+                                                     out / "gbd_long.csv")
+
+    assert set(outputs) == {out / "dementia.csv", out / "cvd.csv", out / "gbd_long.csv"}
+    assert outputs[tmp_path / "out" / "cvd.csv"]["Metric"].tolist() == ["CVD_Incidence_Rate_GBD"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["gbd.zip", "out"]
+
+
+def test_gbd_long_table_keeps_every_metric_and_summary_averages_rates(tmp_path):
+    source = _gbd_zip(tmp_path / "gbd.zip")
+    out = tmp_path / "out"
+
+    outputs = process_abs_ihme_data.process_ihme_gbd(source, out / "dementia.csv", out / "cvd.csv",
+                                                     out / "gbd_long.csv")
+
+    long_df = outputs[out / "gbd_long.csv"]
+    prevalence = long_df[(long_df["condition"] == "Dementia") & (long_df["measure"] == "Prevalence")]
+    assert sorted(zip(prevalence["metric"], prevalence["val"])) == [("Number", 5000.0), ("Rate", 10.0),
+                                                                    ("Rate", 20.0)]
+    dementia = outputs[out / "dementia.csv"]
+    assert dementia.loc[dementia["Metric"] == "Dementia_Prevalence_Rate_GBD", "Value"].item() == 15.0
+    pd.testing.assert_frame_equal(dementia, process_abs_ihme_data.process_ihme_csv(
+        source, "Dementia", member="IHME-GBD/dementia_australia.csv"))
+
+
+def test_extract_gbd_long_reads_every_member_once_for_all_locations(tmp_path, monkeypatch):
+    source = _gbd_zip(tmp_path / "gbd.zip")
+    with zipfile.ZipFile(source, "a") as zf:
+        zf.writestr("IHME-GBD/ihd_australia.csv", _gbd_table([
+            ["Deaths", "Australia", "Male", "70+ years", "IHD", "Rate", 2019, 8.0, 9.0, 7.0],
+        ]).to_csv(index=False))
+    streamed = []
+    iter_ihme_chunks = process_abs_ihme_data.iter_ihme_chunks
+    monkeypatch.setattr(process_abs_ihme_data, "iter_ihme_chunks",
+                        lambda src, member, *args: streamed.append(member) or iter_ihme_chunks(src, member, *args))
+
+    members = process_abs_ihme_data.classify_ihme_members(source)
+    long_df = process_abs_ihme_data.extract_gbd_long(source, members, locations=["Australia", "New Zealand"])
+
+    assert members == {"Dementia": ["IHME-GBD/dementia_australia.csv"],
+                       "CVD": ["IHME-GBD/stroke_australia.csv", "IHME-GBD/ihd_australia.csv"]}
+    assert sorted(streamed) == sorted(members["Dementia"] + members["CVD"])
+    assert list(long_df.columns) == process_abs_ihme_data.GBD_LONG_COLUMNS
+    assert set(long_df["location"]) == {"Australia", "New Zealand"}
+    assert long_df.groupby("condition").size().to_dict() == {"CVD": 2, "Dementia": 5}
+
+    assert long_df.groupby("source_file").size().to_dict() == {"IHME-GBD/dementia_australia.csv": 5,
+                                                              "IHME-GBD/ihd_australia.csv": 1,
+                                                              "IHME-GBD/stroke_australia.csv": 1}
+
+    cvd = process_abs_ihme_data.summarise_gbd(long_df, "CVD")
+    assert list(zip(cvd["Metric"], cvd["Value"])) == [("CVD_Death_Rate_GBD", 8.0)]
+
+
+def test_process_ihme_gbd_summarises_one_export_per_condition(tmp_path):
+    source = _gbd_zip(tmp_path / "gbd.zip")
+    with zipfile.ZipFile(source, "a") as zf:
+        zf.writestr("IHME-GBD/ihd_australia.csv", _gbd_table([
+            ["Incidence", "Australia", "Both", "All ages", "IHD", "Rate", 2019, 30.0, 31.0, 29.0],
+            ["Deaths", "Australia", "Both", "All ages", "IHD", "Rate", 2019, 8.0, 9.0, 7.0],
+        ]).to_csv(index=False))
+    out = tmp_path / "out"
+
+    outputs = process_abs_ihme_data.process_ihme_gbd(source, out / "dementia.csv", out / "cvd.csv",
+                                                     out / "gbd_long.csv")
+
+    cvd = outputs[out / "cvd.csv"]
+    assert list(zip(cvd["Metric"], cvd["Value"])) == [("CVD_Incidence_Rate_GBD", 30.0), ("CVD_Death_Rate_GBD", 8.0)]
+    long_df = outputs[out / "gbd_long.csv"]
+    assert set(long_df.loc[long_df["condition"] == "CVD", "val"]) == {3.0, 30.0, 8.0}
@@ -3,6 +3,7 @@
 import pytest
 import pandas as pd
 import os
+from pathlib import Path
 from datetime import datetime
 from src.data_processing.process_aihw_data import (
     find_header_row,
@@ -644,4 +645,219 @@ def test_process_sheet_empty_sheet():
     from src.data_processing.process_aihw_data import process_sheet
     df = pd.DataFrame()
     records = process_sheet(df, "S2.4", "dummy.xlsx")
-    assert records == []
\ No newline at end of file
+    assert records == []
+
+
+def test_extract_aihw_excel_stops_reading_after_special_table(tmp_path, monkeypatch):
+    """S2.4 is only read up to the end of its year rows."""
+    from src.data_processing import process_aihw_data
+    from src.data_processing.excel_streaming import StreamingWorkbook
+
+    path = tmp_path / "AIHW-DEM-02-S2-Prevalence.xlsx"
+    rows = [['Table S2.4: Australians living with dementia', None, None, None],
+            ['Year', 'Men', 'Women', 'Persons'],
+            [2010, 100, 150, 250],
+            [2011, 110, 160, 270],
+            [None, None, None, None]]
+    rows += [[f'Footnote {i}', None, None, None] for i in range(50)]
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame(rows).to_excel(writer, sheet_name='S2.4', header=False, index=False)
+
+    rows_read = []
+    original_iter_rows = StreamingWorkbook.iter_rows
+
+    def counting_iter_rows(self, sheet_name):
+        for values in original_iter_rows(self, sheet_name):
+            rows_read.append(values)
+            yield values
+
+    monkeypatch.setattr(StreamingWorkbook, 'iter_rows', counting_iter_rows)
+    records, df = process_aihw_data.extract_aihw_excel(str(path), debug=True)
+
+    assert len(rows_read) == 5
+    assert len(records) == 6
+    assert set(df['year']) == {2010, 2011}
+
+
+def _dementia_workbook(path):
+    """Workbook whose name matches both dementia special cases, with one sheet for each."""
+    prevalence = [['Table S2.4: Australians living with dementia', None, None, None],
+                  ['Year', 'Men', 'Women', 'Persons'],
+                  [2010, 100, 150, 250],
+                  [2011, 110, 160, 270]]
+    mortality = [['Table S3.5: Deaths due to dementia', None, None, None, None, None, None],
+                 ['Year', None, None, None, 'Alzheimer disease', 'Vascular dementia', 'Unspecified'],
+                 [2010, None, None, None, 20.5, 5.1, 10.2],
+                 [2011, None, None, None, 21.0, 5.3, 10.8]]
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame(prevalence).to_excel(writer, sheet_name='S2.4', header=False, index=False)
+        pd.DataFrame(mortality).to_excel(writer, sheet_name='S3.5', header=False, index=False)
+    return path
+
+
+def test_extract_aihw_excel_parallel_matches_sequential(tmp_path):
+    """Sheets processed in a pool are merged in sheet order, as when run one by one."""
+    from src.data_processing.process_aihw_data import extract_aihw_excel
+
+    path = _dementia_workbook(tmp_path / "AIHW-DEM-02-S2-Prevalence_AIHW-DEM-02-S3-Mortality.xlsx")
+    sequential_records, sequential_df = extract_aihw_excel(str(path), jobs=1, debug=True)
+    parallel_records, parallel_df = extract_aihw_excel(str(path), jobs=2, debug=True)
+
+    assert len(sequential_records) == 12
+    assert [r.source_sheet for r in parallel_records[:6]] == ['S2.4'] * 6
+    assert [r.model_dump() for r in parallel_records] == [r.model_dump() for r in sequential_records]
+    pd.testing.assert_frame_equal(parallel_df, sequential_df)
+
+
+def test_extract_aihw_workbooks_keeps_input_order(tmp_path):
+    from src.data_processing.process_aihw_data import extract_aihw_workbooks
+
+    path = _dementia_workbook(tmp_path / "AIHW-DEM-02-S2-Prevalence_AIHW-DEM-02-S3-Mortality.xlsx")
+    workbooks = [(path, tmp_path / "first.csv"),
+                 (tmp_path / "missing.xlsx", tmp_path / "missing.csv"),
+                 (path, tmp_path / "second.csv")]
+
+    frames = extract_aihw_workbooks(workbooks, jobs=3)
+
+    assert list(frames) == [tmp_path / "first.csv", tmp_path / "second.csv"]
+    assert len(pd.read_csv(tmp_path / "second.csv")) == 12
+    pd.testing.assert_frame_equal(frames[tmp_path / "first.csv"], frames[tmp_path / "second.csv"])
+
+
+def test_validate_record_frame_matches_model_validation():
+    """The vectorised rules keep and standardise exactly what AIHWRecord would."""
+    from src.data_processing.process_aihw_data import RECORD_COLUMNS, validate_record_frame
+    from src.models.aihw_models import AIHWRecord
+
+    frame = pd.DataFrame({
+        'year': [2020, 2030, 2021, 2022, 2023],
+        'value': [1.5, 2.0, -1.0, 3.0, 4.0],
+        'metric_type': [MetricType.NUMBER, MetricType.RATE, MetricType.NUMBER, 'bogus', MetricType.PERCENTAGE],
+        'source_sheet': ['S1'] * 5,
+        'sex': ['Men', 'women', 'P', None, ' All '],
+        'age_group': ['65–69 years', 'Total', None, '85+', '70 - 74 yrs'],
+    }).reindex(columns=RECORD_COLUMNS)
+
+    expected = []
+    for row in frame.astype(object).where(frame.notna(), None).to_dict('records'):
+        try:
+            expected.append(AIHWRecord(**row).model_dump())
+        except ValueError:
+            continue
+
+    result = validate_record_frame(frame)
+    rows = result.astype(object).where(result.notna(), None).to_dict('records')
+
+    assert rows == expected
+    assert [row['sex'] for row in rows] == ['male', 'persons']
+
+
+def test_layout_cache_skips_detection_for_unchanged_sheets(tmp_path, monkeypatch):
+    """A second run over the same workbook reuses every cached layout."""
+    from src.data_processing import process_aihw_data
+
+    path = _dementia_workbook(tmp_path / "AIHW-DEM-02-S2-Prevalence_AIHW-DEM-02-S3-Mortality.xlsx")
+    cache_dir = tmp_path / "layouts"
+    detected = []
+    detect_layout = process_aihw_data.detect_layout
+    monkeypatch.setattr(process_aihw_data, 'detect_layout',
+                        lambda df, sheet, file_name: detected.append(sheet) or detect_layout(df, sheet, file_name))
+
+    _, first_df = process_aihw_data.extract_aihw_excel(str(path), jobs=1, layout_cache_dir=cache_dir)
+    assert detected == ['S2.4', 'S3.5']
+    _, second_df = process_aihw_data.extract_aihw_excel(str(path), jobs=1, layout_cache_dir=cache_dir)
+
+    assert detected == ['S2.4', 'S3.5']
+    assert len(list(cache_dir.glob("*.json"))) == 2
+    pd.testing.assert_frame_equal(second_df, first_df)
+
+
+def test_sheet_fingerprint_tracks_header_region_only():
+    from src.data_processing.process_aihw_data import LAYOUT_HEADER_ROWS, sheet_fingerprint
+
+    rows = [['Table 1: Deaths in Australia', None, None], ['Year', 'Number', 'Rate']]
+    rows += [[2000 + i, i, i / 10] for i in range(LAYOUT_HEADER_ROWS + 5)]
+    df = pd.DataFrame(rows)
+    fingerprint = sheet_fingerprint(df, 'S1', 'book.xlsx')
+
+    refreshed = df.copy()
+    refreshed.iloc[-1, 1] = 999
+    renamed = df.copy()
+    renamed.iloc[1, 2] = 'Crude rate'
+
+    assert sheet_fingerprint(refreshed, 'S1', 'book.xlsx') == fingerprint
+    assert sheet_fingerprint(renamed, 'S1', 'book.xlsx') != fingerprint
+    assert sheet_fingerprint(df, 'S2', 'book.xlsx') != fingerprint
+
+
+def test_detect_layout_finds_special_table_bounds():
+    from src.data_processing.process_aihw_data import detect_layout
+
+    df = pd.DataFrame([['Table S2.4: Australians living with dementia', None],
+                       ['Year', 'Men'], [2010, 100], [2011, 110], [None, None], ['Notes', None]])
+    layout = detect_layout(df, 'S2.4', 'AIHW-DEM-02-S2-Prevalence.xlsx')
+    assert (layout.kind, layout.data_start, layout.data_end) == ('s2.4', 2, 4)
+
+    standard = detect_layout(df, 'S2.4', 'other.xlsx')
+    assert standard.kind is None
+    assert standard.data_start == 2
+    assert len(standard.columns) == 2
+
+
+def test_find_tables_in_sheet_merges_nearby_tables_up_to_notes():
+    from src.data_processing.process_aihw_data import find_tables_in_sheet
+
+    df = pd.DataFrame([['Table 1: Deaths 2010–2015', None],
+                       ['a', 1], ['b', 2],
+                       [None, None],
+                       ['Table 2: Prevalence', None],
+                       ['c', 3], ['d', 4],
+                       ['Source: AIHW', None]])
+    tables = find_tables_in_sheet(df)
+    assert tables == [
+        {'start_row': 0, 'title': 'Table 1: Deaths 2010–2015', 'end_row': 7, 'is_time_series': True},
+    ]
+
+
+def test_process_all_aihw_files_uses_table_specs(tmp_path, monkeypatch):
+    """The batch entry point extracts the same spec tables as process_sheet, reading each workbook once."""
+    from src.data_processing import process_aihw_data
+
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    _dementia_workbook(raw_dir / "AIHW-DEM-02-S2-Prevalence.xlsx")
+    _dementia_workbook(raw_dir / "AIHW-DEM-02-S3-Mortality-202409.xlsx")
+    opened = []
+    streaming_workbook = process_aihw_data.StreamingWorkbook
+    monkeypatch.setattr(process_aihw_data, 'StreamingWorkbook',
+                        lambda path: opened.append(Path(path).name) or streaming_workbook(path))
+
+    results = process_aihw_data.process_all_aihw_files(str(raw_dir), str(tmp_path))
+
+    assert opened == ["AIHW-DEM-02-S2-Prevalence.xlsx", "AIHW-DEM-02-S3-Mortality-202409.xlsx"]
+    prevalence = results['aihw_dementia_prevalence_australia_processed.csv']
+    mortality = results['aihw_dementia_mortality_australia_processed.csv']
+    assert set(prevalence['source_sheet']) == {'S2.4'}
+    assert len(prevalence) == 6
+    assert set(prevalence['sex']) == {'male', 'female', 'persons'}
+    assert set(mortality['condition']) == {'Alzheimer disease', 'Vascular dementia', 'Unspecified'}
+    assert (tmp_path / 'aihw_dementia_mortality_australia_processed.csv').exists()
+
+
+def test_table_spec_entry_adds_a_table(monkeypatch):
+    """A new fixed-layout table needs only a spec entry."""
+    from src.data_processing import process_aihw_data
+    from src.data_processing.process_aihw_data import ColumnSpec, TableSpec, process_sheet
+
+    spec = TableSpec(name="test_table", label="Test table", sheet="T1", file_marker="TEST-BOOK",
+                     anchor="Table T1", data_offset=2, end_prefixes=("source",),
+                     columns=[ColumnSpec(position=1, sex="persons", metric_type=MetricType.RATE)],
+                     fields={'source_sheet': "T1", 'age_group': "all_ages", 'table_name': "Test", 'condition': "Test"})
+    monkeypatch.setattr(process_aihw_data, 'TABLE_SPECS', process_aihw_data.TABLE_SPECS + [spec])
+    df = pd.DataFrame([['Table T1: Rates', None], ['Year', 'Rate'], [2015, 1.5], [2016, 2.5], ['Source: AIHW', None],
+                       [2017, 9.9]])
+
+    records = process_sheet(df, "T1", "TEST-BOOK.xlsx")
+
+    assert [(r.year, r.value, r.metric_type) for r in records] == [(2015, 1.5, MetricType.RATE),
+                                                                    (2016, 2.5, MetricType.RATE)]
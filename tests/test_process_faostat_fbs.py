@@ -97,6 +97,23 @@ def test_missing_value_handling(tmp_path):
     assert len(result) == 2
     assert result['value'].notna().all()
 
+def test_non_numeric_year_cell_is_dropped_as_missing(tmp_path):
+    """A cell such as '<0.5' becomes a missing value instead of ending the read of its file."""
+    from src.data_processing.process_faostat_fbs import clean_faostat_data
+
+    rows = [{'Area Code': 10, 'Area': 'Australia', 'Item Code': 2511, 'Item': item,
+             'Element Code': 664, 'Element': 'Food supply (kcal/capita/day)', 'Unit': 'kcal/cap/d',
+             'Y2010': value, 'Y2011': 110.0}
+            for item, value in [('Wheat', '100'), ('Rice', '<0.5'), ('Maize', '90')]]
+    input_path = tmp_path / 'FoodBalanceSheets_E_Oceania.csv'
+    pd.DataFrame(rows).to_csv(input_path, index=False)
+
+    result = clean_faostat_data([str(input_path)], str(tmp_path / 'out.csv'))
+
+    values = dict(zip(zip(result['item'], result['year']), result['Food supply (kcal/capita/day)']))
+    assert values == {('Maize', 2010): 90.0, ('Maize', 2011): 110.0, ('Rice', 2011): 110.0,
+                      ('Wheat', 2010): 100.0, ('Wheat', 2011): 110.0}
+
 def test_duplicate_removal(tmp_path):
     """Test that duplicate rows are removed during processing."""
     df = pd.DataFrame({
@@ -119,4 +136,153 @@ def test_duplicate_removal(tmp_path):
 
     # There should be only 2 rows (one per year) after duplicate removal
     # not 4 rows (2 duplicates x 2 years)
-    assert len(result) == 2
\ No newline at end of file
+    assert len(result) == 2
+
+def test_clean_faostat_data_reads_zip_without_extracting(sample_data, tmp_path):
+    """Bulk archives are streamed member by member; lookup tables are skipped."""
+    import zipfile
+    from src.data_processing.process_faostat_fbs import clean_faostat_data
+
+    wide = sample_data.rename(columns=lambda c: c.capitalize() if c.islower() else c.replace('y', 'Y'))
+    csv_path = tmp_path / 'FoodBalanceSheets_E_Oceania.csv'
+    wide.to_csv(csv_path, index=False)
+    archive = tmp_path / 'FoodBalanceSheets_E_Oceania.zip'
+    with zipfile.ZipFile(archive, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.write(csv_path, csv_path.name)
+        zf.writestr('FoodBalanceSheets_E_AreaCodes.csv', 'Area Code,Area\n10,Australia\n')
+
+    from_zip = clean_faostat_data([str(archive)], str(tmp_path / 'from_zip.csv'))
+    from_csv = clean_faostat_data([str(csv_path)], str(tmp_path / 'from_csv.csv'))
+
+    assert len(from_zip) == 4
+    pd.testing.assert_frame_equal(from_zip, from_csv)
+    assert not (tmp_path / 'FoodBalanceSheets_E_AreaCodes.csv').exists()
+
+
+def test_clean_faostat_data_prunes_columns_and_filters_before_melting(tmp_path):
+    """Flag and code columns are never read and other areas are dropped before reshaping."""
+    from src.data_processing.process_faostat_fbs import (
+        clean_faostat_data, faostat_read_options, iter_faostat_tables)
+
+    rows = []
+    for area in ['Australia', 'New Zealand', 'Fiji']:
+        for item in ['Wheat', 'Rice']:
+            rows.append({
+                'Area Code': 10, 'Area': area, 'Item Code': 2511, 'Item': item,
+                'Element Code': 664, 'Element': 'Food supply (kcal/capita/day)', 'Unit': 'kcal/cap/d',
+                'Y2010': 100.0 if area == 'Australia' else 1.0, 'Y2010F': 'E', 'Y2010N': '',
+                'Y2011': 110.0 if area == 'Australia' else 1.0, 'Y2011F': 'E', 'Y2011N': '',
+            })
+    input_path = tmp_path / 'FoodBalanceSheets_E_Oceania.csv'
+    pd.DataFrame(rows).to_csv(input_path, index=False)
+
+    options = faostat_read_options(list(pd.read_csv(input_path, nrows=0).columns))
+    assert options['usecols'] == ['Area', 'Item', 'Element', 'Unit', 'Y2010', 'Y2011']
+    assert options['dtype']['Item'] == 'category'
+    label, chunks = next(iter_faostat_tables(input_path, chunksize=2))
+    assert all(chunk['Element'].dtype == 'category' for chunk in chunks)
+
+    result = clean_faostat_data([str(input_path)], str(tmp_path / 'out.csv'))
+    assert len(result) == 4
+    assert set(result['Food supply (kcal/capita/day)']) == {100.0, 110.0}
+    assert result['item'].dtype == object
+
+
+def _oceania_rows(areas):
+    rows = []
+    for offset, area in enumerate(areas):
+        for item in ['Wheat', 'Rice']:
+            rows.append({
+                'Area Code': offset, 'Area': area, 'Item Code': 1, 'Item': item,
+                'Element Code': 664, 'Element': 'Food supply (kcal/capita/day)', 'Unit': 'kcal/cap/d',
+                'Y2010': 100.0 + offset, 'Y2010F': 'E', 'Y2011': 200.0 + offset, 'Y2011F': 'E',
+            })
+    return pd.DataFrame(rows)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_clean_faostat_areas_single_pass_per_area_outputs(tmp_path, jobs):
+    from src.data_processing.process_faostat_fbs import area_output_path, clean_faostat_areas
+
+    input_path = tmp_path / 'FoodBalanceSheets_E_Oceania.csv'
+    _oceania_rows(['Australia', 'New Zealand', 'Papua New Guinea', 'Fiji']).to_csv(input_path, index=False)
+    base = tmp_path / 'faostat_fbs_australia_processed.csv'
+    areas = ['Australia', 'new zealand', 'Papua New Guinea', 'Tonga']
+    output_files = {area: area_output_path(base, area) for area in areas}
+
+    frames = clean_faostat_areas([str(input_path)], output_files, jobs=jobs)
+
+    assert output_files['Australia'] == base
+    assert output_files['Papua New Guinea'].name == 'faostat_fbs_papua_new_guinea_processed.csv'
+    assert set(frames) == set(areas)
+    assert set(frames['Australia']['Food supply (kcal/capita/day)']) == {100.0, 200.0}
+    assert set(frames['new zealand']['Food supply (kcal/capita/day)']) == {101.0, 201.0}
+    assert len(frames['Papua New Guinea']) == 4
+    assert frames['Tonga'].empty
+
+
+def test_area_output_path_appends_slug_when_name_has_no_area(tmp_path):
+    from src.data_processing.process_faostat_fbs import area_output_path
+
+    metadata = tmp_path / 'dietary_metrics_metadata.md'
+    assert area_output_path(metadata, 'Australia') == metadata
+    assert area_output_path(metadata, 'New Zealand').name == 'dietary_metrics_metadata_new_zealand.md'
+
+
+def test_stream_faostat_removes_duplicates_across_chunks(tmp_path):
+    """A row repeated in a later chunk (or a later file) is dropped; the first one wins."""
+    from src.data_processing.process_faostat_fbs import (
+        FAOStatStreamStats, collect_stream, stream_faostat)
+
+    rows = _oceania_rows(['Australia', 'New Zealand'])
+    modern = tmp_path / 'FoodBalanceSheets_E_Oceania.csv'
+    pd.concat([rows, rows.iloc[[0, 1]]]).to_csv(modern, index=False)
+    historic = tmp_path / 'FoodBalanceSheetsHistoric_E_Oceania.csv'
+    rows.assign(Y2010=-1.0).to_csv(historic, index=False)
+
+    stats = FAOStatStreamStats()
+    chunks = list(stream_faostat([modern, historic], ['Australia'], chunksize=1, stats=stats))
+    result = collect_stream(iter(chunks))
+
+    assert len(chunks) > 1
+    assert len(result) == 4
+    assert not result.duplicated(['year', 'item', 'element']).any()
+    assert set(result['value']) == {100.0, 200.0}
+    assert stats.duplicates_removed == 8
+    assert stats.rows_out == 4
+
+
+def test_harmonize_overlapping_years_scales_historical_by_element():
+    from src.data_processing.process_faostat_fbs import harmonize_overlapping_years
+
+    historical = pd.DataFrame({
+        'year': [2009, 2010, 2011, 2010, 2010],
+        'element': ['Protein', 'Protein', 'Protein', 'Fat', 'Stocks'],
+        'value': [40.0, 50.0, 50.0, 10.0, 5.0],
+    })
+    modern = pd.DataFrame({
+        'year': [2010, 2011, 2010, 2010],
+        'element': ['Protein', 'Protein', 'Fat', 'Stocks'],
+        'value': [100.0, 100.0, 30.0, 0.0],
+    })
+
+    harmonised, _ = harmonize_overlapping_years(historical, modern)
+
+    # Protein doubles and fat triples; a non-positive mean leaves stocks unadjusted
+    assert harmonised['value'].tolist() == [80.0, 100.0, 100.0, 30.0, 5.0]
+
+
+def test_pivot_faostat_area_matches_pivot_table():
+    from src.data_processing.process_faostat_fbs import pivot_faostat_area
+
+    long_df = pd.DataFrame({
+        'area': 'Australia',
+        'year': [2011, 2010, 2010, 2011, 2010],
+        'item': ['Wheat', 'Wheat', 'Rice', 'Wheat', 'Wheat'],
+        'element': ['Protein', 'Protein', 'Fat', 'Fat', 'Fat'],
+        'value': [1.0, 2.0, 3.0, 4.0, 5.0],
+    })
+
+    expected = long_df.pivot_table(index=['year', 'item'], columns='element',
+                                   values='value', aggfunc='first').reset_index()
+    pd.testing.assert_frame_equal(pivot_faostat_area(long_df), expected)
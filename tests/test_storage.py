@@ -0,0 +1,79 @@
+"""
+Tests for the processed dataset storage layer.
+"""
+
+import pandas as pd
+import pytest
+
+from src.pipeline import storage
+
+
+@pytest.fixture
+def sample_df():
+    """Small frame with a nullable integer, a float and a mixed object column."""
+    return pd.DataFrame({
+        "year": pd.array([2000, 2001, None], dtype="Int64"),
+        "value": [1.5, None, 3.0],
+        "note": ["a", 2, None],
+    })
+
+
+@pytest.mark.parametrize("fmt,suffix", [("parquet", ".parquet"), ("arrow", ".arrow"), ("csv", ".csv")])
+def test_round_trip_with_projection(tmp_path, sample_df, fmt, suffix):
+    """Each format round-trips and honours column projection (Australian English)."""
+    logical = tmp_path / "metrics.csv"
+    written = storage.write_dataset(sample_df, logical, fmt=fmt, csv_export=False)
+    assert written == logical.with_suffix(suffix)
+    assert storage.find_dataset(logical) == written
+    result = storage.read_dataset(logical, columns=["year", "value"])
+    assert list(result.columns) == ["year", "value"]
+    assert result["value"].iloc[0] == 1.5
+    assert storage.dataset_columns(logical) == ["year", "value", "note"]
+
+
+def test_columnar_keeps_schema(tmp_path, sample_df):
+    """Parquet keeps the nullable integer dtype that CSV would lose."""
+    logical = tmp_path / "metrics.csv"
+    storage.write_dataset(sample_df, logical, fmt="parquet", csv_export=False)
+    assert str(storage.read_dataset(logical)["year"].dtype) == "Int64"
+
+
+def test_csv_side_output(tmp_path, sample_df):
+    """The optional CSV copy is written beside the columnar file."""
+    logical = tmp_path / "metrics.csv"
+    files = storage.dataset_files(logical, fmt="parquet", csv_export=True)
+    assert files == [tmp_path / "metrics.parquet", logical]
+    storage.write_dataset(sample_df, logical, fmt="parquet", csv_export=True)
+    assert all(f.exists() for f in files)
+    assert len(pd.read_csv(logical)) == 3
+
+
+def test_non_dataset_paths_unchanged(tmp_path):
+    """Only logical .csv names are mapped onto the storage format."""
+    metadata = tmp_path / "metadata.md"
+    assert storage.dataset_path(metadata, fmt="parquet") == metadata
+    assert storage.dataset_files(metadata, fmt="parquet", csv_export=True) == [metadata]
+
+
+def test_missing_dataset(tmp_path):
+    """Reading a dataset that was never written raises FileNotFoundError."""
+    assert not storage.dataset_exists(tmp_path / "absent.csv")
+    with pytest.raises(FileNotFoundError):
+        storage.read_dataset(tmp_path / "absent.csv")
+
+
+def test_unknown_format():
+    """Unsupported formats are rejected."""
+    with pytest.raises(ValueError):
+        storage.active_format("xlsx")
+
+
+def test_analysis_loader_reads_columnar_dataset_without_csv(tmp_path, sample_df):
+    """Analysis code finds the dataset when no CSV copy is exported."""
+    from src.visualisation.utils import DatasetConfig, load_unified_dataset
+
+    logical = tmp_path / "analytical.csv"
+    storage.write_dataset(sample_df, logical, fmt="parquet", csv_export=False)
+    assert not logical.exists()
+    result = load_unified_dataset(DatasetConfig(csv_path=str(logical)))
+    assert result["value"].iloc[2] == 3.0
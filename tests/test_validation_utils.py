@@ -0,0 +1,75 @@
+"""Tests for the FAO-LA content validation utilities."""
+
+import pandas as pd
+
+from src.data_processing import validation_utils
+from src.data_processing.validation_utils import LAContentIndex, get_la_content_for_items
+
+
+def _la_content():
+    return pd.DataFrame({
+        "food_name": ["Popcorn, air-popped", "Oil, corn, industrial and retail", "Oil, canola",
+                      "Seeds, sunflower seed kernels", "Nuts, walnuts, english", "Beans (kidney), raw"],
+        "percent": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+    })
+
+
+def test_index_returns_first_row_containing_the_query():
+    index = LAContentIndex(_la_content())
+
+    assert index.first_match("corn") == 0
+    assert index.first_match("oil, c") == 1
+    assert index.first_match("ts, w") == 4
+    # Queries are patterns, as with str.contains
+    assert index.first_match("corn.*retail") == 1
+    assert index.first_match("kidney") == 5
+    assert index.first_match("") == 0
+    assert index.first_match("zzz") is None
+
+
+def test_la_content_tries_name_then_mapping_then_words():
+    la_content = _la_content()
+
+    assert validation_utils.get_la_content_for_item("Oil, corn germ", la_content) == 2.0
+    assert validation_utils.get_la_content_for_item("Oil, rapeseed", la_content) == 3.0
+    assert validation_utils.get_la_content_for_item("Sunflower seed", la_content) == 4.0
+    assert validation_utils.get_la_content_for_item("Mixed walnuts", la_content) == 5.0
+    assert validation_utils.get_la_content_for_item("Tea", la_content) == 0.0
+
+
+def test_batch_lookup_builds_one_index_and_keeps_missing_items(monkeypatch):
+    builds = []
+    monkeypatch.setattr(validation_utils, "LAContentIndex",
+                        lambda df: builds.append(df) or LAContentIndex(df))
+
+    contents = get_la_content_for_items(["Oil, rapeseed", None, "Tea", "Oil, rapeseed"], _la_content())
+
+    assert contents == [3.0, None, 0.0, 3.0]
+    assert len(builds) == 1
+
+
+def test_find_closest_match_tries_mapping_exact_normalised_then_fuzzy():
+    available = ["Oil, canola", "Apples, raw, with skin", "Beans, kidney, red, mature seeds, raw",
+                 "Lentils, dried", "Lentils, cooked"]
+    manual = validation_utils.get_manual_mapping()
+
+    assert validation_utils.find_closest_match("Apples, raw", available, manual) == ("Apples, raw, with skin", 1.0)
+    assert validation_utils.find_closest_match("Oil, canola", available, manual) == ("Oil, canola", 1.0)
+    assert validation_utils.find_closest_match("Lentils, raw", available, manual) == ("Lentils, dried", 1.0)
+    assert validation_utils.find_closest_match("Oil, canolla", available, manual) == ("Oil, canola", 0.8)
+    assert validation_utils.find_closest_match("Wine", available, manual) == (None, 0.0)
+
+
+def test_fuzzy_matcher_top_k_agrees_with_difflib():
+    from difflib import get_close_matches
+
+    available = ["Oil, sunflower", "Oil, sunflower, linoleic", "Oil, soybean", "Seeds, sunflower",
+                 "Oil, sesame", "Beef, ground, raw", "Oil, safflower"]
+    matcher = validation_utils.FuzzyMatcher(available)
+    queries = ["Oil, sunflowr", "Oil, soy bean", "Seeds sunflower", "Oil, flower", "Pork"]
+
+    results = matcher.top_k_batch(queries, k=3, cutoff=0.6)
+
+    for query in queries:
+        assert [name for name, _ in results[query]] == get_close_matches(query, available, n=3, cutoff=0.6)
+    assert matcher.top_k("Oil, sunflowr")[0][1] > 0.9